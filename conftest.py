@@ -2,22 +2,290 @@ import random
 
 import pytest
 import allure
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
 from src.data.endpoints.category_management import CategoryManagementAPI
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from src.data.endpoints.combined import DigitalOrderAPI, set_current_api
 from src.utils.navigation import Navigation
 from src.data.table_config import DEFAULT_TABLE_NUMBER
 from src.utils.console_monitor import ConsoleMonitor
-from src.utils.network_tracker import NetworkTracker
+from src.utils.network_tracker import create_network_tracker, NETWORK_CAPTURE_MODES
+from src.utils.browser_launcher import launch_browser, BROWSER_PROFILES, DEFAULT_PROFILE
+from src.utils.browser_pool import BrowserPool
+from src.utils import lean_load
+from src.utils.performance_metrics import startup_metrics
+from src.utils.teardown_pipeline import TeardownPipeline
+from src.utils.sleep_tracker import sleep_tracker
+from src.utils.action_batch import action_batch_tracker
+from src.utils.command_profiler import command_profiler
+from src.utils.polling import format_wait_report, export_wait_stats
+from src.utils.screenshot_service import screenshot_service, SCREENSHOT_POLICIES, SCREENSHOT_FORMATS
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import inspect
-import shutil
+import json
 import os
+import time
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-pool",
+        action="store",
+        default=os.environ.get("BROWSER_POOL", "on"),
+        choices=["on", "off"],
+        help="Reuse warm browser sessions between tests on a worker (env: BROWSER_POOL)"
+    )
+    parser.addoption(
+        "--browser-max-reuse",
+        action="store",
+        type=int,
+        default=int(os.environ.get("BROWSER_MAX_REUSE", "20")),
+        help="Number of tests a pooled browser serves before it is replaced (env: BROWSER_MAX_REUSE)"
+    )
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default=DEFAULT_PROFILE,
+        choices=list(BROWSER_PROFILES),
+        help="Browser execution profile: headed, headless-new or minimal (env: BROWSER_PROFILE)"
+    )
+    parser.addoption(
+        "--network-capture",
+        action="store",
+        default=os.environ.get("NETWORK_CAPTURE", "log"),
+        choices=list(NETWORK_CAPTURE_MODES),
+        help="API timing capture: parse the performance log at teardown (log) "
+             "or listen to CDP Network events live (stream) (env: NETWORK_CAPTURE)"
+    )
+    parser.addoption(
+        "--lean-load",
+        action="store",
+        default=os.environ.get("LEAN_LOAD", "off"),
+        choices=["on", "off"],
+        help="Eager page loads with images/fonts/analytics blocked for functional tests; "
+             "tests marked 'performance' always do full loads (env: LEAN_LOAD, LEAN_LOAD_BLOCK)"
+    )
+    parser.addoption(
+        "--lean-load-baseline",
+        action="store",
+        default=os.environ.get("LEAN_LOAD_BASELINE", "off"),
+        choices=["on", "off"],
+        help="Record full-load navigations into reports/navigation_baseline.json for lean-load "
+             "savings (env: LEAN_LOAD_BASELINE)"
+    )
+    parser.addoption(
+        "--command-profile",
+        action="store",
+        default=os.environ.get("COMMAND_PROFILE", "off"),
+        choices=["on", "off"],
+        help="Record every WebDriver command per test and page method; adds a stack walk per "
+             "command, so it is off by default (env: COMMAND_PROFILE)"
+    )
+    parser.addoption(
+        "--screenshot-policy",
+        action="store",
+        default=os.environ.get("SCREENSHOT_POLICY", "always"),
+        choices=list(SCREENSHOT_POLICIES),
+        help="Capture every step screenshot, only attach them when the test fails, "
+             "or capture every Nth step (env: SCREENSHOT_POLICY, SCREENSHOT_EVERY_N)"
+    )
+    parser.addoption(
+        "--screenshot-format",
+        action="store",
+        default=os.environ.get("SCREENSHOT_FORMAT", "png"),
+        choices=list(SCREENSHOT_FORMATS),
+        help="Attachment encoding, scaled by SCREENSHOT_SCALE (default 1.0) "
+             "(env: SCREENSHOT_FORMAT, SCREENSHOT_SCALE, SCREENSHOT_QUALITY)"
+    )
+    parser.addoption(
+        "--screenshot-budget-kb",
+        action="store",
+        type=float,
+        default=float(os.environ.get("SCREENSHOT_BUDGET_KB", "0")),
+        help="Maximum screenshot bytes attached per test, 0 = no limit (env: SCREENSHOT_BUDGET_KB)"
+    )
+
+
+def pytest_configure(config):
+    config.teardown_pipeline = TeardownPipeline()
+    # nodeid -> item.location, so late teardown failures can be reported against their test
+    config.teardown_locations = {}
+    command_profiler.enabled = config.getoption("--command-profile") == "on"
+    lean_load.navigation_baseline.enabled = config.getoption("--lean-load-baseline") == "on"
+    screenshot_service.configure(
+        policy=config.getoption("--screenshot-policy"),
+        image_format=config.getoption("--screenshot-format"),
+        budget_kb=config.getoption("--screenshot-budget-kb")
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    # Lets the profiler separate the test body from fixture setup/teardown
+    command_profiler.phase = "call"
+    yield
+    command_profiler.phase = "teardown"
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    # Fixtures read item.rep_call to know whether the test body failed
+    setattr(item, f"rep_{report.when}", report)
+
+    # Background cleanup that already failed is reported on the test that scheduled it
+    if report.when == "teardown":
+        item.config.teardown_locations[item.nodeid] = item.location
+        failures = item.config.teardown_pipeline.pop_failures(item.nodeid)
+        if failures:
+            report.outcome = "failed"
+            report.longrepr = "Background teardown failed:\n" + TeardownPipeline.format_failures(failures)
+        # Jobs of earlier tests that failed while this one ran
+        late = item.config.teardown_pipeline.pop_failures_except(item.nodeid)
+        if late:
+            _report_late_teardown_failures(item.config, late)
+
+
+def _report_late_teardown_failures(config, failures):
+    """
+    Log a teardown error against each test whose background job failed after its own report.
+    Terminal, junitxml and xdist all attribute the extra report to that test's nodeid.
+    """
+    by_test = {}
+    for failure in failures:
+        by_test.setdefault(failure['nodeid'], []).append(failure)
+
+    for nodeid, test_failures in by_test.items():
+        location = config.teardown_locations.get(nodeid, (nodeid.split("::")[0], None, nodeid))
+        report = pytest.TestReport(
+            nodeid=nodeid,
+            location=location,
+            keywords={},
+            outcome="failed",
+            longrepr="Background teardown failed after the test was reported:\n"
+                     + TeardownPipeline.format_failures(test_failures),
+            when="teardown",
+        )
+        config.hook.pytest_runtest_logreport(report=report)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    recorded = lean_load.navigation_baseline.flush()
+    if recorded:
+        print(f"\n✓ {recorded} full-load navigations merged into {lean_load.navigation_baseline.path}")
+
+    profile_path = command_profiler.export()
+    if profile_path:
+        print(f"\n✓ WebDriver command profile exported to {profile_path}")
+
+    wait_report = format_wait_report()
+    if wait_report:
+        print(f"\nWAIT DURATIONS PER CALL SITE\n{wait_report}")
+        print(f"✓ Wait statistics exported to {export_wait_stats()}")
+
+    pipeline = getattr(session.config, "teardown_pipeline", None)
+    if pipeline is None:
+        return
+
+    # Failures that completed after their test was reported
+    late_failures = pipeline.shutdown()
+    session.config.late_teardown_failures = late_failures
+    if not late_failures:
+        return
+
+    print(f"\n{'=' * 60}")
+    print(f"BACKGROUND TEARDOWN FAILURES ({pipeline.worker})")
+    print(f"{'=' * 60}")
+    print(TeardownPipeline.format_failures(late_failures))
+    print(f"{'=' * 60}\n")
+    _report_late_teardown_failures(session.config, late_failures)
+
+    os.makedirs("reports", exist_ok=True)
+    with open(f"reports/teardown_failures_{pipeline.worker}.json", 'w') as f:
+        json.dump(late_failures, f, indent=2)
+
+    session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    late_failures = getattr(config, "late_teardown_failures", None)
+    if late_failures:
+        terminalreporter.section("background teardown failures")
+        terminalreporter.write_line(TeardownPipeline.format_failures(late_failures))
+
+
+@pytest.fixture(scope="session")
+def teardown_pipeline(request):
+    return request.config.teardown_pipeline
+
+
+@pytest.fixture(autouse=True)
+def sleep_report():
+    """Report how much fixed sleep time the DOM-stability waits removed in this test"""
+    sleep_tracker.reset()
+    yield
+    report = sleep_tracker.get_report()
+    if report:
+        print(f"\n⏱️ Sleep time removed: {sleep_tracker.total_saved():.2f}s\n{report}")
+        allure.attach(report, name="⏱️ Sleep Time Removed", attachment_type=allure.attachment_type.TEXT)
+
+
+@pytest.fixture(autouse=True)
+def action_batch_report():
+    """Report the round trips batched interactions used and avoided in this test"""
+    action_batch_tracker.reset()
+    yield
+    report = action_batch_tracker.get_report()
+    if report:
+        print(f"\n🎯 Action batches\n{report}")
+        allure.attach(report, name="🎯 Action Batches", attachment_type=allure.attachment_type.TEXT)
+
+
+def _test_failed(node) -> bool:
+    """Whether setup or the test body of node failed (set by pytest_runtest_makereport)"""
+    return any(
+        getattr(node, f"rep_{when}", None) is not None and getattr(node, f"rep_{when}").failed
+        for when in ("setup", "call")
+    )
+
+
+@pytest.fixture(autouse=True)
+def screenshots(request):
+    """Attach this test's buffered on-failure screenshots and the screenshot summary"""
+    screenshot_service.start_test()
+    yield
+    stats = screenshot_service.flush(failed=_test_failed(request.node))
+    if stats and stats['captured']:
+        summary = screenshot_service.format_stats(stats)
+        print(f"\n📸 Screenshots: {stats['attached']}/{stats['captured']} attached "
+              f"({stats['attached_bytes'] / 1024:.0f}KB)")
+        allure.attach(summary, name="📸 Screenshot Summary", attachment_type=allure.attachment_type.TEXT)
+
+
+@pytest.fixture(autouse=True)
+def command_profile(request):
+    """Attach the chattiest page methods of this test and keep its round-trip totals"""
+    if not command_profiler.enabled:
+        yield
+        return
+
+    command_profiler.start_test(request.node.nodeid)
+    yield
+    chattiest = command_profiler.format_chattiest()
+    totals = command_profiler.finish_test()
+    if chattiest:
+        print(f"\n🗣️ WebDriver commands: {totals['commands']} ({totals['duration_ms']:.0f}ms)")
+        allure.attach(chattiest, name="🗣️ Chattiest Methods", attachment_type=allure.attachment_type.TEXT)
+
+
+def _close_table(api):
+    # A falsy result usually means the UI already paid and closed the check - log and move on.
+    # Exceptions propagate so the pipeline reports them against the test that scheduled the job.
+    if api.close_table():
+        print(f"✓ Table {api.table_num} closed successfully")
+    else:
+        print(f"⚠️ close_table() did not confirm closing table {api.table_num} - continuing")
 
 
 @pytest.fixture(scope="function")
@@ -36,11 +304,14 @@ def table(request):
 
 
 @pytest.fixture(scope="function")
-def endpoint_setup(table):
+def endpoint_setup(table, teardown_pipeline, request):
     print(f"\n{'=' * 60}")
     print(f"TEST SETUP: Initializing table {table}")
     print(f"{'=' * 60}")
 
+    # The previous test on this table may still be closing it in the background
+    teardown_pipeline.wait_for(f"table:{table}")
+
     api = DigitalOrderAPI(table_number=table)
     api_data = api.setup_table()
 
@@ -57,97 +328,170 @@ def endpoint_setup(table):
     yield api
 
     print(f"\n{'=' * 60}")
-    print(f"TEST TEARDOWN: Closing table {table}")
-    print(f"{'=' * 60}")
-
-    try:
-        api.close_table()
-        print(f"✓ Table {table} closed successfully")
-    except Exception as e:
-        pass
-
+    print(f"TEST TEARDOWN: Closing table {table} in background")
     print(f"{'=' * 60}\n")
 
+    teardown_pipeline.submit(
+        request.node.nodeid, f"close_table({table})", _close_table, api, key=f"table:{table}"
+    )
 
-@pytest.fixture(scope="function")
-def browser_factory(endpoint_setup):
-    drivers = []
-    temp_dirs = []
-    trackers = []
-    api_setup = endpoint_setup
-
-    def _create_browsers(*browser_types):
-        for browser_type in browser_types:
-            if browser_type.lower() == "chrome":
-                options = ChromeOptions()
-                # options.add_argument("--headless")
-                # options.add_argument("--window-size=800,600")
-                options.add_argument("--incognito")
-                options.add_argument("--disable-gpu")
-                options.add_argument("--no-sandbox")
-                options.add_argument("--disable-dev-shm-usage")
-                options.add_argument("--disable-blink-features=AutomationControlled")
-                options.add_argument("--log-level=3")
-                options.add_argument("--silent")
-                options.add_argument("--disable-logging")
-
-                temp_dir = f"/tmp/chrome_test_{id(options)}"
-                options.add_argument(f"--user-data-dir={temp_dir}")
-                temp_dirs.append(temp_dir)
-
-                options.set_capability("goog:loggingPrefs", {
-                    "browser": "ALL",
-                    "performance": "ALL"
-                })
-
-                service = ChromeService(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=options)
-
-
-            elif browser_type.lower() == "edge":
-
-                options = webdriver.EdgeOptions()
-
-                options.add_argument("--disable-blink-features=AutomationControlled")
-
-                temp_dir = f"/tmp/edge_test_{id(options)}"
-
-                options.add_argument(f"--user-data-dir={temp_dir}")
-
-                temp_dirs.append(temp_dir)
 
-                options.add_experimental_option("excludeSwitches", ["enable-automation"])
+@pytest.fixture(scope="session")
+def browser_pool(request):
+    profile = request.config.getoption("--browser-profile")
+    network_capture = request.config.getoption("--network-capture")
+    lean = request.config.getoption("--lean-load") == "on"
+    print(f"Browser profile: {profile}, network capture: {network_capture}, lean load: {lean}")
 
-                options.add_experimental_option('useAutomationExtension', False)
+    pool = BrowserPool(
+        functools.partial(
+            launch_browser,
+            profile=profile,
+            performance_log=network_capture == "log",
+            page_load_strategy="eager" if lean else "normal"
+        ),
+        max_reuse=request.config.getoption("--browser-max-reuse"),
+        enabled=request.config.getoption("--browser-pool") == "on"
+    )
 
+    yield pool
 
-                options.set_capability("goog:loggingPrefs", {
+    pool.shutdown()
+    print(f"\n{pool.get_summary()}")
+    print(f"STARTUP METRICS (ms)")
+    print(f"{startup_metrics.format_comparison_table()}\n")
 
-                    "browser": "ALL",
 
-                    "performance": "ALL"
-
-                })
+@pytest.fixture(scope="function")
+def browser_prelaunch(browser_pool):
+    """
+    Start leasing a Chrome session in the background before the table is provisioned.
+    browser_factory lists this fixture ahead of endpoint_setup, so the browser launch
+    and DigitalOrderAPI.setup_table() run concurrently.
+    """
+    def _timed_acquire():
+        start = time.time()
+        lease = browser_pool.acquire("chrome")
+        return lease, time.time() - start
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prelaunch")
+    prelaunch = {
+        'future': executor.submit(_timed_acquire),
+        'started': time.time(),
+        'claimed': False
+    }
+
+    yield prelaunch
+
+    executor.shutdown(wait=True)
+    if not prelaunch['claimed']:
+        # The test never asked for Chrome - give the session back
+        try:
+            lease, _ = prelaunch['future'].result()
+            browser_pool.release(lease)
+        except Exception as e:
+            print(f"⚠️ Pre-launched browser could not be released: {str(e)}")
 
-                service = EdgeService(EdgeChromiumDriverManager().install())
 
-                driver = webdriver.Edge(service=service, options=options)
+@pytest.fixture(scope="function")
+def browser_factory(browser_prelaunch, endpoint_setup, browser_pool, teardown_pipeline, request):
+    leases = []
+    drivers = []
+    trackers = []
+    api_setup = endpoint_setup
+    network_capture = request.config.getoption("--network-capture")
+    # Performance tests measure real page loads, so they never run lean
+    lean = (request.config.getoption("--lean-load") == "on"
+            and request.node.get_closest_marker("performance") is None)
+    provisioning_time = time.time() - browser_prelaunch['started']
+
+    def _claim_prelaunched():
+        join_start = time.time()
+        lease, launch_time = browser_prelaunch['future'].result()
+        join_wait = time.time() - join_start
+
+        # Run sequentially this would have cost launch + provisioning
+        saved = min(launch_time, provisioning_time)
+        print(
+            f"⏱️ Browser ready: launch {launch_time:.1f}s overlapped table setup "
+            f"{provisioning_time:.1f}s (waited {join_wait:.1f}s, saved {saved:.1f}s)"
+        )
+        return lease, (
+            f"Browser launch: {launch_time:.2f}s\n"
+            f"Table provisioning: {provisioning_time:.2f}s\n"
+            f"Waited at join: {join_wait:.2f}s\n"
+            f"Time saved by overlap: {saved:.2f}s"
+        )
 
+    def _create_browsers(*browser_types):
+        # Decide up front which request takes the pre-launched Chrome so threads don't race for it
+        use_prelaunch = [False] * len(browser_types)
+        for index, browser_type in enumerate(browser_types):
+            if browser_type.lower() == "chrome" and not browser_prelaunch['claimed']:
+                browser_prelaunch['claimed'] = True
+                use_prelaunch[index] = True
+                break
+
+        slots = [None] * len(browser_types)
+        tracker_slots = [None] * len(browser_types)
+        overlap_notes = []
+        load_reports = []
+
+        def _launch_and_navigate(index, browser_type):
+            if use_prelaunch[index]:
+                lease, note = _claim_prelaunched()
+                overlap_notes.append(note)
             else:
-                raise ValueError(f"Unsupported browser type: {browser_type}")
-
-            Navigation.navigate(driver, api_setup.session_id, api_setup.table_num)
-
-            tracker = NetworkTracker(driver)
-            trackers.append(tracker)
-
-            drivers.append(driver)
+                lease = browser_pool.acquire(browser_type)
+            # Keep the lease before navigating so it is released even if navigation fails
+            slots[index] = lease
+            command_profiler.instrument(lease.driver)
+            # A streaming tracker must be listening before the first page load
+            tracker_slots[index] = create_network_tracker(lease.driver, network_capture)
+            load_reports.append(
+                Navigation.navigate(lease.driver, api_setup.session_id, api_setup.table_num, lean=lean)
+            )
+
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=max(1, len(browser_types)), thread_name_prefix="browser") as executor:
+            futures = [
+                executor.submit(_launch_and_navigate, index, browser_type)
+                for index, browser_type in enumerate(browser_types)
+            ]
+        if len(browser_types) > 1:
+            print(f"✓ Created {len(browser_types)} browsers concurrently in {time.time() - start:.1f}s")
+
+        # Keep the requested order for leases, drivers and trackers
+        for lease, tracker in zip(slots, tracker_slots):
+            if lease is None:
+                continue
+            leases.append(lease)
+            drivers.append(lease.driver)
+            if tracker is not None:
+                trackers.append(tracker)
+
+        for note in overlap_notes:
+            allure.attach(note, name="⏱️ Startup Overlap", attachment_type=allure.attachment_type.TEXT)
+        for report in load_reports:
+            if report['mode'] == 'lean':
+                allure.attach(lean_load.format_report(report), name="🪶 Lean Load",
+                              attachment_type=allure.attachment_type.TEXT)
+
+        for future in futures:
+            future.result()
 
         return drivers
 
     yield _create_browsers
 
-
+    # Final state of every browser before it is released, whatever the capture policy
+    if _test_failed(request.node):
+        for index, drv in enumerate(drivers, 1):
+            try:
+                screenshot_service.submit(drv.get_screenshot_as_png(), f"❌ Failure state (browser {index})",
+                                          priority=True)
+            except Exception as e:
+                print(f"⚠️ Failed to capture failure screenshot: {e}")
 
     for tracker in trackers:
         try:
@@ -161,6 +505,7 @@ def browser_factory(endpoint_setup):
         except Exception as e:
             print(f"⚠️ Failed to capture network performance: {e}")
 
+    console_failure = None
     for drv in drivers:
         try:
             with allure.step("🔍 Automatic Console Safety Check"):
@@ -199,7 +544,7 @@ def browser_factory(endpoint_setup):
                         attachment_type=allure.attachment_type.TEXT
                     )
 
-                    pytest.fail(
+                    console_failure = (
                         f"Console violations detected: "
                         f"{len(results['errors'])} critical errors, "
                         f"{len(results['pii_violations'])} PII violations"
@@ -220,24 +565,29 @@ def browser_factory(endpoint_setup):
         except Exception as e:
             print(f"Warning: Could not perform console check: {str(e)}")
 
-    for drv in drivers:
-        try:
-            drv.quit()
-        except Exception as e:
-            print(f"Error closing browser: {str(e)}")
-
     print(f"\n{'=' * 60}")
-    print(f"CLEANUP: Removing temporary browser profiles")
+    print(f"CLEANUP: Returning browsers to the pool")
     print(f"{'=' * 60}")
 
-    for temp_dir in temp_dirs:
-        try:
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
-                print(f"✓ Removed: {temp_dir}")
-            else:
-                print(f"⚠ Not found: {temp_dir}")
-        except Exception as e:
-            print(f"✗ Failed to remove {temp_dir}: {str(e)}")
+    def _defer(func, lease):
+        teardown_pipeline.submit(request.node.nodeid, f"quit {lease.browser_type} + remove profile", func, lease)
+
+    for lease in leases:
+        browser_pool.release(lease, defer=_defer)
+
+    warm = [lease for lease in leases if lease.warm]
+    if warm:
+        saved = sum(lease.launch_time_saved for lease in warm)
+        allure.attach(
+            f"Warm sessions reused: {len(warm)}/{len(leases)}\n"
+            f"Launch time saved: {saved:.1f}s\n"
+            f"Worker total saved: {browser_pool.time_saved:.1f}s",
+            name="♻️ Browser Pool",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+    print(f"{'=' * 60}\n")
 
-    print(f"{'=' * 60}\n")
\ No newline at end of file
+    # Fail only after the browsers are back in the pool so a failing check does not leak a session
+    if console_failure:
+        pytest.fail(console_failure)
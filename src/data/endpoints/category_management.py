@@ -3,6 +3,7 @@ import json
 from datetime import datetime, timedelta
 import pytz
 from src.utils.logger import Logger
+from src.data.endpoints.get_menu import invalidates_menu_cache
 
 
 class CategoryManagementAPI:
@@ -117,6 +118,7 @@ class CategoryManagementAPI:
             self.logger.error(f"Failed to get categories from menu: {str(e)}")
             raise
 
+    @invalidates_menu_cache
     def update_category_times(self, category_id, category_details, open_time, close_time,
                               property_id="33", revenue_center_id="810", username="atevzadze"):
 
@@ -207,6 +209,7 @@ class CategoryManagementAPI:
             revenue_center_id=revenue_center_id
         )
 
+    @invalidates_menu_cache
     def set_category_active_status(self, category_id, category_details, active_status,
                                     property_id="33", revenue_center_id="810", username="atevzadze"):
 
@@ -342,6 +345,7 @@ class CategoryManagementAPI:
             "Description": details["Description"]
         }
 
+    @invalidates_menu_cache
     def rename_category(self, category_id, category_details, new_name,
                         property_id="33", revenue_center_id="810", username="atevzadze"):
 
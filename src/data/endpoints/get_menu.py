@@ -1,15 +1,76 @@
 
 import requests
+import functools
 import json
+import os
+import tempfile
+import threading
+import time
 from src.data.endpoints.combined import get_current_api
 
 
-def get_full_menu():
+# Catalog responses per (property, revenue center); category/item management tests
+# change the menu, so only callers that opt in (cached=True) read from here
+MENU_CACHE_TTL = float(os.environ.get("MENU_CACHE_TTL", "300"))
+_menu_cache = {}
+_menu_cache_lock = threading.Lock()
 
+# Touched by every menu mutation; cached responses fetched before it are stale in every xdist worker
+MENU_CACHE_STAMP = os.path.join(tempfile.gettempdir(), "internal_qr_menu_changed.stamp")
+
+
+def _menu_changed_at() -> float:
+    try:
+        return os.path.getmtime(MENU_CACHE_STAMP)
+    except OSError:
+        return 0.0
+
+
+def invalidate_menu_cache():
+    """Drop cached catalog responses in this process and mark them stale for the other workers"""
+    with _menu_cache_lock:
+        _menu_cache.clear()
+    try:
+        with open(MENU_CACHE_STAMP, 'a'):
+            pass
+        os.utime(MENU_CACHE_STAMP, None)
+    except OSError as e:
+        print(f"⚠️ Could not mark the menu cache stale for other workers: {str(e)}")
+
+
+def invalidates_menu_cache(func):
+    """Decorator for management API calls that change the catalog"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            # Even a failed call may have been applied server-side
+            invalidate_menu_cache()
+    return wrapper
+
+
+def get_full_menu(cached=False):
+    """
+    Fetch the full catalog for the current property and revenue center.
+
+    Args:
+        cached: Reuse a response younger than MENU_CACHE_TTL seconds (env: MENU_CACHE_TTL)
+
+    Returns:
+        dict: Catalog with 'Items', or None if the request fails
+    """
     try:
 
         api = get_current_api()
 
+        cache_key = (api.property_id, api.revenue_center_id)
+        if cached:
+            with _menu_cache_lock:
+                entry = _menu_cache.get(cache_key)
+            if entry and time.time() - entry[0] < MENU_CACHE_TTL and entry[0] > _menu_changed_at():
+                return entry[1]
+
         url = f'{api.base_url}/v2/catalog/menuitems/modifiergroups/byrevenuecenter'
 
         # Prepare headers with subscription key
@@ -28,6 +89,7 @@ def get_full_menu():
 
         print(f"Fetching full menu for Property: {api.property_id}, RevenueCenterID: {api.revenue_center_id}...")
 
+        fetched_at = time.time()
         response = requests.post(url, headers=headers, json=payload)
 
 
@@ -55,6 +117,8 @@ def get_full_menu():
         print(f"  - Total Items: {items_count}")
         print(f"  - Unique Categories: {len(categories)}")
 
+        with _menu_cache_lock:
+            _menu_cache[cache_key] = (fetched_at, data)
         return data
 
     except RuntimeError as e:
@@ -70,13 +134,16 @@ def get_full_menu():
         return None
 
 
-def get_menu_categories():
+def get_menu_categories(cached=False):
     """
     Extract and return just the categories from the full menu.
 
     This is a convenience function that fetches the full menu and extracts
     unique categories with their properties.
 
+    Args:
+        cached: Extract them from a cached catalog response (see get_full_menu)
+
     Returns:
         list: List of unique category dictionaries with properties:
             - ID: Category unique identifier
@@ -89,7 +156,7 @@ def get_menu_categories():
     """
     try:
         # Get full menu first
-        menu_data = get_full_menu()
+        menu_data = get_full_menu(cached=cached)
 
         if not menu_data:
             return None
@@ -180,6 +247,45 @@ def get_active_categories():
         return None
 
 
+def get_orderable_items(exclude_alcohol=True, in_stock=True, allow_required_modifiers=False):
+    """
+    Items a test can add to the cart, from the cached catalog.
+
+    Args:
+        exclude_alcohol: Skip items whose categories are all alcohol categories
+        in_stock: Skip items flagged IsOutOfStock
+        allow_required_modifiers: Keep items with a required modifier group
+
+    Returns:
+        list: Catalog item dicts (ID, Name, Price, Categories, ModifierGroups, ...)
+        None: If the catalog request fails
+    """
+    menu_data = get_full_menu(cached=True)
+    if not menu_data:
+        return None
+
+    orderable = []
+    for item in menu_data.get('Items', []):
+        if not item.get('Active', False):
+            continue
+        if in_stock and item.get('IsOutOfStock', False):
+            continue
+
+        categories = [category for category in item.get('Categories', []) if category.get('Active', True)]
+        if not categories:
+            continue
+        if exclude_alcohol and all(category.get('IsAlcohol', False) for category in categories):
+            continue
+
+        if not allow_required_modifiers and any(
+                group.get('Required', False) or group.get('MinQuantity', 0) > 0
+                for group in item.get('ModifierGroups', [])):
+            continue
+        orderable.append(item)
+
+    return orderable
+
+
 # Backward compatibility function
 def get_menu_legacy():
     """
@@ -5,6 +5,7 @@ Manages menu item active/inactive status for integration testing
 import requests
 import json
 from src.utils.logger import Logger
+from src.data.endpoints.get_menu import invalidates_menu_cache
 
 
 class ItemManagementAPI:
@@ -179,6 +180,7 @@ class ItemManagementAPI:
             'neighbor_name': neighbor_name
         }
 
+    @invalidates_menu_cache
     def make_items_inactive(self, item_ids, property_id="33", revenue_center_id="810", username="atevzadze"):
         """
         Make multiple items inactive via API.
@@ -231,6 +233,7 @@ class ItemManagementAPI:
             self.logger.error(f"Failed to make items inactive: {str(e)}")
             raise
 
+    @invalidates_menu_cache
     def make_items_active(self, item_ids, property_id="33", revenue_center_id="810", username="atevzadze"):
         """
         Make multiple items active via API (restore).
@@ -400,6 +403,7 @@ class ItemManagementAPI:
 
         raise ValueError(f"Item {item_id} not found in menu data")
 
+    @invalidates_menu_cache
     def remove_item_from_all_categories(self, item_id, property_id="33", revenue_center_id="810", username="atevzadze"):
         """
         Remove item from all categories by setting Categories: [].
@@ -445,6 +449,7 @@ class ItemManagementAPI:
             self.logger.error(f"Failed to remove item from categories: {str(e)}")
             raise
 
+    @invalidates_menu_cache
     def restore_item_to_categories(self, item_id, category_ids, property_id="33", revenue_center_id="810", username="atevzadze"):
         """
         Restore item to its original categories.
@@ -490,6 +495,7 @@ class ItemManagementAPI:
             self.logger.error(f"Failed to restore item to categories: {str(e)}")
             raise
 
+    @invalidates_menu_cache
     def restore_item_to_categories_with_details(self, item_id, category_ids, item_details,
                                                 property_id="33", revenue_center_id="810", username="atevzadze"):
         """
@@ -556,6 +562,7 @@ class ItemManagementAPI:
 
         raise ValueError(f"Item {item_id} not found in menu data")
 
+    @invalidates_menu_cache
     def remove_item_from_category(self, item_id, category_id_to_remove,
                                    property_id="33", revenue_center_id="810", username="atevzadze"):
         """
@@ -634,6 +641,7 @@ class ItemManagementAPI:
             self.logger.error(f"Failed to remove item from category: {str(e)}")
             raise
 
+    @invalidates_menu_cache
     def restore_item_to_category(self, item_id, category_id_to_add,
                                   property_id="33", revenue_center_id="810", username="atevzadze"):
         """
@@ -691,6 +699,7 @@ class ItemManagementAPI:
             self.logger.error(f"Failed to restore item to category: {str(e)}")
             raise
 
+    @invalidates_menu_cache
     def rename_item(self, item_id, new_name, property_id="33", revenue_center_id="810", username="atevzadze"):
         """
         Rename a menu item.
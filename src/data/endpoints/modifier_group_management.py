@@ -5,6 +5,7 @@ Manages modifier group required/optional status for integration testing
 import requests
 import json
 from src.utils.logger import Logger
+from src.data.endpoints.get_menu import invalidates_menu_cache
 
 
 class ModifierGroupManagementAPI:
@@ -331,6 +332,7 @@ class ModifierGroupManagementAPI:
 
         return payload
 
+    @invalidates_menu_cache
     def make_modifier_required(self, modifier_group_id, mod_group_data, menu_items_list):
         """Make modifier group required"""
         payload = self._build_modifier_payload(mod_group_data, menu_items_list, required=True)
@@ -345,6 +347,7 @@ class ModifierGroupManagementAPI:
             self.logger.error(f"Failed to make modifier required: {str(e)}")
             raise
 
+    @invalidates_menu_cache
     def make_modifier_optional(self, modifier_group_id, mod_group_data, menu_items_list):
         """Make modifier group optional (restore)"""
         payload = self._build_modifier_payload(mod_group_data, menu_items_list, required=False)
@@ -373,6 +376,7 @@ class ModifierGroupManagementAPI:
 
         return menu_items
 
+    @invalidates_menu_cache
     def update_modifier_sequences(self, modifier_updates):
         """
         Update sequences for multiple modifier groups at once.
@@ -454,6 +458,7 @@ class ModifierGroupManagementAPI:
 
         return responses
 
+    @invalidates_menu_cache
     def make_modifier_group_inactive(self, modifier_group_id, mod_group_data, menu_items_list):
         """Make modifier group inactive (hide from UI)"""
         payload = self._build_modifier_payload_full(mod_group_data, menu_items_list, active=False)
@@ -468,6 +473,7 @@ class ModifierGroupManagementAPI:
             self.logger.error(f"Failed to make modifier inactive: {str(e)}")
             raise
 
+    @invalidates_menu_cache
     def make_modifier_group_active(self, modifier_group_id, mod_group_data, menu_items_list):
         """Make modifier group active (show in UI)"""
         payload = self._build_modifier_payload_full(mod_group_data, menu_items_list, active=True)
@@ -482,6 +488,7 @@ class ModifierGroupManagementAPI:
             self.logger.error(f"Failed to make modifier active: {str(e)}")
             raise
 
+    @invalidates_menu_cache
     def rename_modifier_group(self, modifier_group_id, mod_group_data, menu_items_list, new_name):
         """Rename modifier group"""
         payload = self._build_modifier_payload_full(mod_group_data, menu_items_list,
@@ -662,6 +669,7 @@ class ModifierGroupManagementAPI:
             f"Searched {len(items_data)} items and their modifier groups."
         )
 
+    @invalidates_menu_cache
     def make_modifier_item_inactive(self, modifier_id, property_id="33", revenue_center_id="810", username="atevzadze"):
         """
         Make a single modifier item inactive.
@@ -718,6 +726,7 @@ class ModifierGroupManagementAPI:
             self.logger.error(f"Failed to make modifier inactive: {str(e)}")
             raise
 
+    @invalidates_menu_cache
     def make_modifier_item_active(self, modifier_id, property_id="33", revenue_center_id="810", username="atevzadze"):
         """
         Make a single modifier item active (restore).
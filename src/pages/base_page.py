@@ -9,10 +9,19 @@ from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 import logging
 import time
+from decimal import Decimal
 from selenium.webdriver.remote.webelement import WebElement
 from typing import Union, List, Tuple
 import allure
 import functools
+from src.utils import currency
+from src.utils.sleep_tracker import sleep_tracker
+from src.utils.network_probe import NETWORK_IDLE_SCRIPT, install_network_probe, blocking_call, format_call
+from src.utils.polling import DEFAULT_SCHEDULE, poll, poll_in_browser
+from src.utils.element_cache import CachedElement
+from src.utils.command_profiler import command_profiler
+from src.utils.screenshot_service import screenshot_service
+from src.utils.action_batch import ActionBatch, SELECT_ALL_MODIFIER
 
 def wait_for_loader(func):
     @functools.wraps(func)
@@ -30,6 +39,40 @@ class BasePage:
         self.store_id = None
 
         self.LOADER = (By.CSS_SELECTOR, ".loader")
+        self.last_network_wait = None
+
+        # Opt-in: locators whose element lives as long as the page; find_element() and
+        # is_element_displayed() reuse one handle for them (others only with cached=True)
+        self.stable_locators = set()
+        self._element_cache = {}
+
+    # Resolves once the observed node has had no mutations for quietMs, or at the hard timeout
+    DOM_STABLE_SCRIPT = """
+        const root = arguments[0] || document.documentElement;
+        const quietMs = arguments[1], timeoutMs = arguments[2], done = arguments[3];
+        const start = performance.now();
+        let mutations = 0, quietTimer = null, hardTimer = null;
+
+        const observer = new MutationObserver((records) => {
+            mutations += records.length;
+            clearTimeout(quietTimer);
+            quietTimer = setTimeout(() => finish(true), quietMs);
+        });
+        function finish(stable) {
+            observer.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(hardTimer);
+            done({stable: stable, mutations: mutations, elapsed: performance.now() - start});
+        }
+
+        observer.observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+        quietTimer = setTimeout(() => finish(true), quietMs);
+        hardTimer = setTimeout(() => finish(false), timeoutMs);
+    """
+
+    # Seconds the loader waits spend on the network before polling the loader itself;
+    # pages with polling or analytics traffic never go idle
+    LOADER_NETWORK_TIMEOUT = 5
 
     def wait_for_loader_to_disappear(self, timeout=30):
 
@@ -48,8 +91,16 @@ class BasePage:
 
             self.logger.debug("Waiting for loader to disappear...")
 
+            # The loader is tied to an API call - wait in the browser for either to finish first
+            network = self.wait_for_network_idle(
+                timeout=min(timeout, self.LOADER_NETWORK_TIMEOUT), until_gone=self.LOADER
+            )
+            if network['gone'] or not self.driver.find_elements(*self.LOADER):
+                self.logger.debug("Loader disappeared while waiting on the network")
+                return True
+
             # Wait for loader to disappear
-            WebDriverWait(self.driver, timeout).until_not(
+            WebDriverWait(self.driver, max(1, timeout - network['waited_ms'] / 1000)).until_not(
                 EC.presence_of_element_located(self.LOADER)
             )
             self.logger.debug("Loader disappeared successfully")
@@ -65,6 +116,225 @@ class BasePage:
 
 
 
+    # In-browser conditions for poll_in_browser(); args = [locator, ...]
+    _FIND_JS = """
+        const locator = args[0];
+        const el = locator[0] === 'xpath'
+            ? document.evaluate(locator[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(locator[1]);
+    """
+    _VISIBLE_JS = """
+        const visible = (node) => {
+            if (!node) { return false; }
+            const rect = node.getBoundingClientRect(), style = getComputedStyle(node);
+            return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+        };
+    """
+    VISIBLE_CONDITION = _FIND_JS + _VISIBLE_JS + "return visible(el);"
+    VISIBLE_TEXT_CONDITION = _FIND_JS + _VISIBLE_JS + """
+        const text = visible(el) ? (el.innerText || el.textContent || '').trim() : '';
+        return text || null;
+    """
+    CHANGED_TEXT_CONDITION = _FIND_JS + """
+        const text = el ? (el.innerText || el.textContent || '').trim() : '';
+        return (text && text !== args[1]) ? text : null;
+    """
+
+    def _wait_site(self) -> str:
+        """Calling page method and wait kind, e.g. "MenuPage.click_category_by_id:wait_until" """
+        wait = sys._getframe(1).f_code.co_name
+        caller = sys._getframe(2).f_code.co_name
+        return f"{type(self).__name__}.{caller}:{wait}"
+
+    def wait_for_dom_stable(self, quiet_ms: int = 150, timeout: float = 5, locator: Tuple[str, str] = None,
+                            replaces: float = 0, name: str = None) -> bool:
+        """
+        Wait until the DOM (or the subtree of locator) has had no mutations for quiet_ms.
+
+        Args:
+            quiet_ms: Milliseconds without mutations that count as stable
+            timeout: Hard limit in seconds (keep below the driver's script timeout)
+            locator: Optional element to observe instead of the whole document
+            replaces: Seconds of fixed sleep this call replaced, for the sleep report
+            name: Call site for the sleep report (defaults to the calling method)
+
+        Returns:
+            True if the DOM settled, False on timeout or when the observer could not run
+        """
+        site = name or f"{type(self).__name__}.{sys._getframe(1).f_code.co_name}"
+        start = time.time()
+
+        try:
+            root = None
+            if locator:
+                elements = self.driver.find_elements(*locator)
+                root = elements[0] if elements else None
+
+            result = self.driver.execute_async_script(
+                self.DOM_STABLE_SCRIPT, root, quiet_ms, int(timeout * 1000)
+            )
+            stable = bool(result and result.get('stable'))
+            if not stable:
+                logging.warning(f"DOM did not settle within {timeout}s ({site})")
+        except Exception as e:
+            # Observer unavailable (e.g. page navigating) - keep the old fixed delay
+            logging.debug(f"DOM stability wait failed in {site}: {str(e)}")
+            if replaces:
+                time.sleep(replaces)
+            stable = False
+
+        if replaces:
+            sleep_tracker.record(site, replaces, time.time() - start)
+        return stable
+
+    def wait_for_network_idle(self, idle_ms: int = 300, timeout: float = 30, name: str = None,
+                              until_gone: Tuple[str, str] = None) -> dict:
+        """
+        Wait in the browser until no fetch/XHR request has been in flight for idle_ms.
+
+        Args:
+            idle_ms: Milliseconds with zero in-flight requests that count as idle
+            timeout: Maximum seconds to wait
+            name: Label for logging (defaults to the calling method)
+            until_gone: Optional locator; the wait also ends as soon as it has no visible match
+                        (pages with polling/analytics traffic may never go idle)
+
+        Returns:
+            dict: idle (bool), gone (bool, until_gone has no visible match), waited_ms,
+            finished calls, still_pending calls and blocking_call - the request the page
+            was actually waiting on
+        """
+        site = name or f"{type(self).__name__}.{sys._getframe(1).f_code.co_name}"
+        install_network_probe(self.driver)
+        try:
+            gone_locator = self._script_locator(until_gone) if until_gone else None
+        except ValueError:
+            gone_locator = None  # strategy the script can't query - wait on the network alone
+
+        result = {'idle': False, 'gone': False, 'waited_ms': 0.0, 'finished': [], 'still_pending': [],
+                  'blocking_call': None}
+        deadline = time.time() + timeout
+        try:
+            while True:
+                # Keep each async script well below the driver's script timeout
+                chunk = max(0.1, min(deadline - time.time(), 20))
+                chunk_result = self.driver.execute_async_script(
+                    NETWORK_IDLE_SCRIPT, idle_ms, int(chunk * 1000), gone_locator
+                )
+                result['waited_ms'] += chunk_result['waited']
+                result['finished'].extend(chunk_result['finished'])
+                result['still_pending'] = chunk_result['still_pending']
+                result['idle'] = chunk_result['idle']
+                result['gone'] = chunk_result.get('gone', False)
+                if result['idle'] or result['gone'] or time.time() >= deadline:
+                    break
+        except Exception as e:
+            logging.debug(f"Network idle wait failed in {site}: {str(e)}")
+            self.last_network_wait = result
+            return result
+
+        result['blocking_call'] = blocking_call(result)
+        self.last_network_wait = result
+
+        waited_on = format_call(result['blocking_call']) if result['blocking_call'] else "no API call"
+        if result['idle']:
+            logging.info(f"🌐 Network idle after {result['waited_ms']:.0f}ms in {site} - waited on {waited_on}")
+        elif result['gone']:
+            logging.info(f"🌐 {until_gone[1]} gone after {result['waited_ms']:.0f}ms in {site} (network still busy)")
+        else:
+            logging.warning(f"🌐 Network not idle after {timeout}s in {site} - still waiting on {waited_on}")
+        return result
+
+    # Reads the requested fields of every match in a single round trip
+    EXTRACT_SCRIPT = """
+        const roots = arguments[0], locator = arguments[1], fields = arguments[2];
+        function queryAll(root, loc) {
+            if (loc[0] === 'xpath') {
+                const snapshot = document.evaluate(loc[1], root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                const nodes = [];
+                for (let i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+                return nodes;
+            }
+            return Array.from(root.querySelectorAll(loc[1]));
+        }
+        function read(el, prop) {
+            if (!el) { return null; }
+            if (prop === 'element') { return el; }
+            if (prop === 'text') { return (el.innerText || el.textContent || '').trim(); }
+            if (prop === 'value') { return el.value === undefined ? null : el.value; }
+            if (prop === 'visible') {
+                const rect = el.getBoundingClientRect(), style = getComputedStyle(el);
+                return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+            }
+            if (prop.startsWith('@')) { return el.getAttribute(prop.slice(1)); }
+            return null;
+        }
+        let elements = [];
+        if (locator) {
+            for (const root of (roots || [document])) { elements = elements.concat(queryAll(root, locator)); }
+        } else {
+            elements = roots;
+        }
+        return elements.map((el) => {
+            const row = {};
+            for (const [name, child, prop] of fields) {
+                row[name] = read(child ? queryAll(el, child)[0] : el, prop);
+            }
+            return row;
+        });
+    """
+
+    @staticmethod
+    def _script_locator(locator):
+        """Translate a (By, value) locator to what EXTRACT_SCRIPT understands"""
+        by, value = locator
+        if by == By.XPATH:
+            return ['xpath', value]
+        css = {
+            By.CSS_SELECTOR: value,
+            By.ID: f'[id="{value}"]',
+            By.CLASS_NAME: f'.{value}',
+            By.TAG_NAME: value,
+            By.NAME: f'[name="{value}"]',
+        }.get(by)
+        if css is None:
+            raise ValueError(f"Locator strategy not supported by extract(): {by}")
+        return ['css', css]
+
+    def extract(self, target, fields: dict, timeout: float = 0) -> List[dict]:
+        """
+        Read texts, attributes and visibility of all matching elements in one round trip.
+
+        Args:
+            target: Locator tuple, a WebElement or a list of WebElements
+            fields: {name: spec} where spec is "text", "visible", "value", "element",
+                    "@attribute", or (child_locator, spec) to read the first matching
+                    descendant instead of the element itself
+            timeout: Seconds to keep retrying while nothing matches (0 = one call)
+
+        Returns:
+            list: One plain dict per element, in document order
+        """
+        field_specs = []
+        for name, spec in fields.items():
+            if isinstance(spec, tuple):
+                child_locator, prop = spec
+                field_specs.append([name, self._script_locator(child_locator), prop])
+            else:
+                field_specs.append([name, None, spec])
+
+        if isinstance(target, tuple):
+            roots, locator = None, self._script_locator(target)
+        else:
+            roots, locator = (target if isinstance(target, list) else [target]), None
+
+        deadline = time.time() + timeout
+        while True:
+            rows = self.driver.execute_script(self.EXTRACT_SCRIPT, roots, locator, field_specs) or []
+            if rows or time.time() >= deadline:
+                return rows
+            time.sleep(0.1)
+
     def send_keys(self, locator, text, clear=True, name=None):
         logging.info(f"Attempting to send keys to element: {name if name else locator}")
         try:
@@ -83,8 +353,8 @@ class BasePage:
 
             try:
                 if clear:
-                    self.driver.execute_script("arguments[0].value = '';", element)
-                self.driver.execute_script(f"arguments[0].value = arguments[1];", element, text)
+                    self.execute_script("arguments[0].value = '';", element)
+                self.execute_script(f"arguments[0].value = arguments[1];", element, text)
                 logging.info(f"Successfully sent keys using JavaScript: {name if name else locator}")
                 return element
             except Exception as e:
@@ -93,8 +363,8 @@ class BasePage:
             try:
                 actions = ActionChains(self.driver)
                 if clear:
-                    actions.click(element).key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL).send_keys(
-                        Keys.BACK_SPACE)
+                    actions.click(element).key_down(SELECT_ALL_MODIFIER).send_keys('a').key_up(
+                        SELECT_ALL_MODIFIER).send_keys(Keys.BACK_SPACE)
                 actions.send_keys(text).perform()
                 logging.info(f"Successfully sent keys using ActionChains: {name if name else locator}")
                 return element
@@ -106,165 +376,163 @@ class BasePage:
             logging.error(f"Failed to interact with element {name if name else locator}: {str(e)}")
             raise
 
-    def get_text(self, locator, name=None, element=None, timeout=30):
-        logging.info(f"Attempting to get text from element: {name if name else locator}")
-        try:
-            if element is None:
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located(locator)
-                )
-
-
-            try:
-                text = element.text.strip()  # Added strip()
-                if text:
-                    logging.info(f"Successfully got text using .text: '{text}'")
-                    return text
-            except Exception as e:
-                logging.debug(f"Regular .text failed: {str(e)}")
-
-            # Try textContent
-            try:
-                text = element.get_attribute('textContent').strip()
-                if text:
-                    logging.info(f"Successfully got text using textContent: '{text}'")
-                    return text
-            except Exception as e:
-                logging.debug(f"textContent failed: {str(e)}")
-
-            # Try JavaScript innerText
-            try:
-                text = self.driver.execute_script("return arguments[0].innerText;", element)
-                if text:
-                    text = text.strip()
-                    logging.info(f"Successfully got text using JavaScript: '{text}'")
-                    return text
-            except Exception as e:
-                logging.debug(f"JavaScript innerText failed: {str(e)}")
-
-            # If we get here, no method worked but element exists
-            logging.warning(f"Element found but no text could be extracted from {name if name else locator}")
-            return ""
-
-        except Exception as e:
-            logging.error(f"Failed to locate or get text from element {name if name else locator}: {str(e)}")
-            raise
-    def get_text_short(self, locator, name=None, element=None, timeout=2):
-        logging.info(f"Attempting to get text from element: {name if name else locator}")
-        try:
-            if element is None:
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located(locator)
-                )
+    # Finds the element and returns innerText and textContent together, optionally
+    # polling in the browser until the element exists and has text
+    READ_TEXT_SCRIPT = """
+        const target = arguments[0], locator = arguments[1], waitForText = arguments[2];
+        const timeoutMs = arguments[3], done = arguments[arguments.length - 1];
+        const start = performance.now();
+        function find() {
+            if (target) { return target; }
+            if (locator[0] === 'xpath') {
+                return document.evaluate(locator[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            }
+            return document.querySelector(locator[1]);
+        }
+        (function poll() {
+            const el = find();
+            const inner = el ? (el.innerText || '').trim() : '';
+            const content = el ? (el.textContent || '').trim() : '';
+            if ((el && (!waitForText || inner || content)) || performance.now() - start >= timeoutMs) {
+                return done({found: !!el, innerText: inner, textContent: content});
+            }
+            setTimeout(poll, 50);
+        })();
+    """
+
+    def read_text(self, locator=None, element=None, timeout=30, wait_for_text=False, name=None) -> str:
+        """
+        Read an element's text in a single round trip.
 
+        Args:
+            locator: Element locator tuple (ignored when element is given)
+            element: Already located WebElement
+            timeout: Seconds to wait in the browser for the element (and text)
+            wait_for_text: Keep waiting until the text is non-empty
+            name: Element name for logging
 
-            try:
-                text = element.text
-                if text:
-                    logging.info(f"Successfully got text using .text: '{text}'")
-                    return text
-            except Exception as e:
-                logging.debug(f"Regular .text failed: {str(e)}")
+        Returns:
+            str: innerText, or textContent when innerText is empty
 
-            # Try textContent
-            try:
-                text = element.get_attribute('textContent').strip()
-                if text:
-                    logging.info(f"Successfully got text using textContent: '{text}'")
-                    return text
-            except Exception as e:
-                logging.debug(f"textContent failed: {str(e)}")
+        Raises:
+            TimeoutException: Element not found, or still empty when wait_for_text is set
+        """
+        element_name = name if name else locator
+        logging.info(f"Attempting to get text from element: {element_name}")
 
-            # Try JavaScript innerText
+        script_locator = None
+        if element is None:
             try:
-                text = self.driver.execute_script("return arguments[0].innerText;", element)
-                if text:
-                    text = text.strip()
-                    logging.info(f"Successfully got text using JavaScript: '{text}'")
-                    return text
-            except Exception as e:
-                logging.debug(f"JavaScript innerText failed: {str(e)}")
-
-            # If we get here, no method worked but element exists
-            logging.warning(f"Element found but no text could be extracted from {name if name else locator}")
+                script_locator = self._script_locator(locator)
+            except ValueError:
+                # Strategy the script can't resolve - locate through WebDriver instead
+                element = WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located(locator))
+
+        deadline = time.time() + timeout
+        while True:
+            # Keep each async script well below the driver's script timeout
+            chunk = max(0.05, min(deadline - time.time(), 20))
+            result = self.driver.execute_async_script(
+                self.READ_TEXT_SCRIPT, element, script_locator, wait_for_text, int(chunk * 1000)
+            )
+            text = result['innerText'] or result['textContent']
+            if (result['found'] and (text or not wait_for_text)) or time.time() >= deadline:
+                break
+
+        if not result['found']:
+            logging.error(f"Failed to locate element {element_name} within {timeout}s")
+            raise TimeoutException(f"Element {element_name} not found within {timeout}s")
+        if not text:
+            if wait_for_text:
+                logging.error(f"Failed to get non-empty text from element {element_name} within {timeout}s")
+                raise TimeoutException(f"Element {element_name} has no text after {timeout}s")
+            logging.warning(f"Element found but no text could be extracted from {element_name}")
             return ""
 
-        except Exception as e:
-            logging.error(f"Failed to locate or get text from element {name if name else locator}: {str(e)}")
-            raise
-
-    def get_text_2(self, locator, name=None, max_attempts=50):
-        """Ultra-patient text getter that keeps trying until it finds text"""
-        logging.info(f"Patiently waiting for text from element: {name if name else locator}")
-
+        logging.info(f"Successfully got text: '{text}'")
+        return text
 
-        attempt = 0
+    @staticmethod
+    def parse_decimal(text: str) -> Decimal:
+        """
+        Parse a displayed amount such as "$1,234.56", "-$5.00" or "($5.00)" exactly.
 
-        while attempt < max_attempts:
-            try:
-                attempt += 1
-                logging.info(f"Attempt {attempt}/{max_attempts}")
+        Raises:
+            ValueError: Text does not contain an amount
+        """
+        return currency.parse_decimal(text)
 
-                # Wait for element with longer timeout each attempt
-                timeout = min(10 + (attempt * 2), 60)  # Gradually increase timeout
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.visibility_of_element_located(locator)
-                )
+    @staticmethod
+    def parse_currency(text: str) -> float:
+        """
+        Parse a displayed amount such as "$1,234.56", "-$5.00" or "($5.00)".
 
-                # Try all text extraction methods
-                methods = [
-                    lambda e: e.text.strip(),
-                    lambda e: e.get_attribute('textContent').strip(),
-                    lambda e: self.driver.execute_script("return arguments[0].innerText;", e).strip(),
-                    lambda e: self.driver.execute_script("return arguments[0].textContent;", e).strip()
-                ]
+        Raises:
+            ValueError: Text does not contain an amount
+        """
+        return currency.parse_currency(text)
 
-                for method in methods:
-                    try:
-                        text = method(element)
-                        if text:
-                            logging.info(f"Success on attempt {attempt}: '{text}'")
-                            return text
-                    except:
-                        continue
+    def read_amount(self, locator=None, element=None, timeout=30, wait_for_text=True, name=None) -> float:
+        """Read a currency value with read_text() and parse it"""
+        return self.parse_currency(
+            self.read_text(locator, element=element, timeout=timeout, wait_for_text=wait_for_text, name=name)
+        )
 
-                logging.info(f"No text found on attempt {attempt}, waiting 3 seconds...")
-                time.sleep(1)  # Wait before next attempt
+    def get_text(self, locator, name=None, element=None, timeout=30):
+        return self.read_text(locator, element=element, timeout=timeout, name=name)
 
-            except Exception as e:
-                logging.debug(f"Attempt {attempt} failed: {str(e)}")
-                time.sleep(1)  # Wait before retrying after exception
+    def get_text_short(self, locator, name=None, element=None, timeout=2):
+        return self.read_text(locator, element=element, timeout=timeout, name=name)
 
-        logging.error(f"Failed to get text after {max_attempts} attempts")
-        raise TimeoutException(f"Could not get text from {name if name else locator} after {max_attempts} attempts")
+    def get_text_2(self, locator, name=None, max_attempts=50, timeout=None):
+        """
+        Ultra-patient text getter that keeps trying until it finds visible text.
 
-    def get_text_3(self, locator, name=None, element=None, timeout=30):
-        logging.info(f"Attempting to get text from element: {name if name else locator}")
+        Args:
+            max_attempts: Kept for compatibility - sets the default budget (2s per attempt)
+            timeout: Seconds to wait for visible, non-empty text
+        """
+        logging.info(f"Patiently waiting for text from element: {name if name else locator}")
+        timeout = timeout if timeout is not None else max_attempts * 2
 
+        text = None
         try:
-            if element is None:
-                element = WebDriverWait(self.driver, timeout).until(
-                    lambda d: d.find_element(*locator)
-                )
-
-            # Wait until text is actually populated
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: element.text and element.text.strip()
+            text = poll_in_browser(
+                self.driver, self.VISIBLE_TEXT_CONDITION, [self._script_locator(locator)],
+                timeout, self._wait_site()
+            )
+        except ValueError:
+            # Strategy the browser condition can't resolve - poll through WebDriver
+            text = poll(
+                lambda: self.driver.find_element(*locator).text.strip(), timeout, self._wait_site()
             )
 
-            text = element.text.strip()
-            logging.info(f"Successfully got text: '{text}'")
+        if text:
+            logging.info(f"Got text: '{text}'")
             return text
 
-        except Exception as e:
-            logging.error(
-                f"Failed to get non-empty text from element {name if name else locator}: {str(e)}"
-            )
-            raise
+        logging.error(f"Failed to get text within {timeout}s")
+        raise TimeoutException(f"Could not get text from {name if name else locator} within {timeout}s")
+
+    def get_text_3(self, locator, name=None, element=None, timeout=30):
+        return self.read_text(locator, element=element, timeout=timeout, wait_for_text=True, name=name)
 
     def is_element_displayed(self, locator, timeout=2):
         try:
+            cached = locator in self.stable_locators
+            if cached:
+                element = self._cached_element(locator)
+                try:
+                    if element is not None and element.is_displayed():
+                        return True
+                except Exception:
+                    # Handle could not be recovered - forget it and look the element up again
+                    self._element_cache.pop(locator, None)
+
             elements = self.driver.find_elements(*locator)
+            if elements and cached:
+                command_profiler.count("element_cache.miss")
+                self._cache_element(locator, elements[0], timeout)
             if elements and elements[0].is_displayed():
                 return True
 
@@ -297,6 +565,19 @@ class BasePage:
         wait = WebDriverWait(self.driver, timeout)
         return wait.until(EC.presence_of_all_elements_located(locator))
 
+    def batch(self, flow: str, timeout: float = 10) -> ActionBatch:
+        """
+        Start an action batch: clicks, typing and scrolls sent as one W3C Actions request.
+
+        Args:
+            flow: Name the round trips and latency saved are reported under
+            timeout: Seconds to wait for the batch's locator targets
+
+        Example:
+            self.batch("card entry").type(CARD_NUMBER, number).type(CARD_DATE, exp).perform()
+        """
+        return ActionBatch(self, flow, timeout)
+
     def click(self, target: Union[WebElement, Tuple[str, str]], name=None, timeout=30):
         try:
             # Ensure page is fully loaded before attempting to interact
@@ -319,8 +600,8 @@ class BasePage:
                 logging.info(f"Regular click failed, trying alternative methods: {str(e)}")
 
             try:
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                self.driver.execute_script("arguments[0].click();", element)
+                self.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                self.execute_script("arguments[0].click();", element)
                 logging.info(f"Successfully clicked element using JavaScript: {name if name else target}")
                 return element
             except Exception as e:
@@ -361,21 +642,23 @@ class BasePage:
         Args:
             locator: Element locator tuple
             timeout: Maximum time to wait (default 2 seconds)
-            initial_delay: Delay before starting to check (default 0 seconds)
+            initial_delay: Extra time the element gets to appear (default 0 seconds).
+                           Polling starts immediately, so an element that is already
+                           there returns without paying the delay.
 
         Returns:
             True if element becomes visible within timeout, False otherwise
         """
         try:
-            # ✅ Wait before starting to look
-            if initial_delay > 0:
-                time.sleep(initial_delay)
-
-            wait = WebDriverWait(self.driver, timeout, poll_frequency=0.5)
-            wait.until(EC.visibility_of_element_located(locator))
-            return True
-        except TimeoutException:
-            return False
+            return bool(poll_in_browser(
+                self.driver, self.VISIBLE_CONDITION, [self._script_locator(locator)],
+                timeout + initial_delay, self._wait_site()
+            ))
+        except ValueError:
+            return bool(poll(
+                lambda: self.driver.find_element(*locator).is_displayed(),
+                timeout + initial_delay, self._wait_site()
+            ))
         except Exception:
             return False
 
@@ -402,8 +685,30 @@ class BasePage:
     def switch_to_default_content(self):
         self.driver.switch_to.default_content()
 
-    def find_element(self, locator: Tuple[str, str], timeout: int = 10, name: str = None) -> WebElement:
-        """Simple but effective element finder"""
+    def find_element(self, locator: Tuple[str, str], timeout: int = 10, name: str = None,
+                     cached: bool = None) -> WebElement:
+        """
+        Simple but effective element finder
+
+        Args:
+            cached: Reuse the handle found earlier on this page instance; defaults to
+                    whether locator is in self.stable_locators. Stale handles re-find
+                    themselves on use - only cache elements that are never replaced by
+                    a different node (e.g. not the "active" item of a list).
+        """
+        use_cache = locator in self.stable_locators if cached is None else cached
+        if use_cache:
+            element = self._cached_element(locator)
+            if element is not None:
+                return element
+            command_profiler.count("element_cache.miss")
+
+        element = self._locate(locator, timeout, name)
+        if use_cache:
+            element = self._cache_element(locator, element, timeout, name)
+        return element
+
+    def _locate(self, locator: Tuple[str, str], timeout: int = 10, name: str = None) -> WebElement:
         element_name = name if name else str(locator)
 
         try:
@@ -422,6 +727,37 @@ class BasePage:
             except TimeoutException:
                 raise Exception(f"Element not found: {element_name}")
 
+    def _cached_element(self, locator):
+        element = self._element_cache.get(locator)
+        if element is not None:
+            command_profiler.count("element_cache.hit")
+        return element
+
+    def _cache_element(self, locator, element, timeout=10, name=None) -> CachedElement:
+        # Re-finding happens mid-command: give a re-rendering element a moment, not the full timeout
+        cached = CachedElement(
+            element, lambda: WebDriverWait(self.driver, min(timeout, 2)).until(EC.presence_of_element_located(locator)),
+            locator
+        )
+        self._element_cache[locator] = cached
+        return cached
+
+    def execute_script(self, script, *args):
+        """driver.execute_script() that re-finds stale cached elements among args and retries once"""
+        try:
+            return self.driver.execute_script(script, *args)
+        except StaleElementReferenceException:
+            cached = [arg for arg in args if isinstance(arg, CachedElement)]
+            if not cached:
+                raise
+            for element in cached:
+                element.refresh()
+            return self.driver.execute_script(script, *args)
+
+    def clear_element_cache(self):
+        """Forget cached handles, e.g. after navigating away from the page"""
+        self._element_cache.clear()
+
     def find_elements(self, locator: Tuple[str, str], timeout: int = 60, name: str = None) -> list:
         """Simple but effective elements finder"""
         element_name = name if name else str(locator)
@@ -508,6 +844,16 @@ class BasePage:
 
             log_and_print(f"Loading element is VISIBLE - monitoring: {element_name}")
 
+            # Wait for the API call behind the loader (or the loader itself) inside the browser, then confirm once
+            network = self.wait_for_network_idle(
+                timeout=min(timeout, self.LOADER_NETWORK_TIMEOUT), until_gone=loading_locator
+            )
+            if network['gone'] or not is_loader_visible():
+                waited_on = format_call(network['blocking_call']) if network['blocking_call'] else "no API call"
+                log_and_print(f"✅ Loading element GONE after {network['waited_ms'] / 1000:.1f}s - waited on {waited_on}")
+                return True
+            timeout = max(1, timeout - network['waited_ms'] / 1000)
+
             start_time = time.time()
             last_log_time = start_time
             loader_was_visible = True
@@ -593,26 +939,24 @@ class BasePage:
 
     def attach_screenshot(self, name="screenshot"):
         """
-        Waits for the page to be in a reasonably stable state and then attaches a screenshot to the Allure report.
+        Captures a screenshot once the DOM has settled and hands it to the screenshot service.
+
+        The capture policy may skip the call entirely; encoding, dedupe and the Allure
+        attachment happen off the test's critical path (see src/utils/screenshot_service.py).
         """
-        try:
-            # Wait for the main document to be loaded.
-            WebDriverWait(self.driver, 5).until(
-                lambda d: d.execute_script('return document.readyState') == 'complete'
-            )
+        if not screenshot_service.should_capture():
+            return
 
-            time.sleep(0.3)
+        try:
+            self.wait_for_dom_stable(quiet_ms=150, timeout=2, replaces=0.3)
 
-            # Now, take and attach the screenshot.
             png = self.driver.get_screenshot_as_png()
-            allure.attach(png, name=name, attachment_type=allure.attachment_type.PNG)
-            logging.info(f"Attached screenshot: {name}")
+            screenshot_service.submit(png, name)
+            logging.info(f"Captured screenshot: {name}")
 
         except Exception as e:
             # Log an error if screenshot fails, but don't stop the test.
-            logging.error(f"Could not attach screenshot '{name}': {e}")
-
-
+            logging.error(f"Could not capture screenshot '{name}': {e}")
 
     def attach_note(self, note_text, name="Note"):
         allure.attach(
@@ -626,24 +970,22 @@ class BasePage:
         element_name = name if name else str(locator)
         logging.info(f"Waiting for {element_name} to update from '{initial_value}'")
 
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            try:
-                element = self.find_element(locator, timeout=2)
-                current_text = self.get_text(locator, element=element, name=element_name)
-                self.logger.info(f"Current text: {current_text}")
-
-                # Check if value has changed from initial value
-                if current_text and current_text != initial_value:
-                    logging.info(f"{element_name} updated to: '{current_text}'")
-                    return current_text
-
-                time.sleep(0.3)
+        try:
+            current_text = poll_in_browser(
+                self.driver, self.CHANGED_TEXT_CONDITION, [self._script_locator(locator), initial_value],
+                timeout, self._wait_site()
+            )
+        except ValueError:
+            current_text = poll(
+                lambda: (lambda text: text if text and text != initial_value else None)(
+                    self.driver.find_element(*locator).text.strip()
+                ),
+                timeout, self._wait_site()
+            )
 
-            except Exception as e:
-                logging.debug(f"Error checking value: {str(e)}")
-                time.sleep(0.3)
+        if current_text:
+            logging.info(f"{element_name} updated to: '{current_text}'")
+            return current_text
 
         logging.warning(f"{element_name} did not update within {timeout}s")
         raise TimeoutException(f"{element_name} stuck at '{initial_value}' after {timeout}s")
@@ -653,40 +995,23 @@ class BasePage:
         """
         Generic reusable wait.
         Executes `condition_func()` repeatedly until it returns True or timeout expires.
+        Polls fast at first, then backs off (see src/utils/polling.py).
 
         Args:
             condition_func: A lambda or function returning True when the desired state is reached
             timeout (int): Maximum seconds to wait
-            poll_frequency (float): Sleep interval between retries
+            poll_frequency (float): Upper bound for the interval between retries
             description (str): Text for logging/timeouts
             on_timeout_return (bool): If True, return False on timeout instead of raising TimeoutException
 
         Returns:
             True if condition satisfied; False (or raises TimeoutException) otherwise
         """
-        start_time = time.time()
-        last_log = start_time
-        try:
-            while time.time() - start_time < timeout:
-                try:
-                    if condition_func():
-                        return True
-                except Exception:
-                    pass
-
-                now = time.time()
-                if now - last_log >= 1.0:
-                    logging.debug(f"⏳ Waiting for {description}... {int(now - start_time)}s elapsed")
-                    last_log = now
-                time.sleep(poll_frequency)
+        if poll(condition_func, timeout, self._wait_site(), schedule=DEFAULT_SCHEDULE.capped(poll_frequency)):
+            return True
 
-            msg = f"❌ Timeout after {timeout}s waiting for {description}"
-            logging.warning(msg)
-            if on_timeout_return:
-                return False
-            raise TimeoutException(msg)
-        except Exception as e:
-            logging.error(f"Error while waiting for {description}: {e}")
-            if on_timeout_return:
-                return False
-            raise
\ No newline at end of file
+        msg = f"❌ Timeout after {timeout}s waiting for {description}"
+        logging.warning(msg)
+        if on_timeout_return:
+            return False
+        raise TimeoutException(msg)
@@ -1,9 +1,11 @@
-import time
-
 from src.pages.base_page import BasePage
 from src.locators.store_locators import CheckoutPageLocators
 from src.utils.logger import Logger
+from src.utils.polling import poll_in_browser
+from src.utils.sleep_tracker import sleep_tracker
+from decimal import Decimal
 import random
+import time
 import allure
 
 
@@ -12,10 +14,131 @@ class CheckoutPage(BasePage):
     def __init__(self, driver):
         super().__init__(driver)
         self.logger = Logger("CheckoutPage")
+        # Last read_summary() result; cleared by every action that changes the amounts
+        self._summary = None
+        # Summary texts just before the last such action - the next read waits for them to change
+        self._texts_before_action = None
+
+    # Summary rows read by read_summary(); donation and service charge are optional
+    SUMMARY_FIELDS = {
+        'subtotal': CheckoutPageLocators.SUBTOTAL_VALUE,
+        'tax': CheckoutPageLocators.TAXES_VALUE,
+        'tip': CheckoutPageLocators.TIPS_VALUE,
+        'donation': CheckoutPageLocators.DONATION_VALUE,
+        'service_charge': CheckoutPageLocators.SERVICE_CHARGE_VALUE,
+        'total': CheckoutPageLocators.TOTAL_VALUE,
+    }
+
+    _SUMMARY_READ_JS = """
+        const read = (fields) => {
+            const texts = {};
+            for (const [name, locator] of fields) {
+                const el = locator[0] === 'xpath'
+                    ? document.evaluate(locator[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                    : document.querySelector(locator[1]);
+                texts[name] = el ? (el.innerText || el.textContent || '').trim() || null : null;
+            }
+            return texts;
+        };
+    """
+    # args = [fields, quietMs, token, before, changeGraceMs]: done once subtotal and total are
+    # filled in and no amount text has changed for quietMs (the total is recalculated after the
+    # subtotal). With the texts from before an action (before), the amounts must also have
+    # changed from them - or stayed put for changeGraceMs, for actions the server rejects.
+    SUMMARY_SETTLED_CONDITION = _SUMMARY_READ_JS + """
+        const texts = read(args[0]), now = performance.now(), key = JSON.stringify(texts);
+        const before = args[3];
+        let state = window.__qrSummaryWait;
+        if (!state || state.token !== args[2]) {
+            state = window.__qrSummaryWait = {token: args[2], key: key, since: now, start: now, changed: false};
+        } else if (state.key !== key) {
+            state.key = key;
+            state.since = now;
+        }
+        if (before && args[0].some(([name]) => texts[name] !== before[name])) { state.changed = true; }
+        const filled = texts.subtotal && texts.subtotal !== '$0.00' && texts.total;
+        const updated = !before || state.changed || now - state.start >= args[4];
+        return (filled && updated && now - state.since >= args[1]) ? texts : null;
+    """
+    SUMMARY_READ_SCRIPT = _SUMMARY_READ_JS + "return read(arguments[0]);"
+
+    @allure.step("Read checkout summary")
+    def read_summary(self, refresh=False, quiet_ms=300, timeout=10, change_grace_ms=2000):
+        """
+        Wait once for the checkout summary to settle and read every amount in one script.
+
+        After a tip, charity or pay action the read first waits for the recalculation
+        request (network idle, capped at LOADER_NETWORK_TIMEOUT) and then for the amounts
+        to differ from those shown before the action.
+
+        Args:
+            refresh: Ignore the cached summary
+            quiet_ms: Milliseconds without any amount change that count as settled
+            timeout: Maximum seconds to wait for the summary
+            change_grace_ms: After an action, accept unchanged amounts once this long has
+                             passed (e.g. a negative tip the server rejects)
+
+        Returns:
+            dict: subtotal, tax, tip, donation, service_charge, total as Decimal
+                  (rows not shown on the page read as 0), plus 'settled' (bool)
+        """
+        if self._summary is not None and not refresh:
+            return self._summary
+
+        fields = self._summary_fields()
+        before, self._texts_before_action = self._texts_before_action, None
+        start = time.time()
+        if before is not None:
+            self.wait_for_network_idle(timeout=min(timeout, self.LOADER_NETWORK_TIMEOUT))
+        texts = poll_in_browser(
+            self.driver, self.SUMMARY_SETTLED_CONDITION,
+            [fields, quiet_ms, str(start), before, change_grace_ms],
+            max(1, timeout - (time.time() - start)), "CheckoutPage.read_summary:poll_in_browser"
+        )
+        # Replaces the fixed 1s sleep get_total() used before reading
+        sleep_tracker.record("CheckoutPage.read_summary", 1, time.time() - start)
+        settled = texts is not None
+        if not settled:
+            self.logger.warning(f"Checkout summary did not settle within {timeout}s - reading it as shown")
+            texts = self.driver.execute_script(self.SUMMARY_READ_SCRIPT, fields)
+
+        summary = {
+            name: self.parse_decimal(texts[name]) if texts.get(name) else Decimal('0.00')
+            for name in self.SUMMARY_FIELDS
+        }
+        summary['settled'] = settled
+
+        lines = [f"{name.replace('_', ' ').title():<16} ${summary[name]:.2f}" for name in self.SUMMARY_FIELDS]
+        if not settled:
+            lines.append(f"⚠️ Summary still changing after {timeout}s")
+        self.logger.info("Checkout summary: " + ", ".join(
+            f"{name} ${summary[name]:.2f}" for name in self.SUMMARY_FIELDS
+        ))
+        self.attach_note("\n".join(lines), name="Checkout Summary")
+        self.attach_screenshot("Checkout summary")
+
+        self._summary = summary
+        return summary
+
+    def _summary_fields(self):
+        return [[name, self._script_locator(locator)] for name, locator in self.SUMMARY_FIELDS.items()]
+
+    def invalidate_summary(self):
+        """
+        Force the next read to come from the page. Call right before changing tip, charity
+        or items: the amounts shown now are kept so the next read waits for them to update.
+        """
+        self._summary = None
+        try:
+            self._texts_before_action = self.driver.execute_script(self.SUMMARY_READ_SCRIPT, self._summary_fields())
+        except Exception as e:
+            self.logger.debug(f"Could not read the summary before the action: {str(e)}")
+            self._texts_before_action = None
 
     @allure.step("Manage tips")
     def manage_tips(self, amount=None, manual_roundup = False):
         self.logger.info("managing tips")
+        self.invalidate_summary()
         try:
             if manual_roundup:
                 self.click(CheckoutPageLocators.TIP_CUSTOM)
@@ -54,9 +177,9 @@ class CheckoutPage(BasePage):
 
     @allure.step("Manage charity")
     def apply_charity(self):
+        self.invalidate_summary()
         self.click(CheckoutPageLocators.CHARITY_TOGGLE)
-        applied_charity = self.get_text_3(CheckoutPageLocators.CHARITY_AMOUNT)
-        applied_charity = float(applied_charity.replace('$','').strip())
+        applied_charity = self.read_amount(CheckoutPageLocators.CHARITY_AMOUNT)
         self.attach_screenshot("After applying the charity")
         self.attach_note(f"Charity amount: ${applied_charity}")
         return applied_charity
@@ -96,6 +219,7 @@ class CheckoutPage(BasePage):
 
     @allure.step("Navigate to payment page")
     def go_to_payment_page(self, upsell=False):
+        self.invalidate_summary()
 
         # Click PAY button
         self.click(CheckoutPageLocators.PAY_BUTTON)
@@ -113,8 +237,7 @@ class CheckoutPage(BasePage):
                 info['name'] = upsell_item_name
                 self.logger.info(f"Upsell item name: {upsell_item_name}")
                 if self.is_element_displayed(CheckoutPageLocators.UPSELL_ITEM_PRICE):
-                    price_text = self.get_text(CheckoutPageLocators.UPSELL_ITEM_PRICE)
-                    upsell_price = float(price_text.replace('$', '').replace(',', ''))
+                    upsell_price = self.read_amount(CheckoutPageLocators.UPSELL_ITEM_PRICE, wait_for_text=False)
                     self.logger.info(f"Upsell price: {upsell_price:.2f}")
                     info['price'] = upsell_price
                 self.attach_screenshot(f"Selected upsell item: {info['name']} - ${info['price']:.2f}")
@@ -137,19 +260,7 @@ class CheckoutPage(BasePage):
                 pass
 
     def get_tip_amount(self):
-        try:
-            self.is_element_displayed(CheckoutPageLocators.SUBTOTAL_VALUE, timeout=5)
-
-            tip_value = self.get_text_3(CheckoutPageLocators.TIPS_VALUE)
-            tip_value = float(tip_value.replace('$', '').strip())
-
-            self.logger.info(f"Tip retrieved from checkout: ${tip_value:.2f}")
-
-
-            return tip_value
-        except Exception as e:
-            self.logger.error(f"Failed to get subtotal from checkout: {str(e)}")
-            self.logger.exception(f"Failed to get subtotal from checkout: {str(e)}")
+        return self._summary_amount('tip')
 
     def verify_initial_tip_amount(self):
         if self.get_tip_amount() == 0.00:
@@ -158,109 +269,40 @@ class CheckoutPage(BasePage):
         return True
 
 
-    @allure.step("Get tax amount from checkout page")
-    def get_tax_amount(self):
+    def _summary_amount(self, name):
+        """One amount of the cached summary as float (what the tests compare against)"""
         try:
-            self.is_element_displayed(CheckoutPageLocators.TAXES_VALUE, timeout=5)
-
-            tax_value = self.get_text_3(CheckoutPageLocators.TAXES_VALUE)
-            tax_value = float(tax_value.replace('$', '').strip())
-
-            self.logger.info(f"Tip retrieved from checkout: ${tax_value:.2f}")
-            self.attach_note(f"Tip: ${tax_value:.2f}")
-
-            return tax_value
+            return float(self.read_summary()[name])
         except Exception as e:
-            self.logger.error(f"Failed to get tax from checkout: {str(e)}")
-            self.logger.exception(f"Failed to get tax from checkout: {str(e)}")
-
-    def get_donation_amount(self):
-        if self.is_element_present(CheckoutPageLocators.DONATION_VALUE, timeout=1):
-            try:
-                self.is_element_displayed(CheckoutPageLocators.DONATION_VALUE, timeout=5)
-
-                donation_value = self.get_text_3(CheckoutPageLocators.DONATION_VALUE)
-                donation_value = float(donation_value.replace('$', '').strip())
+            self.logger.error(f"Failed to get {name} from checkout: {str(e)}")
+            self.logger.exception(f"Failed to get {name} from checkout: {str(e)}")
 
-                self.logger.info(f"Tip retrieved from checkout: ${donation_value:.2f}")
-                self.attach_note(f"Tip: ${donation_value:.2f}")
+    def get_tax_amount(self):
+        return self._summary_amount('tax')
 
-                return donation_value
-            except Exception as e:
-                self.logger.error(f"Failed to get donation value from checkout: {str(e)}")
-                self.logger.exception(f"Failed to get donation value from checkout: {str(e)}")
-        return 0.00
+    def get_donation_amount(self):
+        return self._summary_amount('donation')
 
     def get_service_charge_amount(self):
-        if self.is_element_present(CheckoutPageLocators.SERVICE_CHARGE_VALUE, timeout=1):
-            try:
-                self.is_element_displayed(CheckoutPageLocators.SERVICE_CHARGE_VALUE, timeout=5)
-
-                service_charge_value = self.get_text_3(CheckoutPageLocators.SERVICE_CHARGE_VALUE)
-                service_charge_value = float(service_charge_value.replace('$', '').strip())
-
-                self.logger.info(f"Service charge retrieved from checkout: ${service_charge_value:.2f}")
+        return self._summary_amount('service_charge')
 
-                return service_charge_value
-            except Exception as e:
-                self.logger.error(f"Failed to get service charge value from checkout: {str(e)}")
-                self.logger.exception(f"Failed to get service charge value from checkout: {str(e)}")
-        return 0.00
-
-
-    @allure.step("Get subtotal from checkout page")
     def get_subtotal(self):
-        try:
-            self.is_element_displayed(CheckoutPageLocators.SUBTOTAL_VALUE, timeout=5)
-            self.logger.info("Subtotal element is displayed")
-
-            app_subtotal = self.wait_for_value_to_update(
-                CheckoutPageLocators.SUBTOTAL_VALUE,
-                initial_value="$0.00",
-                timeout=10,
-                name="Subtotal"
-            )
-            app_subtotal_value = float(app_subtotal.replace('$', '').strip())
-
-            self.logger.info(f"Subtotal retrieved from checkout: ${app_subtotal_value:.2f}")
-            self.attach_note(f"Subtotal: ${app_subtotal_value:.2f}")
-            self.attach_screenshot("Subtotal on checkout page")
-            return app_subtotal_value
-        except Exception as e:
-            self.logger.error(f"Failed to get subtotal from checkout: {str(e)}")
-            self.logger.exception(f"Failed to get subtotal from checkout: {str(e)}")
-
+        return self._summary_amount('subtotal')
 
-    @allure.step("Get total from checkout page")
     def get_total(self):
-        try:
-            self.is_element_displayed(CheckoutPageLocators.TOTAL_VALUE, timeout=5)
-            time.sleep(1)
-            total_value = self.get_text_3(CheckoutPageLocators.TOTAL_VALUE)
-            total_value = float(total_value.replace('$', '').strip())
-
-            self.logger.info(f"Total retrieved from checkout: ${total_value:.2f}")
-            self.attach_note(f"Total: ${total_value:.2f}")
-
-            return total_value
-        except Exception as e:
-            self.logger.error(f"Failed to get total from checkout: {str(e)}")
-            self.logger.exception(f"Failed to get total from checkout: {str(e)}")
+        return self._summary_amount('total')
 
 
     def choose_cash_tip(self):
+        self.invalidate_summary()
         self.click(CheckoutPageLocators.CASH_TIP)
 
     def calculate_expected_total(self):
+        summary = self.read_summary(refresh=True)
+        subtotal, tax, tip = summary['subtotal'], summary['tax'], summary['tip']
+        donation, service_charge, total = summary['donation'], summary['service_charge'], summary['total']
 
-        subtotal = self.get_subtotal()
-        tax = self.get_tax_amount()
-        tip = self.get_tip_amount()
-        donation = self.get_donation_amount()
-        service_charge = self.get_service_charge_amount()
-        total = self.get_total()
-
-        calculated_total = round(subtotal + tax + tip + donation + service_charge, 2)
+        calculated_total = subtotal + tax + tip + donation + service_charge
         self.logger.info(
             f"Calculated total: ${calculated_total:.2f} "
             f"(${subtotal:.2f} + ${tax:.2f} + ${tip:.2f} + ${donation:.2f} + ${service_charge:.2f})"
@@ -268,8 +310,3 @@ class CheckoutPage(BasePage):
         if calculated_total == total:
             return True
         return False
-
-
-
-
-
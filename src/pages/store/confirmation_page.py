@@ -18,8 +18,7 @@ class ConfirmationPage(BasePage):
 
     def get_subtotal(self):
         try:
-            text = self.get_text(ConfirmationPageLocators.SUBTOTAL)
-            value = float(text.replace('$', '').strip())
+            value = self.read_amount(ConfirmationPageLocators.SUBTOTAL)
             self.logger.debug(f"Subtotal: ${value:.2f}")
             return value
         except Exception as e:
@@ -29,8 +28,7 @@ class ConfirmationPage(BasePage):
     def get_tax(self):
 
         try:
-            text = self.get_text(ConfirmationPageLocators.TAX)
-            value = float(text.replace('$', '').strip())
+            value = self.read_amount(ConfirmationPageLocators.TAX)
             self.logger.debug(f"Tax: ${value:.2f}")
             return value
         except Exception as e:
@@ -40,8 +38,7 @@ class ConfirmationPage(BasePage):
     def get_tip(self):
         if self.is_element_present(ConfirmationPageLocators.TIP, timeout=1):
             try:
-                text = self.get_text(ConfirmationPageLocators.TIP)
-                value = float(text.replace('$', '').strip())
+                value = self.read_amount(ConfirmationPageLocators.TIP)
                 self.logger.debug(f"Tip: ${value:.2f}")
                 return value
             except Exception as e:
@@ -51,8 +48,7 @@ class ConfirmationPage(BasePage):
     def get_donation(self):
         if self.is_element_present(ConfirmationPageLocators.DONATION, timeout=1):
             try:
-                text = self.get_text(ConfirmationPageLocators.DONATION)
-                value = float(text.replace('$', '').strip())
+                value = self.read_amount(ConfirmationPageLocators.DONATION)
                 self.logger.debug(f"Donation: ${value:.2f}")
                 return value
             except Exception as e:
@@ -62,8 +58,7 @@ class ConfirmationPage(BasePage):
     def get_service_charge(self):
         if self.is_element_present(ConfirmationPageLocators.SERVICE_CHARGE, timeout=1):
             try:
-                text = self.get_text(ConfirmationPageLocators.SERVICE_CHARGE)
-                value = float(text.replace('$', '').strip())
+                value = self.read_amount(ConfirmationPageLocators.SERVICE_CHARGE)
                 self.logger.debug(f"SERVICE_CHARGE: ${value:.2f}")
                 return value
             except Exception as e:
@@ -72,8 +67,7 @@ class ConfirmationPage(BasePage):
 
     def get_total(self):
         try:
-            text = self.get_text(ConfirmationPageLocators.TOTAL)
-            value = float(text.replace('$', '').strip())
+            value = self.read_amount(ConfirmationPageLocators.TOTAL)
             self.logger.debug(f"Total: ${value:.2f}")
             return value
         except Exception as e:
@@ -1,4 +1,3 @@
-import time
 from selenium.common import TimeoutException
 from src.pages.base_page import BasePage
 from src.locators.store_locators import (MenuPageLocators)
@@ -6,7 +5,22 @@ import random
 from selenium.webdriver.common.by import By
 from src.utils.logger import Logger
 from src.data.endpoints.get_details import get_check_details
+from src.data.endpoints.get_menu import get_orderable_items, get_full_menu, get_menu_categories
+from src.utils.polling import poll_in_browser
+from src.utils.performance_metrics import startup_metrics
+from src.utils.screenshot_service import screenshot_service
+from src.utils.menu_snapshot import MenuSnapshot, SNAPSHOT_SCRIPT, VERSION_SCRIPT
+from src.utils.command_profiler import command_profiler
+from src.utils.modifier_planner import plan_modifiers, APPLY_MODIFIERS_SCRIPT
+from src.utils.search_oracle import SearchOracle
+from src.utils.sleep_tracker import sleep_tracker
+from src.utils.badge_ledger import BadgeLedger
 import allure
+import pytest_check as check
+import json
+import os
+import sys
+import time
 
 
 
@@ -18,6 +32,16 @@ class MenuPage(BasePage):
         self.cart_items = {}
         self.logger = Logger("MenuPage")
         self.reorder = 0
+        self._snapshot = None
+        self._search_oracle = None
+        self.search_checks = {}
+        self.badge_ledger = BadgeLedger(self, {
+            'itemBadge': '.menu-item-add-count',
+            'itemOwner': '[id^="add-item-"]',
+            'ownerPrefix': 'add-item-',
+            'cartBadge': self._script_locator(MenuPageLocators.CART_BADGE)[1],
+            'addButton': self._script_locator(MenuPageLocators.ADD_BUTTON)[1],
+        })
 
     @allure.step("Navigate to main page")
     def navigate_to_main_menu(self):
@@ -26,12 +50,195 @@ class MenuPage(BasePage):
             if self.is_element_present(MenuPageLocators.INITIAL_BUTTON,timeout=2, initial_delay=1):
                 self.click(MenuPageLocators.INITIAL_BUTTON)
             self.logger.info("Successfully navigated to main menu")
-            while not self.find_elements(MenuPageLocators.MENU_ITEMS):
-                self.driver.refresh()
-                time.sleep(1)
         except Exception as e:
             self.logger.exception(f"Failed to navigate to main menu: {str(e)}")
+        self.wait_until_menu_ready()
+
+    # Menu rows rendered and visible with no spinner; clicks through the landing page after a reload
+    MENU_READY_CONDITION = BasePage._VISIBLE_JS + """
+        const landing = document.querySelector(args.landing);
+        if (args.passLanding && visible(landing)) { landing.click(); return null; }
+        const rows = Array.from(document.querySelectorAll(args.rows));
+        if (!rows.some(visible)) { return null; }
+        if (Array.from(document.querySelectorAll(args.loader)).some(visible)) { return null; }
+        return {rows: rows.length, sinceNavigationMs: Math.round(performance.now())};
+    """
+
+    MENU_DIAGNOSTICS_SCRIPT = """
+        const count = (selector) => document.querySelectorAll(selector).length;
+        return {
+            url: location.href,
+            title: document.title,
+            readyState: document.readyState,
+            sinceNavigationMs: Math.round(performance.now()),
+            menuRows: count(arguments[0]),
+            loaders: count(arguments[1]),
+            landingButton: count(arguments[2]) > 0,
+            bodyText: (document.body ? document.body.innerText : '').slice(0, 500)
+        };
+    """
+
+    def wait_until_menu_ready(self, timeout: float = 15, max_reloads: int = 2, backoff: float = 1.5) -> dict:
+        """
+        Wait until the menu is interactive, reloading a bounded number of times.
+
+        Each attempt waits longer than the one before (timeout, timeout * backoff, ...),
+        so a slow render is waited out rather than reloaded away. Time-to-interactive
+        and the reload count go to the startup metrics.
+
+        Args:
+            timeout: Seconds the first attempt waits for the menu
+            max_reloads: Page reloads allowed after the first attempt
+            backoff: Growth of the wait per reload
+
+        Returns:
+            dict: rows, reloads, waited (s) and sinceNavigationMs of the ready page
+
+        Raises:
+            TimeoutException: Menu not ready within the budget (diagnostics attached)
+        """
+        start = time.time()
+        args = {
+            'rows': self._script_locator(MenuPageLocators.MENU_ITEMS)[1],
+            'loader': self._script_locator(MenuPageLocators.LOADER)[1],
+            'landing': self._script_locator(MenuPageLocators.INITIAL_BUTTON)[1],
+            'passLanding': False,
+        }
+
+        for reloads in range(max_reloads + 1):
+            if reloads:
+                self.logger.warning(f"Menu not rendered - reloading ({reloads}/{max_reloads})")
+                self.driver.refresh()
+                args['passLanding'] = True
+
+            ready = poll_in_browser(self.driver, self.MENU_READY_CONDITION, args,
+                                    timeout * backoff ** reloads, "MenuPage.wait_until_menu_ready")
+            if ready:
+                ready.update({'reloads': reloads, 'waited': round(time.time() - start, 3)})
+                startup_metrics.get_or_create("Menu Ready").add_timing(ready['waited'], ready.copy())
+                self.logger.info(
+                    f"Menu ready: {ready['rows']} rows after {ready['waited']:.2f}s "
+                    f"({ready['sinceNavigationMs']}ms since navigation, {reloads} reload(s))"
+                )
+                if reloads:
+                    self.attach_note(
+                        f"Menu needed {reloads} reload(s): ready after {ready['waited']:.2f}s, "
+                        f"{ready['rows']} rows", name="🍽️ Menu Ready"
+                    )
+                return ready
+
+        waited = time.time() - start
+        startup_metrics.get_or_create("Menu Ready (failed)").add_timing(waited, {'reloads': max_reloads})
+        diagnostics = self._menu_diagnostics()
+        raise TimeoutException(
+            f"Menu not ready after {waited:.1f}s and {max_reloads} reload(s): "
+            f"url={diagnostics.get('url')}, rows={diagnostics.get('menuRows')}, "
+            f"loaders={diagnostics.get('loaders')}, readyState={diagnostics.get('readyState')}"
+        )
+
+    def _menu_diagnostics(self) -> dict:
+        """Attach page state, pending API calls, console errors and a screenshot for a menu that never rendered"""
+        diagnostics = {}
+        try:
+            diagnostics = self.driver.execute_script(
+                self.MENU_DIAGNOSTICS_SCRIPT,
+                self._script_locator(MenuPageLocators.MENU_ITEMS)[1],
+                self._script_locator(MenuPageLocators.LOADER)[1],
+                self._script_locator(MenuPageLocators.INITIAL_BUTTON)[1]
+            )
+        except Exception as e:
+            diagnostics['script_error'] = str(e)
+
+        try:
+            network = self.wait_for_network_idle(idle_ms=300, timeout=3, name="menu diagnostics")
+            diagnostics['pending_calls'] = network.get('still_pending')
+            diagnostics['blocking_call'] = network.get('blocking_call')
+        except Exception as e:
+            diagnostics['network_error'] = str(e)
+
+        try:
+            diagnostics['console_errors'] = [
+                entry['message'][:300] for entry in self.driver.get_log('browser') if entry.get('level') == 'SEVERE'
+            ][-10:]
+        except Exception:
+            diagnostics['console_errors'] = "unavailable for this browser"
+
+        self.attach_note(json.dumps(diagnostics, indent=2, default=str), name="❌ Menu Not Ready - Diagnostics")
+        try:
+            screenshot_service.submit(self.driver.get_screenshot_as_png(), "❌ Menu not ready", priority=True)
+        except Exception as e:
+            self.logger.error(f"Could not capture menu diagnostics screenshot: {e}")
+        return diagnostics
+
+
+    def snapshot(self, refresh: bool = False) -> MenuSnapshot:
+        """
+        The rendered menu as an indexed in-memory model, read in one script.
+
+        The last snapshot is reused while the page reports no DOM change since it
+        was taken (one small script to check); queries on it cost no round trips.
+
+        Args:
+            refresh: Take a new snapshot even if the cached one is current
+
+        Returns:
+            MenuSnapshot: items by id, categories with their items, badge counts, prices
+        """
+        if self._snapshot is not None and not refresh:
+            if self._snapshot.is_current(self.driver.execute_script(VERSION_SCRIPT)):
+                command_profiler.count("menu_snapshot.reused")
+                return self._snapshot
+
+        self._snapshot = MenuSnapshot(self.driver.execute_script(SNAPSHOT_SCRIPT, {
+            'row': self._script_locator(MenuPageLocators.MENU_ITEMS)[1],
+            'title': self._script_locator(MenuPageLocators.MENU_ITEM_TITLE)[1],
+            'description': self._script_locator(MenuPageLocators.MENU_ITEM_DESCRIPTION)[1],
+            'sectionTitle': self._script_locator(MenuPageLocators.MENU_SECTION_TITLE)[1],
+            'pill': self._script_locator(MenuPageLocators.CATEGORY_PILLS)[1],
+            'pillLabel': self._script_locator(MenuPageLocators.CATEGORY_LABEL)[1],
+            'itemBadge': '.menu-item-add-count',
+            'cartBadge': self._script_locator(MenuPageLocators.CART_BADGE)[1],
+        }))
+        command_profiler.count("menu_snapshot.taken")
+        self.logger.debug(
+            f"Menu snapshot: {len(self._snapshot)} items, {len(self._snapshot.categories)} categories "
+            f"(version {self._snapshot.version})"
+        )
+        return self._snapshot
+
+    def snapshot_is_dirty(self) -> bool:
+        """True when the DOM changed (or the page reloaded) since the last snapshot"""
+        if self._snapshot is None:
+            return True
+        return not self._snapshot.is_current(self.driver.execute_script(VERSION_SCRIPT))
+
+    def _catalog_items(self, num_items, snapshot):
+        """
+        Pick random orderable items from the cached catalog that are rendered on the page.
 
+        Returns:
+            list: Item dicts (id, name, element locator, catalog_price, modifier_groups),
+                  empty when the catalog is unavailable
+        """
+        catalog = get_orderable_items(exclude_alcohol=True, in_stock=True, allow_required_modifiers=False)
+        if not catalog:
+            self.logger.warning("Catalog unavailable or nothing orderable - falling back to the rendered menu")
+            return []
+
+        rendered = [item for item in catalog
+                    if snapshot.item(str(item['ID'])) and snapshot.item(str(item['ID']))['visible']]
+        self.logger.info(f"Catalog: {len(catalog)} orderable items, {len(rendered)} rendered")
+
+        return [
+            {
+                'id': str(item['ID']),
+                'name': item.get('Name') or snapshot.item(str(item['ID']))['name'],
+                'element': (By.CSS_SELECTOR, f"#add-item-{item['ID']}"),
+                'catalog_price': float(item.get('Price') or 0),
+                'modifier_groups': item.get('ModifierGroups', []),
+            }
+            for item in random.sample(rendered, min(num_items, len(rendered)))
+        ]
 
     @allure.step("Get order number")
     def order_number(self):
@@ -48,11 +255,9 @@ class MenuPage(BasePage):
     def _extract_item_info(self, item):
         """Extract item ID and name from an article element"""
         try:
-            item_id = item.get_attribute("id")
-
-            # Find the title element INSIDE this article
-            title_element = item.find_element(By.CSS_SELECTOR, '.menu-list-title')
-            item_name = title_element.text.strip()
+            # id and the title INSIDE this article in one round trip
+            [info] = self.extract(item, {'id': '@id', 'name': (MenuPageLocators.MENU_ITEM_TITLE, 'text')})
+            item_id, item_name = info['id'], info['name']
 
             self.logger.debug(f"Extracted item - ID: {item_id}, Name: {item_name}")
             return item_id, item_name
@@ -72,7 +277,7 @@ class MenuPage(BasePage):
                 return False
 
             badge_locator = (By.CSS_SELECTOR, f"#add-item-{item_id} .menu-item-add-count")
-            badge_element = self.driver.find_element(*badge_locator)
+            badge_element = self.find_element(badge_locator, timeout=0)
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", badge_element)
 
             if expected_count == 0:
@@ -134,10 +339,9 @@ class MenuPage(BasePage):
     def _increase_quantity(self, times=1):
         """Click the plus button to increase quantity"""
         try:
-            for i in range(times):
-                plus_button = self.find_element(MenuPageLocators.QTY_PLUS_BUTTON)
-                self.click(plus_button)
-                self.logger.debug(f"Clicked plus button ({i + 1}/{times})")
+            # Not idempotent - a failed batch must not be replayed on top of clicks that landed
+            self.batch("quantity change").click(MenuPageLocators.QTY_PLUS_BUTTON, times=times).perform(fallback=False)
+            self.logger.debug(f"Clicked plus button {times} time(s)")
         except Exception as e:
             self.logger.exception(f"Failed to increase quantity: {str(e)}")
 
@@ -201,6 +405,8 @@ class MenuPage(BasePage):
                 )
 
             self.logger.info(f"Adding {quantity} more of item {item_id} ({item_name})")
+            if verify_badges:
+                self.badge_ledger.install()
             self.click(item)
 
             # Handle modifiers (if modal appears)
@@ -232,11 +438,9 @@ class MenuPage(BasePage):
             )
 
             if verify_badges:
+                self.badge_ledger.record_add(item_id, item_name)
                 with allure.step(f"Verify badges after adding more of '{item_name}'"):
-                    item_badge_ok = self.verify_item_badge_count(item_id, new_count)
-                    cart_badge_ok = self.verify_cart_badge()
-                    self.attach_screenshot(f"After adding {quantity} more of '{item_name}'")
-                    return item_badge_ok and cart_badge_ok
+                    return self.verify_badges_batched(f"After adding {quantity} more of '{item_name}'")
 
             return True
 
@@ -253,43 +457,90 @@ class MenuPage(BasePage):
             self.logger.exception(f"Failed to add more of item {item_id}: {str(e)}")
             return False
 
+    def verify_badges_batched(self, screenshot_name=None):
+        """
+        Check every item badge and the cart badge against the ledger in one script.
+
+        Returns:
+            bool: True when all badges show the expected counts
+        """
+        result = self.badge_ledger.verify()
+        if screenshot_name:
+            self.attach_screenshot(screenshot_name)
+        if not result['matched']:
+            self.attach_note(self.badge_ledger.get_report(), name="❌ Badge Mismatch")
+        return result['matched']
+
     @allure.step("Select {num_items} random menu items")
-    def select_random_menu_items(self, num_items=2, quantity=1, verify_badges=True):
+    def select_random_menu_items(self, num_items=2, quantity=1, verify_badges=True, source=None, badge_check=None):
+        """
+        Add random menu items to the cart.
 
-        self.logger.info(f"Starting to select {num_items} random menu items (qty: {quantity} each)")
+        Args:
+            num_items: Number of distinct items to add
+            quantity: Quantity of each item
+            verify_badges: Check item and cart badges against the badge ledger
+            source: "dom" picks from the rendered menu; "catalog" picks active, in-stock,
+                    non-alcohol items without required modifiers from get_full_menu()
+                    and soft-checks the UI price against the catalog (env: MENU_ITEM_SOURCE,
+                    default dom)
+            badge_check: "each" verifies all badges after every add, "end" once after
+                         the last add (env: BADGE_CHECK, default each)
+        """
+        source = source or os.environ.get("MENU_ITEM_SOURCE", "dom")
+        badge_check = badge_check or os.environ.get("BADGE_CHECK", "each")
+        self.logger.info(f"Starting to select {num_items} random menu items (qty: {quantity} each, source: {source})")
+        self.wait_until_menu_ready()
+        if verify_badges:
+            self.badge_ledger.install()
         try:
-            while not self.find_elements(MenuPageLocators.MENU_ITEMS):
-                self.driver.refresh()
-                time.sleep(1)
-            items = self.find_elements(MenuPageLocators.ITEMS)
+            snapshot = self.snapshot()
 
-            if not items:
+            if not len(snapshot):
                 return {'items': [], 'total': 0.0, 'count': 0}
 
-            self.logger.debug(f"Found {len(items)} menu items")
-            random.shuffle(items)
-            selected_items = items[:min(num_items, len(items))]
+            self.logger.debug(f"Found {len(snapshot)} menu items")
+            selected_items = self._catalog_items(num_items, snapshot) if source == "catalog" else None
+            if not selected_items:
+                selected_items = snapshot.random_items(num_items)
 
             item_details = []
             total_price = 0.0
 
             for index, item in enumerate(selected_items, 1):
                 try:
-                    item_id, item_name = self._extract_item_info(item)
+                    item_id, item_name = item['id'], item['name']
                     self.logger.debug(f"Processing item - ID: {item_id}, Name: {item_name}")
 
-                    self.click(item)
+                    self.click(item['element'])
 
                     if self.is_element_displayed(MenuPageLocators.ITEM_PRICE):
-                        price_text = self.get_text(MenuPageLocators.ITEM_PRICE)
-                        base_price = float(price_text.replace('$', '').replace(',', ''))
+                        base_price = self.read_amount(MenuPageLocators.ITEM_PRICE, wait_for_text=False)
                     else:
                         base_price = 0.0
 
+                    # The UI price stays the source of truth; a catalog pick only cross-checks it
+                    if item.get('catalog_price') is not None:
+                        price_matches = abs(base_price - item['catalog_price']) <= 0.005
+                        if not price_matches:
+                            self.logger.warning(
+                                f"Price mismatch for '{item_name}': catalog ${item['catalog_price']:.2f}, UI ${base_price:.2f}"
+                            )
+                            self.attach_note(
+                                f"Item: {item_name} ({item_id})\n"
+                                f"Catalog price: ${item['catalog_price']:.2f}\n"
+                                f"UI price: ${base_price:.2f}",
+                                name="⚠️ Catalog Price Mismatch"
+                            )
+                        check.is_true(
+                            price_matches,
+                            f"'{item_name}' shows ${base_price:.2f}, catalog price is ${item['catalog_price']:.2f}"
+                        )
+
                     self.logger.debug(f"Item: {item_name}, Base price: ${base_price}")
 
                     with allure.step(f"Select modifiers for '{item_name}'"):
-                        selected_modifiers, modifier_cost = self._handle_all_modifiers()
+                        selected_modifiers, modifier_cost = self._handle_all_modifiers(item.get('modifier_groups'))
                         self.attach_screenshot(f"After selecting modifiers for '{item_name}'")
 
                     # Increase quantity if more than 1
@@ -323,22 +574,23 @@ class MenuPage(BasePage):
 
                     # Verify badges after adding
                     if verify_badges and item_id:
-                        with allure.step(f"Verify badges for '{item_name}'"):
-                            expected_item_count = self.cart_items[item_id]
-                            item_badge_ok = self.verify_item_badge_count(item_id, expected_item_count)
-                            if not item_badge_ok:
-                                self.logger.warning(f"Item badge verification failed for {item_id}")
-
-                            cart_badge_ok = self.verify_cart_badge()
-                            if not cart_badge_ok:
-                                self.logger.warning("Cart badge verification failed")
-
-                            self.attach_screenshot(f"Badge verification for '{item_name}'")
+                        self.badge_ledger.record_add(item_id, item_name)
+                        if badge_check == "each":
+                            with allure.step(f"Verify badges for '{item_name}'"):
+                                self.verify_badges_batched(f"Badge verification for '{item_name}'")
 
                 except Exception as e:
                     self.logger.exception(f"Failed to process item {index}: {str(e)}")
                     continue
 
+            if verify_badges and self.badge_ledger.entries:
+                if badge_check == "end":
+                    with allure.step("Verify all badges"):
+                        self.verify_badges_batched("Badge verification")
+                report = self.badge_ledger.get_report()
+                if report:
+                    self.attach_note(report, name="🏷️ Badge Ledger")
+
             result = {
                 'items': item_details,
                 'total': round(total_price, 3),
@@ -353,7 +605,87 @@ class MenuPage(BasePage):
             self.logger.exception(f"Failed to select random menu items: {str(e)}")
 
 
-    def _handle_all_modifiers(self):
+    def _apply_modifier_plan(self, modifier_groups):
+        """
+        Select modifiers planned from catalog data with one in-page script.
+
+        Args:
+            modifier_groups: Catalog ModifierGroups of the open item
+
+        Returns:
+            tuple: (selected modifiers, cost) confirmed by the modal, or None when the
+                   plan could not be applied (nothing was clicked) and the DOM-driven
+                   selection should run
+        """
+        plan = plan_modifiers(modifier_groups)
+        if plan['unsatisfiable']:
+            self.logger.warning(f"Catalog can't satisfy modifier groups: {plan['unsatisfiable']}")
+            return None
+        if not plan['groups']:
+            return [], 0.0
+
+        result = self.driver.execute_async_script(APPLY_MODIFIERS_SCRIPT, plan['groups'], {
+            'modal': '.mod-card',
+            'header': '.mod-group-title',
+            'option': 'button.mod-option-row',
+            'label': self._script_locator(MenuPageLocators.MODIFIER_NAME)[1],
+            'price': self._script_locator(MenuPageLocators.MODIFIER_PRICE)[1],
+        })
+        if not result['modal'] or result['missing']:
+            self.logger.warning(f"Modifier plan not applicable (modal: {result['modal']}, missing: {result['missing']})")
+            return None
+
+        selected = []
+        for option in result['selected']:
+            try:
+                price = self.parse_currency(option['priceText']) if option['priceText'] else 0.0
+            except ValueError:
+                price = 0.0
+            selected.append({'section': option['section'], 'name': option['name'], 'price': price})
+
+        displayed_cost = round(sum(option['price'] for option in selected), 2)
+        if abs(displayed_cost - plan['expected_cost']) > 0.005:
+            self.logger.warning(
+                f"Modifier cost mismatch: catalog ${plan['expected_cost']:.2f}, modal ${displayed_cost:.2f}"
+            )
+            self.attach_note(
+                "Planned:\n" + "\n".join(
+                    f"  {group['name']}: {modifier['name']} (${modifier['price']:.2f})"
+                    for group in plan['groups'] for modifier in group['modifiers']
+                ) + "\nSelected in modal:\n" + "\n".join(
+                    f"  {option['section']}: {option['name']} (${option['price']:.2f})" for option in selected
+                ),
+                name="⚠️ Modifier Cost Mismatch"
+            )
+
+        self.logger.info(
+            f"Applied modifier plan: {len(selected)} modifiers in {len(plan['groups'])} groups, cost ${displayed_cost:.2f}"
+        )
+        return selected, displayed_cost
+
+    def _handle_all_modifiers(self, modifier_groups=None):
+        """
+        Select modifiers in the open item modal.
+
+        Args:
+            modifier_groups: Catalog ModifierGroups of the item; when given, the selection is
+                             planned from them and applied in one script, with the DOM-driven
+                             selection below as fallback
+
+        Returns:
+            tuple: (list of {'section', 'name', 'price'}, total modifier cost)
+        """
+        # A plan that errored mid-way may have selected options already; keep those
+        keep_pressed = False
+        if modifier_groups is not None:
+            try:
+                planned = self._apply_modifier_plan(modifier_groups)
+                if planned is not None:
+                    return planned
+            except Exception as e:
+                self.logger.warning(f"Modifier plan failed, selecting from the modal: {str(e)}")
+                keep_pressed = True
+
         try:
             modal = self.find_element((By.CSS_SELECTOR, ".mod-card"), timeout=0)
             if not modal:
@@ -403,6 +735,16 @@ class MenuPage(BasePage):
                         self.logger.info(f"No options found in section: {section_title}")  # Changed to INFO
                         continue
 
+                    if keep_pressed:
+                        pressed = [btn for btn in option_buttons if btn.get_attribute("aria-pressed") == "true"]
+                        if pressed:
+                            for btn in pressed:
+                                modifier_info = self._extract_modifier_info_new(btn, section_title)
+                                all_selected_modifiers.append(modifier_info)
+                                total_cost += modifier_info['price']
+                            self.logger.info(f"Keeping {len(pressed)} option(s) already selected in: {section_title}")
+                            continue
+
                     available_options = [btn for btn in option_buttons
                                          if btn.get_attribute("aria-pressed") == "false"]
 
@@ -501,17 +843,132 @@ class MenuPage(BasePage):
             self.logger.error(f"Failed to get table number: {str(e)}")
             self.logger.exception("Failed to get table number from the menu page")
 
+    # Result rows and the empty-state element; watch() snapshots them and counts every
+    # mutation touching them from the moment it is called (i.e. before the keyword is typed)
+    _SEARCH_WATCH_JS = BasePage._VISIBLE_JS + """
+        const resultSel = args.row + ', ' + args.empty;
+        const signature = () => Array.from(document.querySelectorAll(args.row)).filter(visible)
+            .map((row) => row.id).join(',') + '|' + visible(document.querySelector(args.empty));
+        const touchesResults = (record) => {
+            const target = record.target.nodeType === 1 ? record.target : record.target.parentElement;
+            if (target && target.closest(resultSel)) { return true; }
+            return Array.from(record.addedNodes).concat(Array.from(record.removedNodes)).some((node) =>
+                node.nodeType === 1 && (node.matches(resultSel) || node.querySelector(resultSel)));
+        };
+        const watch = () => {
+            if (window.__qrSearchWatch) { window.__qrSearchWatch.observer.disconnect(); }
+            const state = {before: signature(), start: performance.now(), mutations: 0, lastMutation: null};
+            state.observer = new MutationObserver((records) => {
+                if (records.some(touchesResults)) { state.mutations++; state.lastMutation = performance.now(); }
+            });
+            state.observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+            window.__qrSearchWatch = state;
+            return state;
+        };
+    """
+
+    SEARCH_WATCH_SCRIPT = "const args = arguments[0];" + _SEARCH_WATCH_JS + "watch();"
+
+    # Settles once the debounce window has passed, the results differ from the snapshot
+    # taken before typing (any mutation to them counts) and they have been quiet for quietMs.
+    # Unchanged results keep it waiting until the timeout.
+    SEARCH_SETTLED_SCRIPT = """
+        const args = arguments[0], done = arguments[arguments.length - 1];
+    """ + _SEARCH_WATCH_JS + """
+        const text = (node) => node ? (node.innerText || node.textContent || '').trim() : '';
+        const scriptStart = performance.now();
+        const state = window.__qrSearchWatch || watch();
+
+        (function check() {
+            const now = performance.now();
+            const changed = state.mutations > 0 || signature() !== state.before;
+            const quietSince = state.lastMutation !== null ? state.lastMutation : state.start;
+            const settled = now - state.start >= args.debounceMs && changed && now - quietSince >= args.quietMs;
+            if (!settled && now - scriptStart < args.timeoutMs) { return setTimeout(check, 25); }
+
+            state.observer.disconnect();
+            window.__qrSearchWatch = null;
+            const rows = Array.from(document.querySelectorAll(args.row)).filter(visible).map((row) => ({
+                id: row.id,
+                name: text(row.querySelector(args.title)),
+                description: text(row.querySelector(args.description))
+            }));
+            done({
+                rows: rows,
+                empty: visible(document.querySelector(args.empty)),
+                changed: changed,
+                mutations: state.mutations,
+                waitedMs: Math.round(now - scriptStart),
+                timedOut: !settled
+            });
+        })();
+    """
+
+    def _search_script_args(self):
+        return {
+            'row': self._script_locator(MenuPageLocators.MENU_ITEMS)[1],
+            'title': self._script_locator(MenuPageLocators.MENU_ITEM_TITLE)[1],
+            'description': self._script_locator(MenuPageLocators.MENU_ITEM_DESCRIPTION)[1],
+            'empty': self._script_locator(MenuPageLocators.NO_RESULTS_FOUND)[1],
+        }
+
+    def watch_search_results(self):
+        """Snapshot the displayed results and start counting their mutations; call right before typing"""
+        self.driver.execute_script(self.SEARCH_WATCH_SCRIPT, self._search_script_args())
+
+    def wait_for_search_results(self, debounce_ms=300, quiet_ms=150, timeout=5):
+        """
+        Wait for the search results to settle after typing and read them in the same round trip.
+
+        The results count as changed once any mutation touched them after watch_search_results()
+        (or after this call, without a watch) or once they differ from the snapshot it took.
+        Results that never change are returned at the timeout, flagged timedOut.
+
+        Args:
+            debounce_ms: Search input debounce; nothing is read before it has passed
+            quiet_ms: Quiet time required after the last change
+            timeout: Hard limit in seconds
+
+        Returns:
+            dict: rows (id, name, description), empty, changed, mutations, waitedMs, timedOut
+        """
+        result = self.driver.execute_async_script(self.SEARCH_SETTLED_SCRIPT, {
+            'debounceMs': debounce_ms,
+            'quietMs': quiet_ms,
+            'timeoutMs': timeout * 1000,
+            **self._search_script_args(),
+        })
+        # Accounted like the fixed 1s settle it replaces
+        sleep_tracker.record(f"MenuPage.{sys._getframe(1).f_code.co_name}", 1, result['waitedMs'] / 1000)
+        if result['timedOut']:
+            if result['changed']:
+                self.logger.warning(f"Search results still changing after {timeout}s ({result['mutations']} mutations)")
+            else:
+                self.logger.warning(f"Search results did not change within {timeout}s")
+        return result
+
+    def search_oracle(self, refresh=False):
+        """Search oracle over the cached catalog (None when the catalog is unavailable)"""
+        if self._search_oracle is None or refresh:
+            self._search_oracle = SearchOracle.from_catalog(get_full_menu(cached=True))
+        return self._search_oracle
+
     def search_multiple_keywords(self, keywords: list[str]) -> dict:
         """
         Search for multiple keywords and return results.
         Keeps search open and just clears field between keywords.
         Handles cases where no results are found gracefully.
+
+        Displayed results are also compared with the search oracle (catalog items
+        rendered on this page); comparisons are kept in self.search_checks.
         """
-        while not self.find_elements(MenuPageLocators.MENU_ITEMS):
-            self.driver.refresh()
-            time.sleep(1)
+        self.wait_until_menu_ready()
 
         all_results = {}
+        self.search_checks = {}
+        oracle = self.search_oracle()
+        # Only items the page renders can show up in its search
+        rendered_ids = set(self.snapshot().items) if oracle else None
 
         try:
             for idx, keyword in enumerate(keywords):
@@ -522,27 +979,21 @@ class MenuPage(BasePage):
                         if search_button:
                             self.click(search_button)
 
-                    # Get search input and search for keyword
-                    search_input = self.wait_for_element_visible(MenuPageLocators.SEARCH_INPUT)
-                    search_input.clear()
-                    self.send_keys(MenuPageLocators.SEARCH_INPUT, keyword)
+                    # Type the keyword (select-all replaces the previous one) and read the settled results
+                    self.watch_search_results()
+                    self.batch("search input").type(MenuPageLocators.SEARCH_INPUT, keyword).perform()
                     self.logger.info(f"Searching for '{keyword}'")
-                    time.sleep(1)
-
-                    # Check if "No items found" message appears
-                    try:
-                        no_results = self.driver.find_element(By.CSS_SELECTOR, ".menu-empty")
-                        if no_results.is_displayed():
-                            self.logger.info(f"No results found for '{keyword}'")
-                            self.attach_screenshot(f"No results for '{keyword}'")
-                            all_results[keyword] = []
-                            # Just continue to next keyword (keep search open, field will clear in next iteration)
-                            continue
-                    except:
-                        pass  # Element not found, proceed with normal search
-
-                    # Normal search results
-                    results = self.find_elements(MenuPageLocators.MENU_ITEMS)
+                    settled = self.wait_for_search_results()
+                    results = [] if settled['empty'] else settled['rows']
+
+                    if oracle:
+                        comparison = oracle.compare(keyword, [row['id'] for row in results], within=rendered_ids)
+                        self.search_checks[keyword] = comparison
+                        if comparison['missing'] or comparison['unexpected']:
+                            self.logger.warning(
+                                f"Search '{keyword}' differs from the catalog: missing {comparison['missing']}, "
+                                f"unexpected {comparison['unexpected']}"
+                            )
 
                     if not results:
                         # Double-check: no results and no menu-empty div
@@ -555,23 +1006,8 @@ class MenuPage(BasePage):
                     self.attach_screenshot(f"Results for '{keyword}'")
                     result_texts = []
 
-                    for result in results:
-                        name = description = ""
-                        try:
-                            name_elem = result.find_element(*MenuPageLocators.MENU_ITEM_TITLE)
-                            name = name_elem.text.strip()
-                            self.logger.debug(f"Found name: {name}")
-                        except Exception:
-                            pass
-
-                        try:
-                            desc_elem = result.find_element(*MenuPageLocators.MENU_ITEM_DESCRIPTION)
-                            description = desc_elem.text.strip()
-                            self.logger.debug(f"Found description: {description}")
-                        except Exception:
-                            pass
-
-                        full_text = f"{name} {description}".strip()
+                    for row in results:
+                        full_text = f"{row['name'] or ''} {row['description'] or ''}".strip()
                         result_texts.append(full_text)
                         self.logger.debug(f"Found search result: {full_text}")
 
@@ -586,21 +1022,22 @@ class MenuPage(BasePage):
         except Exception as e:
             self.logger.exception(f"Failed during multi-search: {str(e)}")
         finally:
+            if self.search_checks:
+                self.attach_note(SearchOracle.format_comparisons(list(self.search_checks.values())),
+                                 name="🔎 Search Oracle")
+
             # Close search after ALL keywords are done
             try:
                 search_input = self.driver.find_element(*MenuPageLocators.SEARCH_INPUT)
                 search_input.clear()
-                time.sleep(0.3)
+                self.wait_for_dom_stable(quiet_ms=150, replaces=0.3)
             except:
                 pass
 
         return all_results
 
     def category_navigation_sync(self):
-        while not self.find_elements(MenuPageLocators.MENU_ITEMS):
-            self.driver.refresh()
-            time.sleep(1)
-            self.logger.info(f"Searching for '{MenuPageLocators.MENU_ITEMS}'")
+        self.wait_until_menu_ready()
         categories = self.find_elements((By.CSS_SELECTOR, ".menu-category-label"))
         assert categories, "No categories found at top bar"
 
@@ -616,7 +1053,7 @@ class MenuPage(BasePage):
 
             if expected_lower not in active_text:
                 self.driver.execute_script("window.scrollBy(0, -120);")
-                time.sleep(0.5)
+                self.wait_for_dom_stable(quiet_ms=150, replaces=0.5)
                 self.find_element(MenuPageLocators.ACTIVE_CATEGORY_SLIDER).text.lower()
 
 
@@ -654,24 +1091,12 @@ class MenuPage(BasePage):
     def get_all_category_buttons(self):
 
         try:
-            category_buttons = self.find_elements(MenuPageLocators.CATEGORY_PILLS)
-            categories = []
-
-            for button in category_buttons:
-                try:
-                    category_id = button.get_attribute('id')
-                    label_element = button.find_element(*MenuPageLocators.CATEGORY_LABEL)
-                    category_name = label_element.text.strip()
-
-                    if category_id and category_name:
-                        categories.append({
-                            'element': button,
-                            'id': category_id,
-                            'name': category_name
-                        })
-                except Exception as e:
-                    self.logger.warning(f"Failed to extract category info from button: {str(e)}")
-                    continue
+            rows = self.extract(MenuPageLocators.CATEGORY_PILLS, {
+                'element': 'element',
+                'id': '@id',
+                'name': (MenuPageLocators.CATEGORY_LABEL, 'text')
+            }, timeout=60)
+            categories = [row for row in rows if row['id'] and row['name']]
 
             self.logger.info(f"Found {len(categories)} categories in UI navigation bar")
             return categories
@@ -693,18 +1118,15 @@ class MenuPage(BasePage):
             bool: True if successful, False otherwise
         """
         try:
-            category_button = self.find_element(MenuPageLocators.category_button_by_id(category_id))
+            # Pills are rendered once per menu load and only change classes, so their handles can be reused
+            category_button = self.find_element(MenuPageLocators.category_button_by_id(category_id), cached=True)
 
             if not category_button:
                 self.logger.error(f"Category button not found for '{category_name}' (ID: {category_id})")
                 return False
 
-            # Scroll into view
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", category_button)
-            time.sleep(0.2)
-
-            # Click the button
-            self.click(category_button)
+            # Scroll and click in one Actions request
+            self.batch("category jump").click(category_button).perform()
             self.logger.info(f"Clicked category '{category_name}', waiting for it to become active...")
 
             # Wait for this category to become active (DOM update)
@@ -754,13 +1176,8 @@ class MenuPage(BasePage):
             list: List of active category IDs
         """
         try:
-            active_categories = self.find_elements(MenuPageLocators.ACTIVE_CATEGORY_SLIDER)
-            active_ids = []
-
-            for cat in active_categories:
-                cat_id = cat.get_attribute('id')
-                if cat_id:
-                    active_ids.append(cat_id)
+            rows = self.extract(MenuPageLocators.ACTIVE_CATEGORY_SLIDER, {'id': '@id'})
+            active_ids = [row['id'] for row in rows if row['id']]
 
             if len(active_ids) > 1:
                 self.logger.warning(f"Multiple active categories detected: {active_ids}")
@@ -965,39 +1382,206 @@ class MenuPage(BasePage):
             self.logger.error(f"Error verifying category '{category_name}': {str(e)}")
             return results
 
+    # Observers are installed once per document; each call drives categories until its budget is spent
+    CATEGORY_NAV_SCRIPT = """
+        const args = arguments[0], done = arguments[arguments.length - 1];
+        const text = (node) => node ? (node.innerText || node.textContent || '').trim() : '';
+        const norm = (value) => (value || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+        const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+        if (!window.__qrNav) {
+            const nav = window.__qrNav = {start: performance.now(), log: [], visibleSections: new Set()};
+            nav.record = (event) => { event.t = Math.round(performance.now() - nav.start); nav.log.push(event); };
+            nav.activeIds = () => Array.from(document.querySelectorAll(args.activePill)).map((pill) => pill.id);
+
+            let lastActive = nav.activeIds().join(',');
+            new MutationObserver(() => {
+                const ids = nav.activeIds(), key = ids.join(',');
+                if (key !== lastActive) { lastActive = key; nav.record({type: 'active', ids: ids}); }
+            }).observe(document.body, {attributes: true, attributeFilter: ['class'], subtree: true});
+
+            const sections = new IntersectionObserver((entries) => {
+                for (const entry of entries) {
+                    const title = text(entry.target);
+                    if (entry.isIntersecting) { nav.visibleSections.add(title); } else { nav.visibleSections.delete(title); }
+                    nav.record({type: 'section', title: title, visible: entry.isIntersecting});
+                }
+            });
+            document.querySelectorAll(args.sectionTitle).forEach((node) => sections.observe(node));
+        }
+
+        const nav = window.__qrNav, results = [], started = performance.now();
+        let index = args.startIndex;
+        (async () => {
+            while (index < args.categories.length && performance.now() - started < args.budgetMs) {
+                const category = args.categories[index++];
+                const pill = document.getElementById(category.id);
+                nav.record({type: 'click', id: category.id, name: category.name});
+                if (!pill) { results.push({id: category.id, clicked: false}); continue; }
+
+                const clickedAt = performance.now();
+                pill.click();
+                let activeAt = null, sectionAt = null;
+                while (performance.now() - clickedAt < args.timeoutMs) {
+                    const now = performance.now();
+                    if (activeAt === null && nav.activeIds().includes(category.id)) { activeAt = now; }
+                    if (sectionAt === null && Array.from(nav.visibleSections).some(
+                            (title) => norm(title).includes(norm(category.name)))) { sectionAt = now; }
+                    if (activeAt !== null && sectionAt !== null) { break; }
+                    await sleep(16);
+                }
+                // Let smooth scrolling come to rest so the next click starts from a still page
+                await sleep(args.settleMs);
+                results.push({
+                    id: category.id,
+                    clicked: true,
+                    activeMs: activeAt === null ? null : Math.round(activeAt - clickedAt),
+                    sectionMs: sectionAt === null ? null : Math.round(sectionAt - clickedAt),
+                    activeIds: nav.activeIds()
+                });
+            }
+            done({results: results, nextIndex: index});
+        })();
+    """
+
+    @allure.step("Verify navigation of all categories")
+    def verify_all_categories_navigation(self, categories=None, timeout=7, settle_ms=300):
+        """
+        Click every category pill in sequence inside the browser and verify it in one pass.
+
+        An IntersectionObserver on the section titles and a class observer on the pills
+        record an event log (click / active pill / section visibility, with timestamps).
+        The order in which categories became active is checked against the catalog's
+        DisplayOrder of those same categories; a category that never activated is only
+        reported as such, not a second time as an order failure.
+
+        Args:
+            categories: [{'id', 'name'}] in UI order (default: get_all_category_buttons())
+            timeout: Seconds per category for its pill to activate and its section to show
+            settle_ms: Pause after each category before clicking the next one
+
+        Returns:
+            dict: {
+                'categories': {id: verify_category_navigation()-style result + active_ms/section_ms},
+                'expected_order': [activated ids in API order], 'activation_order': [ids],
+                'order_ok': bool,
+                'log': [events]
+            }
+        """
+        categories = categories or self.get_all_category_buttons()
+        payload = [{'id': category['id'], 'name': category['name']} for category in categories]
+        names = {category['id']: category['name'] for category in payload}
+
+        raw_results = []
+        index = 0
+        while index < len(payload):
+            chunk = self.driver.execute_async_script(self.CATEGORY_NAV_SCRIPT, {
+                'categories': payload,
+                'startIndex': index,
+                'budgetMs': 15000,
+                'timeoutMs': timeout * 1000,
+                'settleMs': settle_ms,
+                'activePill': self._script_locator(MenuPageLocators.ACTIVE_CATEGORY_SLIDER)[1],
+                'sectionTitle': self._script_locator(MenuPageLocators.MENU_SECTION_TITLE)[1],
+            })
+            raw_results.extend(chunk['results'])
+            index = chunk['nextIndex']
+        log = self.driver.execute_script("return window.__qrNav ? window.__qrNav.log : [];")
+
+        results = {}
+        scroll_metrics = startup_metrics.get_or_create("Category scroll")
+        for raw in raw_results:
+            active_ids = raw.get('activeIds', [])
+            results[raw['id']] = {
+                'clicked': raw['clicked'],
+                'became_active': raw.get('activeMs') is not None,
+                'section_visible': raw.get('sectionMs') is not None,
+                'active_count': len(active_ids),
+                'active_category_name': names.get(active_ids[0], active_ids[0]) if active_ids else None,
+                'active_ms': raw.get('activeMs'),
+                'section_ms': raw.get('sectionMs'),
+            }
+            if raw.get('sectionMs') is not None:
+                scroll_metrics.add_timing(raw['sectionMs'] / 1000, {'category': names[raw['id']]})
+
+        activation_order = self._activation_order(log)
+        expected_order = self._api_category_order(activation_order)
+        summary = {
+            'categories': results,
+            'expected_order': expected_order,
+            'activation_order': activation_order,
+            'order_ok': expected_order is None or activation_order == expected_order,
+            'log': log,
+        }
+        self._attach_category_navigation_report(summary, names)
+        return summary
+
+    @staticmethod
+    def _activation_order(log):
+        """Category ids in the order the log shows them becoming active after their own click"""
+        order, clicked = [], None
+        for event in log:
+            if event['type'] == 'click':
+                clicked = event['id']
+            elif event['type'] == 'active' and clicked in event['ids'] and clicked not in order:
+                order.append(clicked)
+        return order
+
+    def _api_category_order(self, ui_ids):
+        """UI category ids sorted by the API's DisplayOrder (None when the API is unavailable)"""
+        api_categories = get_menu_categories(cached=True)
+        if not api_categories:
+            return None
+        position = {str(category['ID']): index for index, category in enumerate(api_categories)}
+        return sorted((category_id for category_id in ui_ids if str(category_id) in position),
+                      key=lambda category_id: position[str(category_id)])
+
+    def _attach_category_navigation_report(self, summary, names):
+        lines = [
+            f"{'Category':<30} {'Active':<8} {'Section':<9} {'Active ms':<11} {'Scroll ms':<10}",
+            "-" * 70,
+        ]
+        for category_id, result in summary['categories'].items():
+            lines.append(
+                f"{names.get(category_id, category_id)[:30]:<30} "
+                f"{'✅' if result['became_active'] else '❌':<8} {'✅' if result['section_visible'] else '❌':<9} "
+                f"{result['active_ms'] if result['active_ms'] is not None else '-':<11} "
+                f"{result['section_ms'] if result['section_ms'] is not None else '-':<10}"
+            )
+        scroll_times = [result['section_ms'] for result in summary['categories'].values() if result['section_ms'] is not None]
+        if scroll_times:
+            lines.append("-" * 70)
+            lines.append(f"Scroll latency: avg {sum(scroll_times) / len(scroll_times):.0f}ms, max {max(scroll_times)}ms")
+        if summary['expected_order'] is not None:
+            lines.append(f"Activation order matches API DisplayOrder: {'✅' if summary['order_ok'] else '❌'}")
+            if not summary['order_ok']:
+                lines.append("  API:  " + ", ".join(names.get(i, i) for i in summary['expected_order']))
+                lines.append("  UI:   " + ", ".join(names.get(i, i) for i in summary['activation_order']))
+
+        report = "\n".join(lines)
+        self.logger.info(f"Category navigation:\n{report}")
+        self.attach_note(report, name="🧭 Category Navigation")
+        self.attach_note(json.dumps(summary['log'], indent=1), name="🧭 Category Navigation Event Log")
+        self.attach_screenshot("After category navigation")
+
     @allure.step("Get {num_items} random menu items for search testing")
     def get_random_menu_items_for_search(self, num_items=5):
         self.click(MenuPageLocators.SEARCH_CANCEL)
-        time.sleep(1)
+        self.wait_until_menu_ready()
         try:
-            while not self.find_elements(MenuPageLocators.MENU_ITEMS):
-                self.driver.refresh()
-                time.sleep(1)
-
-            items = self.find_elements(MenuPageLocators.ITEMS)
-
-            if not items:
+            snapshot = self.snapshot()
+            if not len(snapshot):
                 self.logger.warning("No menu items found")
                 return []
 
-            self.logger.info(f"Found {len(items)} total menu items, selecting {num_items} random items")
+            self.logger.info(f"Found {len(snapshot)} total menu items, selecting {num_items} random items")
 
-            random.shuffle(items)
-            selected_items = items[:min(num_items, len(items))]
-
-            item_details = []
-            for item in selected_items:
-                try:
-                    item_id, item_name = self._extract_item_info(item)
-                    if item_id and item_name:
-                        item_details.append({
-                            'id': item_id,
-                            'name': item_name
-                        })
-                        self.logger.debug(f"Selected item for search test: {item_name} (ID: {item_id})")
-                except Exception as e:
-                    self.logger.warning(f"Failed to extract item info: {str(e)}")
-                    continue
+            item_details = [
+                {'id': item['id'], 'name': item['name']}
+                for item in snapshot.random_items(num_items, visible_only=False, predicate=lambda item: item['name'])
+            ]
+            for item in item_details:
+                self.logger.debug(f"Selected item for search test: {item['name']} (ID: {item['id']})")
 
             self.logger.info(f"Successfully selected {len(item_details)} items for search testing")
             return item_details
@@ -1033,15 +1617,14 @@ class MenuPage(BasePage):
                 return result
 
             search_input.clear()
+            self.watch_search_results()
             self.send_keys(MenuPageLocators.SEARCH_INPUT, item_name)
             self.logger.info(f"Searching for exact item name: '{item_name}'")
             result['searched'] = True
 
-            # Wait for results
-            time.sleep(1)
-
-            # Get search results
-            results = self.find_elements(MenuPageLocators.MENU_ITEMS)
+            # Wait for the results to settle and read them
+            settled = self.wait_for_search_results()
+            results = [] if settled['empty'] else settled['rows']
             result['total_results'] = len(results)
 
             if not results:
@@ -1054,9 +1637,7 @@ class MenuPage(BasePage):
 
             # Get the first result's name
             try:
-                first_result = results[0]
-                first_name_elem = first_result.find_element(*MenuPageLocators.MENU_ITEM_TITLE)
-                first_result_name = first_name_elem.text.strip()
+                first_result_name = results[0]['name']
                 result['first_result_name'] = first_result_name
 
                 # Check if first result matches the searched item
@@ -1,4 +1,3 @@
-import time
 import allure
 from selenium.common import TimeoutException
 from src.pages.base_page import BasePage
@@ -21,13 +20,16 @@ class PaymentPage(BasePage):
             self.switch_to_default_content()
             try:
                 card_data = generate_customer()
-                time.sleep(1)
-                self.send_keys(PaymentPageLocators.CARD_HOLDER_NAME,card_data['fullname'])
+                self.wait_for_dom_stable(quiet_ms=300, replaces=1)
+                self.batch("card entry").type(PaymentPageLocators.CARD_HOLDER_NAME, card_data['fullname']).perform()
+                # Actions can't cross into the card iframe, so its fields are a second batch
                 self.switch_to_frame(PaymentPageLocators.IFRAME)
-                self.send_keys(PaymentPageLocators.CARD_NUMBER, card_data['number'])
-                self.send_keys(PaymentPageLocators.CARD_DATE, card_data['exp'])
-                self.send_keys(PaymentPageLocators.SECURITY_CODE, card_data['cvv'])
-                self.send_keys(PaymentPageLocators.POSTAL_CODE, card_data['zip'])
+                (self.batch("card entry")
+                    .type(PaymentPageLocators.CARD_NUMBER, card_data['number'])
+                    .type(PaymentPageLocators.CARD_DATE, card_data['exp'])
+                    .type(PaymentPageLocators.SECURITY_CODE, card_data['cvv'])
+                    .type(PaymentPageLocators.POSTAL_CODE, card_data['zip'])
+                    .perform())
                 self.attach_screenshot("After filling the card info")
                 self.switch_to_default_content()
                 self.click(PaymentPageLocators.MAKE_PAYMENT)
@@ -41,9 +43,8 @@ class PaymentPage(BasePage):
         if scroll_into_view:
             total_element = self.wait_for_element_visible(PaymentPageLocators.TOTAL_AMOUNT)
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", total_element)
-            time.sleep(0.5)
+            self.wait_for_dom_stable(quiet_ms=150, replaces=0.5)
             self.attach_screenshot("Total Amount on the Payment Page")
 
-        total_text = self.get_text_3(PaymentPageLocators.TOTAL_AMOUNT)
-        amount = float(total_text.replace('$', '').strip())
+        amount = self.read_amount(PaymentPageLocators.TOTAL_AMOUNT)
         return amount
@@ -0,0 +1,225 @@
+"""
+Action Batch - several clicks, key input and scrolls in one W3C Actions request
+
+BasePage.click()/send_keys() each wait for the body, locate the element, check
+it and then act - four or five WebDriver round trips per step. An ActionBatch
+locates all of its targets in one script, compiles the steps into a single
+ActionChains and performs it with one request. Each batch records the round
+trips it used next to what the equivalent per-step calls would have used; the
+autouse fixture in conftest.py attaches the round trips avoided per flow.
+"""
+import sys
+import threading
+import time
+from typing import Dict, List
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webelement import WebElement
+from src.utils.polling import poll_in_browser
+
+
+# Round trips of the BasePage call each step replaces (body wait, locate, checks, action)
+LEGACY_ROUND_TRIPS = {'click': 4, 'type': 5, 'scroll': 2}
+
+# Select-all chord used to clear text fields; Ctrl+A only moves the caret on macOS
+SELECT_ALL_MODIFIER = Keys.COMMAND if sys.platform == 'darwin' else Keys.CONTROL
+
+RESOLVE_CONDITION = """
+    const found = [];
+    for (const locator of args) {
+        const el = locator[0] === 'xpath'
+            ? document.evaluate(locator[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(locator[1]);
+        if (!el) { return null; }
+        found.push(el);
+    }
+    return found;
+"""
+
+
+class ActionBatch:
+    """Builder for one W3C Actions request; create it with BasePage.batch()"""
+
+    def __init__(self, page, flow: str, timeout: float = 10):
+        """
+        Args:
+            page: BasePage issuing the batch (driver, locator translation, fallbacks)
+            flow: Name the savings are reported under, e.g. "card entry"
+            timeout: Seconds to wait for all locator targets to be present
+        """
+        self.page = page
+        self.driver = page.driver
+        self.flow = flow
+        self.timeout = timeout
+        self.steps: List[Dict] = []
+
+    def click(self, target, times: int = 1, pause: float = 0.05) -> "ActionBatch":
+        """Click target; repeated clicks stay at the same pointer position"""
+        self.steps.append({'kind': 'click', 'target': target, 'times': times, 'pause': pause})
+        return self
+
+    def type(self, target, text: str, clear: bool = True) -> "ActionBatch":
+        """Focus target by clicking it, optionally select-all + delete, then type text"""
+        self.steps.append({'kind': 'type', 'target': target, 'text': str(text), 'clear': clear})
+        return self
+
+    def scroll_to(self, target) -> "ActionBatch":
+        self.steps.append({'kind': 'scroll', 'target': target})
+        return self
+
+    def pause(self, seconds: float) -> "ActionBatch":
+        self.steps.append({'kind': 'pause', 'target': None, 'seconds': seconds})
+        return self
+
+    def _resolve(self) -> List[WebElement]:
+        """Locate every locator target in one script; WebElements are used as given"""
+        locators = []
+        for step in self.steps:
+            target = step['target']
+            if isinstance(target, tuple) and target not in locators:
+                locators.append(target)
+
+        found = {}
+        if locators:
+            elements = poll_in_browser(
+                self.driver, RESOLVE_CONDITION,
+                [self.page._script_locator(locator) for locator in locators],
+                self.timeout, f"{type(self.page).__name__}.batch[{self.flow}]:resolve"
+            )
+            if not elements:
+                raise TimeoutException(f"Action batch '{self.flow}': targets not present within {self.timeout}s: {locators}")
+            found = dict(zip(locators, elements))
+
+        return [found[step['target']] if isinstance(step['target'], tuple) else step['target'] for step in self.steps]
+
+    def _compile(self, elements: List[WebElement]) -> ActionChains:
+        chain = ActionChains(self.driver)
+        for step, element in zip(self.steps, elements):
+            if step['kind'] == 'scroll':
+                chain.scroll_to_element(element)
+            elif step['kind'] == 'click':
+                chain.scroll_to_element(element).move_to_element(element)
+                for click in range(step['times']):
+                    if click:
+                        chain.pause(step['pause'])
+                    chain.click()
+            elif step['kind'] == 'type':
+                chain.scroll_to_element(element).click(element)
+                if step['clear']:
+                    chain.key_down(SELECT_ALL_MODIFIER).send_keys('a').key_up(SELECT_ALL_MODIFIER)
+                    chain.send_keys(Keys.BACK_SPACE)
+                chain.send_keys(step['text'])
+            elif step['kind'] == 'pause':
+                chain.pause(step['seconds'])
+        return chain
+
+    def _replay(self):
+        """Per-step fallback through the regular BasePage interactions"""
+        for step in self.steps:
+            if step['kind'] == 'click':
+                for _ in range(step['times']):
+                    self.page.click(step['target'])
+            elif step['kind'] == 'type':
+                if isinstance(step['target'], tuple):
+                    self.page.send_keys(step['target'], step['text'], clear=step['clear'])
+                else:
+                    if step['clear']:
+                        step['target'].clear()
+                    step['target'].send_keys(step['text'])
+            elif step['kind'] == 'scroll':
+                element = self.page.find_element(step['target']) if isinstance(step['target'], tuple) else step['target']
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+            elif step['kind'] == 'pause':
+                time.sleep(step['seconds'])
+
+    def perform(self, fallback: bool = True) -> Dict:
+        """
+        Locate the targets and perform every step in one Actions request.
+
+        Args:
+            fallback: Replay the steps one by one if the batch fails. Only safe
+                      for idempotent batches (typing with clear, scroll + click).
+
+        Returns:
+            dict: Steps, round trips used/replaced and duration of the batch
+        """
+        legacy = sum(LEGACY_ROUND_TRIPS.get(step['kind'], 0) * step.get('times', 1) for step in self.steps)
+        start = time.time()
+        round_trips = 0
+        batched = True
+        try:
+            elements = self._resolve()
+            round_trips += 1 if any(isinstance(step['target'], tuple) for step in self.steps) else 0
+            round_trips += 1
+            self._compile(elements).perform()
+        except Exception as e:
+            if not fallback:
+                raise
+            self.page.logger.warning(f"Action batch '{self.flow}' failed, replaying step by step: {e}")
+            batched = False
+            self._replay()
+
+        result = {
+            'flow': self.flow,
+            'steps': len(self.steps),
+            'batched': batched,
+            'round_trips': round_trips if batched else legacy,
+            'legacy_round_trips': legacy,
+            'duration': time.time() - start,
+        }
+        action_batch_tracker.record(result)
+        return result
+
+
+class ActionBatchTracker:
+    """Per-test totals of batched interactions, grouped by flow"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.flows: Dict[str, Dict] = {}
+
+    def reset(self):
+        with self._lock:
+            self.flows = {}
+
+    def record(self, result: Dict):
+        with self._lock:
+            entry = self.flows.setdefault(result['flow'], {
+                'batches': 0, 'fallbacks': 0, 'steps': 0, 'round_trips': 0,
+                'legacy_round_trips': 0, 'duration': 0.0, 'avoided': 0,
+            })
+            entry['batches'] += 1
+            entry['fallbacks'] += 0 if result['batched'] else 1
+            entry['steps'] += result['steps']
+            entry['round_trips'] += result['round_trips']
+            entry['legacy_round_trips'] += result['legacy_round_trips']
+            entry['duration'] += result['duration']
+            entry['avoided'] += result['legacy_round_trips'] - result['round_trips']
+
+    def get_report(self) -> str:
+        """Per-flow table of round trips used and avoided, empty when nothing was batched"""
+        with self._lock:
+            flows = dict(self.flows)
+        if not flows:
+            return ""
+
+        lines = [
+            f"{'Flow':<30} {'Batches':<9} {'Steps':<7} {'Trips':<7} {'Per-step trips':<16} "
+            f"{'Time (s)':<10} {'Avoided':<10}",
+            "-" * 92,
+        ]
+        for flow, entry in sorted(flows.items(), key=lambda item: -item[1]['avoided']):
+            lines.append(
+                f"{flow[:30]:<30} {entry['batches']:<9} {entry['steps']:<7} {entry['round_trips']:<7} "
+                f"{entry['legacy_round_trips']:<16} {entry['duration']:<10.2f} {entry['avoided']:<10}"
+            )
+        fallbacks = sum(entry['fallbacks'] for entry in flows.values())
+        if fallbacks:
+            lines.append(f"\n{fallbacks} batch(es) failed and were replayed step by step")
+        lines.append("Avoided = per-step round trips - batched round trips (fallbacks avoid none).")
+        return "\n".join(lines)
+
+
+# Process-wide tracker (one per xdist worker)
+action_batch_tracker = ActionBatchTracker()
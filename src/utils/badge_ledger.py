@@ -0,0 +1,211 @@
+"""
+Badge Ledger - expected item/cart badge counts verified in one script
+
+MenuPage records every add to cart in the ledger (no round trip). A page-side
+observer logs each add-button click and each badge value change with
+performance.now() timestamps; per mutation batch it re-reads only the badges
+whose item row or cart badge the mutation records touched. verify() waits in the browser until all item
+badges and the cart badge show the expected counts (or the timeout passes)
+and returns them with the change log, so mismatches and the time each badge
+took to update after its add are reported from a single call.
+"""
+from typing import Dict, List, Optional
+
+
+BADGE_OBSERVER_JS = """
+    const visible = (node) => node && node.getBoundingClientRect().width > 0 && getComputedStyle(node).display !== 'none';
+    const value = (node) => parseInt((node.innerText || node.textContent || '').trim(), 10) || 0;
+    const readBadges = (sel) => {
+        const badges = {};
+        for (const badge of document.querySelectorAll(sel.itemBadge)) {
+            const owner = badge.closest(sel.itemOwner);
+            if (owner && visible(badge)) { badges['item:' + owner.id.slice(sel.ownerPrefix.length)] = value(badge); }
+        }
+        const cart = document.querySelector(sel.cartBadge);
+        badges['cart'] = visible(cart) ? value(cart) : 0;
+        return badges;
+    };
+    // One badge by ledger key; a missing or hidden badge reads as 0
+    const readBadge = (sel, key) => {
+        if (key === 'cart') {
+            const cart = document.querySelector(sel.cartBadge);
+            return visible(cart) ? value(cart) : 0;
+        }
+        let count = 0;
+        for (const owner of document.querySelectorAll('#' + CSS.escape(sel.ownerPrefix + key.slice(5)))) {
+            for (const badge of owner.querySelectorAll(sel.itemBadge)) {
+                if (badge.closest(sel.itemOwner) === owner && visible(badge)) { count = value(badge); }
+            }
+        }
+        return count;
+    };
+    // Ledger keys of the badges a mutated node can affect: its own item/cart badge and,
+    // for added or removed subtrees, every item and cart badge inside them
+    const touchedKeys = (node, sel, keys, subtree) => {
+        const el = node.nodeType === 1 ? node : node.parentElement;
+        if (!el) { return; }
+        const owner = el.closest(sel.itemOwner);
+        if (owner) { keys.add('item:' + owner.id.slice(sel.ownerPrefix.length)); }
+        if (el.closest(sel.cartBadge)) { keys.add('cart'); }
+        if (subtree && node.nodeType === 1) {
+            for (const inner of node.querySelectorAll(sel.itemOwner)) { keys.add('item:' + inner.id.slice(sel.ownerPrefix.length)); }
+            if (node.querySelector(sel.cartBadge)) { keys.add('cart'); }
+        }
+    };
+    if (!window.__qrBadges && document.body) {
+        const ledger = window.__qrBadges = {adds: [], changes: [], last: readBadges(sel), read: () => readBadges(sel)};
+        document.addEventListener('click', (event) => {
+            if (event.target.closest && event.target.closest(sel.addButton)) { ledger.adds.push(performance.now()); }
+        }, true);
+        // Records of one task arrive in one callback; each touched badge is read once per callback
+        new MutationObserver((records) => {
+            const keys = new Set();
+            for (const record of records) {
+                touchedKeys(record.target, sel, keys, false);
+                for (const node of record.addedNodes) { touchedKeys(node, sel, keys, true); }
+                for (const node of record.removedNodes) { touchedKeys(node, sel, keys, true); }
+            }
+            const now = performance.now();
+            for (const key of keys) {
+                const current = readBadge(sel, key);
+                if (current !== (ledger.last[key] || 0)) { ledger.changes.push({key: key, value: current, t: now}); }
+                ledger.last[key] = current;
+            }
+        }).observe(document.body, {childList: true, subtree: true, characterData: true});
+    }
+"""
+
+INSTALL_SCRIPT = "const sel = arguments[0], fresh = !window.__qrBadges;" + BADGE_OBSERVER_JS + "return fresh;"
+
+VERIFY_SCRIPT = """
+    const sel = arguments[0], expected = arguments[1], timeoutMs = arguments[2];
+    const done = arguments[arguments.length - 1];
+""" + BADGE_OBSERVER_JS + """
+    const start = performance.now();
+    const matches = (badges) => badges['cart'] === expected.cart
+        && Object.keys(expected.items).every((id) => (badges['item:' + id] || 0) === expected.items[id]);
+    (function check() {
+        const badges = window.__qrBadges.read();
+        const matched = matches(badges);
+        if (!matched && performance.now() - start < timeoutMs) { return setTimeout(check, 25); }
+        done({
+            badges: badges,
+            matched: matched,
+            waitedMs: Math.round(performance.now() - start),
+            adds: window.__qrBadges.adds,
+            changes: window.__qrBadges.changes
+        });
+    })();
+"""
+
+
+class BadgeLedger:
+    """Expected badge counts per add, verified together in the browser"""
+
+    def __init__(self, page, selectors: Dict):
+        """
+        Args:
+            page: MenuPage (driver, cart_items, logger)
+            selectors: itemBadge, itemOwner, ownerPrefix, cartBadge, addButton
+        """
+        self.page = page
+        self.selectors = selectors
+        self.entries: List[Dict] = []
+        self.checks: List[Dict] = []
+        # Index of the first entry whose add click the current document's observer saw
+        self._first_observed = 0
+
+    def install(self):
+        """Start logging add clicks and badge changes; call before the first add"""
+        if self.page.driver.execute_script(INSTALL_SCRIPT, self.selectors):
+            self._first_observed = len(self.entries)
+
+    def record_add(self, item_id: str, item_name: str):
+        """Record the counts the badges must show after this add (from page.cart_items)"""
+        self.entries.append({
+            'index': len(self.entries),
+            'item_id': item_id,
+            'item_name': item_name,
+            'item_expected': self.page.cart_items.get(item_id, 0),
+            'cart_expected': sum(self.page.cart_items.values()),
+        })
+
+    def verify(self, timeout: float = 5) -> Dict:
+        """
+        Wait for every badge to show its expected count and read them all in one script.
+
+        Returns:
+            dict: matched, mismatches [(badge, expected, actual)], waited_ms and
+                  per-add latencies (ms from the add click to the badge showing the count)
+        """
+        expected = {'items': dict(self.page.cart_items), 'cart': sum(self.page.cart_items.values())}
+        result = self.page.driver.execute_async_script(VERIFY_SCRIPT, self.selectors, expected, int(timeout * 1000))
+
+        badges = result['badges']
+        mismatches = [
+            (f"item {item_id}", count, badges.get(f"item:{item_id}", 0))
+            for item_id, count in expected['items'].items()
+            if badges.get(f"item:{item_id}", 0) != count
+        ]
+        if badges.get('cart', 0) != expected['cart']:
+            mismatches.append(("cart", expected['cart'], badges.get('cart', 0)))
+
+        latencies = [
+            self._latency(entry, entry['index'] - self._first_observed, result['adds'], result['changes'])
+            for entry in self.entries[self._first_observed:]
+        ]
+        check = {
+            'matched': result['matched'] and not mismatches,
+            'mismatches': mismatches,
+            'waited_ms': result['waitedMs'],
+            'latencies': latencies,
+        }
+        self.checks.append(check)
+        if not check['matched']:
+            self.page.logger.warning(f"Badge mismatches: {mismatches}")
+        return check
+
+    @staticmethod
+    def _latency(entry: Dict, add_index: int, adds: List[float], changes: List[Dict]) -> Dict:
+        """Time from the entry's add click to the first change showing its expected counts"""
+        latency = {'index': entry['index'], 'item_name': entry['item_name'], 'item_ms': None, 'cart_ms': None}
+        if add_index >= len(adds):
+            return latency
+        clicked_at = adds[add_index]
+        for change in changes:
+            if change['t'] < clicked_at:
+                continue
+            if latency['item_ms'] is None and change['key'] == f"item:{entry['item_id']}" \
+                    and change['value'] == entry['item_expected']:
+                latency['item_ms'] = round(change['t'] - clicked_at)
+            if latency['cart_ms'] is None and change['key'] == 'cart' and change['value'] == entry['cart_expected']:
+                latency['cart_ms'] = round(change['t'] - clicked_at)
+        return latency
+
+    def get_report(self) -> Optional[str]:
+        """Per-add badge update latency and the mismatches of the last check"""
+        if not self.checks:
+            return None
+        check = self.checks[-1]
+        lines = [
+            f"{'#':<4} {'Item':<30} {'Item badge':<12} {'Item ms':<9} {'Cart badge':<12} {'Cart ms':<9}",
+            "-" * 80,
+        ]
+        latencies = {latency['index']: latency for latency in check['latencies']}
+        for entry in self.entries:
+            latency = latencies.get(entry['index'], {})
+            item_ms = latency.get('item_ms')
+            cart_ms = latency.get('cart_ms')
+            lines.append(
+                f"{entry['index'] + 1:<4} {entry['item_name'][:30]:<30} {entry['item_expected']:<12} "
+                f"{item_ms if item_ms is not None else '-':<9} {entry['cart_expected']:<12} "
+                f"{cart_ms if cart_ms is not None else '-':<9}"
+            )
+        lines.append("-" * 80)
+        if check['mismatches']:
+            lines.append("❌ MISMATCHES (badge: expected -> actual)")
+            lines.extend(f"  {badge}: {expected} -> {actual}" for badge, expected, actual in check['mismatches'])
+        else:
+            lines.append(f"✅ All badges match (settled after {check['waited_ms']}ms)")
+        lines.append("'-' = no matching update seen after the add click (e.g. count already shown or page reloaded)")
+        return "\n".join(lines)
@@ -0,0 +1,102 @@
+"""
+Browser launcher - creates Chrome / Edge WebDriver sessions with the suite's options
+"""
+import os
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from src.utils.driver_resolver import resolve_driver_path
+
+
+# Execution profiles - extra Chromium switches applied on top of the base options
+BROWSER_PROFILES = {
+    "headed": [],
+    "headless-new": [
+        "--headless=new",
+        "--window-size=1366,900",
+    ],
+    "minimal": [
+        "--headless=new",
+        "--window-size=1366,900",
+        "--disable-background-networking",
+        "--disable-extensions",
+        "--disable-sync",
+        "--disable-component-update",
+        "--disable-default-apps",
+        "--no-first-run",
+    ],
+}
+
+DEFAULT_PROFILE = os.environ.get("BROWSER_PROFILE", "headed")
+
+
+def _logging_prefs(performance_log):
+    prefs = {"browser": "ALL"}
+    if performance_log:
+        prefs["performance"] = "ALL"
+    return prefs
+
+
+def launch_browser(browser_type, profile=DEFAULT_PROFILE, performance_log=True, page_load_strategy="normal"):
+    """
+    Launch a new browser session.
+
+    Args:
+        browser_type: "chrome" or "edge"
+        profile: Execution profile name from BROWSER_PROFILES
+        performance_log: Buffer CDP events in the performance log (not needed
+                         when the network is captured by streaming)
+        page_load_strategy: "normal" or "eager" (lean load mode)
+
+    Returns:
+        tuple: (driver, temp_dir) - temp_dir is the user-data-dir that must be
+        removed once the driver has been quit
+    """
+    if profile not in BROWSER_PROFILES:
+        raise ValueError(f"Unsupported browser profile: {profile}. Valid: {list(BROWSER_PROFILES)}")
+
+    if browser_type.lower() == "chrome":
+        options = ChromeOptions()
+        options.add_argument("--incognito")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument("--log-level=3")
+        options.add_argument("--silent")
+        options.add_argument("--disable-logging")
+        for argument in BROWSER_PROFILES[profile]:
+            options.add_argument(argument)
+
+        temp_dir = f"/tmp/chrome_test_{id(options)}"
+        options.add_argument(f"--user-data-dir={temp_dir}")
+
+        options.set_capability("goog:loggingPrefs", _logging_prefs(performance_log))
+        options.page_load_strategy = page_load_strategy
+
+        service = ChromeService(resolve_driver_path("chrome"))
+        driver = webdriver.Chrome(service=service, options=options)
+
+    elif browser_type.lower() == "edge":
+        options = webdriver.EdgeOptions()
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        for argument in BROWSER_PROFILES[profile]:
+            options.add_argument(argument)
+
+        temp_dir = f"/tmp/edge_test_{id(options)}"
+        options.add_argument(f"--user-data-dir={temp_dir}")
+
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+
+        options.set_capability("goog:loggingPrefs", _logging_prefs(performance_log))
+        options.page_load_strategy = page_load_strategy
+
+        service = EdgeService(resolve_driver_path("edge"))
+        driver = webdriver.Edge(service=service, options=options)
+
+    else:
+        raise ValueError(f"Unsupported browser type: {browser_type}")
+
+    return driver, temp_dir
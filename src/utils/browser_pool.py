@@ -0,0 +1,266 @@
+"""
+Browser Pool - keeps warm WebDriver sessions alive between tests on a worker
+"""
+import os
+import shutil
+import threading
+import time
+from typing import Callable, Dict, List
+from urllib.parse import urlparse
+from src.data.table_config import BASE_URL_TEMPLATE
+from src.utils.performance_metrics import startup_metrics
+
+
+# Origin of the table pages; always cleared even if the test ended on another origin
+APP_ORIGIN = "{0.scheme}://{0.netloc}".format(urlparse(BASE_URL_TEMPLATE))
+
+# Unregisters the current origin's service workers and clears sessionStorage (not covered by
+# Storage.clearDataForOrigin); returns the origin so its remaining storage can be cleared
+UNREGISTER_SERVICE_WORKERS_SCRIPT = """
+const done = arguments[arguments.length - 1];
+try { window.sessionStorage.clear(); } catch (e) {}
+const origin = window.location.origin;
+if (!navigator.serviceWorker) { return done(origin); }
+navigator.serviceWorker.getRegistrations()
+    .then((registrations) => Promise.all(registrations.map((registration) => registration.unregister())))
+    .catch(() => null)
+    .then(() => done(origin));
+"""
+
+
+class PooledBrowser:
+    """A WebDriver session owned by the pool and leased to one test at a time"""
+
+    def __init__(self, browser_type, driver, temp_dir, launch_time):
+        self.browser_type = browser_type
+        self.driver = driver
+        self.temp_dir = temp_dir
+        self.launch_time = launch_time
+        self.uses = 0
+        self.warm = False           # True when the current lease reused an existing session
+        self.launch_time_saved = 0.0
+
+
+class BrowserPool:
+    """
+    Per-worker pool of warm browser sessions.
+
+    A lease is reset between tests (cookies, all origin storage, service workers, HTTP cache,
+    blocked URLs, logs)
+    instead of quitting Chrome and launching a new one. Sessions that fail the
+    health check or reach max_reuse are quit and replaced by a fresh launch.
+
+    Usage:
+        pool = BrowserPool(launch_browser, max_reuse=20)
+        entry = pool.acquire("chrome")
+        ...
+        pool.release(entry)
+        pool.shutdown()
+    """
+
+    def __init__(self, launcher: Callable, max_reuse: int = 20, enabled: bool = True):
+        """
+        Args:
+            launcher: Callable(browser_type) -> (driver, temp_dir)
+            max_reuse: Number of leases after which a session is retired
+            enabled: When False every lease is a cold launch and release quits the browser
+        """
+        self.launcher = launcher
+        self.max_reuse = max_reuse
+        self.enabled = enabled
+        self.worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+        self._idle: Dict[str, List[PooledBrowser]] = {}
+        self._lock = threading.Lock()
+
+        self.launch_metrics = startup_metrics.get_or_create("Browser Launch")
+        self.cold_launches = 0
+        self.warm_leases = 0
+        self.replaced = 0
+        self.retired = 0
+        self.time_saved = 0.0
+
+    def acquire(self, browser_type) -> PooledBrowser:
+        """Lease a healthy browser, launching a new one if none is idle"""
+        key = browser_type.lower()
+
+        while True:
+            with self._lock:
+                idle = self._idle.get(key, [])
+                entry = idle.pop() if idle else None
+
+            if entry is None:
+                break
+
+            if self._is_healthy(entry):
+                entry.uses += 1
+                entry.warm = True
+                saved = self._average_launch_time(entry)
+                entry.launch_time_saved = saved
+                with self._lock:
+                    self.warm_leases += 1
+                    self.time_saved += saved
+                print(f"♻️ Reusing warm {key} session (use {entry.uses}/{self.max_reuse}, ~{saved:.1f}s launch saved)")
+                return entry
+
+            print(f"⚠️ Pooled {key} session failed health check - replacing")
+            self._discard_quietly(entry)
+            with self._lock:
+                self.replaced += 1
+
+        return self._launch(key)
+
+    def release(self, entry: PooledBrowser, defer: Callable = None):
+        """
+        Return a lease to the pool, or quit it if it cannot be reused.
+
+        Args:
+            entry: The lease to return
+            defer: Optional Callable(func, entry) used to run the quit/profile
+                   cleanup in the background instead of on the caller's thread
+        """
+        discard = (lambda e: defer(self._discard, e)) if defer else self._discard_quietly
+
+        if not self.enabled:
+            discard(entry)
+            return
+
+        if entry.uses >= self.max_reuse:
+            print(f"Retiring {entry.browser_type} session after {entry.uses} uses")
+            discard(entry)
+            with self._lock:
+                self.retired += 1
+            return
+
+        if not self._reset(entry):
+            print(f"⚠️ Could not reset {entry.browser_type} session - discarding")
+            discard(entry)
+            with self._lock:
+                self.replaced += 1
+            return
+
+        with self._lock:
+            self._idle.setdefault(entry.browser_type, []).append(entry)
+
+    def shutdown(self):
+        """Quit every idle browser and remove its profile directory"""
+        with self._lock:
+            entries = [entry for idle in self._idle.values() for entry in idle]
+            self._idle.clear()
+
+        for entry in entries:
+            self._discard_quietly(entry)
+
+    def _launch(self, browser_type) -> PooledBrowser:
+        start = time.time()
+        driver, temp_dir = self.launcher(browser_type)
+        launch_time = time.time() - start
+
+        self.launch_metrics.add_timing(launch_time, {'browser': browser_type, 'worker': self.worker})
+        with self._lock:
+            self.cold_launches += 1
+
+        entry = PooledBrowser(browser_type, driver, temp_dir, launch_time)
+        entry.uses = 1
+        print(f"🚀 Launched cold {browser_type} session in {launch_time:.1f}s")
+        return entry
+
+    def _is_healthy(self, entry: PooledBrowser) -> bool:
+        try:
+            return entry.driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def _reset(self, entry: PooledBrowser) -> bool:
+        """Bring a session back to a clean state for the next test"""
+        driver = entry.driver
+        try:
+            # Close any extra windows/tabs the test opened
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Storage is per origin, so clear it before leaving the app page: service workers are
+            # unregistered from the page, then every storage type (IndexedDB, Cache Storage,
+            # local storage, service worker registrations...) is dropped through CDP
+            origin = driver.execute_async_script(UNREGISTER_SERVICE_WORKERS_SCRIPT)
+            for storage_origin in {origin, APP_ORIGIN} - {None, "null"}:
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin", {"origin": storage_origin, "storageTypes": "all"}
+                )
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                driver.delete_all_cookies()
+
+            # A warm HTTP cache would make the next test's menu load (and its timings) faster than a real visit
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+
+            # Lift lean-load URL blocking so the next test decides for itself
+            try:
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+            except Exception:
+                pass
+
+            # Drain buffered logs so the next test starts with empty buffers
+            for log_type in ("browser", "performance"):
+                try:
+                    driver.get_log(log_type)
+                except Exception:
+                    pass
+
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            print(f"Browser reset failed: {str(e)}")
+            return False
+
+    def _discard(self, entry: PooledBrowser):
+        """Quit the browser and delete its profile. Raises if either step failed."""
+        errors = []
+        try:
+            entry.driver.quit()
+        except Exception as e:
+            print(f"Error closing browser: {str(e)}")
+            errors.append(f"quit: {str(e)}")
+
+        try:
+            if entry.temp_dir and os.path.exists(entry.temp_dir):
+                shutil.rmtree(entry.temp_dir)
+                print(f"✓ Removed: {entry.temp_dir}")
+        except Exception as e:
+            print(f"✗ Failed to remove {entry.temp_dir}: {str(e)}")
+            errors.append(f"remove {entry.temp_dir}: {str(e)}")
+
+        if errors:
+            raise RuntimeError("; ".join(errors))
+
+    def _discard_quietly(self, entry: PooledBrowser):
+        try:
+            self._discard(entry)
+        except RuntimeError:
+            pass  # already logged by _discard
+
+    def _average_launch_time(self, entry: PooledBrowser) -> float:
+        timings = self.launch_metrics.timings
+        if timings:
+            return sum(timings) / len(timings)
+        return entry.launch_time
+
+    def get_summary(self) -> str:
+        """Generate pool usage summary"""
+        return (
+            f"{'=' * 60}\n"
+            f"BROWSER POOL SUMMARY (worker: {self.worker})\n"
+            f"{'=' * 60}\n"
+            f"Enabled:            {self.enabled}\n"
+            f"Max reuse:          {self.max_reuse}\n"
+            f"Cold launches:      {self.cold_launches}\n"
+            f"Warm leases:        {self.warm_leases}\n"
+            f"Replaced (crashed): {self.replaced}\n"
+            f"Retired (max use):  {self.retired}\n"
+            f"Launch time saved:  {self.time_saved:.1f}s\n"
+            f"{'=' * 60}"
+        )
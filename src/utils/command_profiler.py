@@ -0,0 +1,220 @@
+"""
+Command Profiler - per-command WebDriver latency and round-trip counts
+
+Wraps each driver's command executor and records every command with its name,
+locator, duration and the page-object method that issued it. Records are kept
+per test; the autouse fixture in conftest.py attaches the chattiest methods to
+Allure and the session export under reports/ tracks round trips per flow over time.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PAGES_DIR = os.path.join(PROJECT_ROOT, "src", "pages")
+REPORTS_DIR = "reports"
+# Page methods sit a few frames above the executor; deeper frames are pytest/pluggy internals
+MAX_CALLER_DEPTH = 30
+
+
+class CommandProfiler:
+    """Per-worker recorder of WebDriver commands"""
+
+    def __init__(self):
+        self.worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        self.enabled = False
+        self.phase = "setup"
+        self.nodeid = None
+
+        self._lock = threading.Lock()
+        self.records: List[Dict] = []
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.test_totals: List[Dict] = []
+
+    def instrument(self, driver):
+        """Wrap the driver's command executor once; pooled drivers keep the wrapper"""
+        executor = driver.command_executor
+        if getattr(executor, "_qr_profiled", False):
+            return
+
+        original = executor.execute
+
+        def profiled_execute(command, params):
+            if not self.enabled:
+                return original(command, params)
+            start = time.perf_counter()
+            try:
+                return original(command, params)
+            finally:
+                self._record(command, params, time.perf_counter() - start)
+
+        executor.execute = profiled_execute
+        executor._qr_profiled = True
+
+    def start_test(self, nodeid: str):
+        with self._lock:
+            self.nodeid = nodeid
+            self.phase = "setup"
+            self.records = []
+            self.counters = defaultdict(int)
+
+    def count(self, name: str, amount: int = 1):
+        """Count a non-command event (e.g. element cache hits) for the current test"""
+        with self._lock:
+            self.counters[name] += amount
+
+    def _record(self, command, params, duration):
+        method, entry = self._callers()
+        locator = None
+        if params:
+            if 'using' in params:
+                locator = f"{params['using']}={params.get('value')}"
+            elif 'script' in params:
+                locator = " ".join(str(params['script']).split())[:60]
+
+        with self._lock:
+            self.records.append({
+                'command': command,
+                'locator': locator,
+                'duration_ms': duration * 1000,
+                'method': method,
+                'entry': entry,
+                'phase': self.phase,
+            })
+
+    @staticmethod
+    def _callers():
+        """
+        Find the page-object methods on the stack.
+
+        Returns:
+            tuple: (innermost page method, outermost page method within
+            MAX_CALLER_DEPTH frames). Outside page objects both fall back to the
+            nearest project function.
+        """
+        innermost = entry = fallback = None
+        frame = sys._getframe(3)
+        depth = 0
+        while frame and depth < MAX_CALLER_DEPTH:
+            path = frame.f_code.co_filename
+            if path.startswith(PAGES_DIR):
+                owner = frame.f_locals.get('self')
+                owner_name = type(owner).__name__ if owner is not None else os.path.basename(path)[:-3]
+                name = f"{owner_name}.{frame.f_code.co_name}"
+                innermost = innermost or name
+                entry = name
+            elif fallback is None and path.startswith(PROJECT_ROOT) and "site-packages" not in path \
+                    and not path.endswith("command_profiler.py"):
+                fallback = f"{os.path.basename(path)[:-3]}.{frame.f_code.co_name}"
+            frame = frame.f_back
+            depth += 1
+
+        return innermost or fallback or "other", entry or fallback or "other"
+
+    def _aggregate(self, key: str) -> Dict[str, Dict]:
+        with self._lock:
+            records = list(self.records)
+
+        groups = {}
+        for record in records:
+            group = groups.setdefault(record[key], {'commands': 0, 'duration_ms': 0.0, 'by_command': defaultdict(int)})
+            group['commands'] += 1
+            group['duration_ms'] += record['duration_ms']
+            group['by_command'][record['command']] += 1
+        return groups
+
+    def get_test_totals(self) -> Dict:
+        with self._lock:
+            records = list(self.records)
+            counters = dict(self.counters)
+        call_records = [record for record in records if record['phase'] == 'call']
+        return {
+            'nodeid': self.nodeid,
+            'worker': self.worker,
+            'commands': len(records),
+            'duration_ms': round(sum(record['duration_ms'] for record in records), 1),
+            'call_commands': len(call_records),
+            'call_duration_ms': round(sum(record['duration_ms'] for record in call_records), 1),
+            'counters': counters,
+        }
+
+    def format_chattiest(self, top: int = 15) -> str:
+        """Table of the page methods that issued the most commands in the current test"""
+        totals = self.get_test_totals()
+        if not totals['commands']:
+            return ""
+
+        lines = [
+            f"Commands: {totals['commands']} ({totals['duration_ms']:.0f}ms), "
+            f"test body: {totals['call_commands']} ({totals['call_duration_ms']:.0f}ms)",
+        ]
+        if totals['counters']:
+            lines.append("Counters: " + ", ".join(f"{name}={value}" for name, value in sorted(totals['counters'].items())))
+
+        for title, key in (("Entry method (called by the test)", 'entry'), ("Issuing method", 'method')):
+            groups = self._aggregate(key)
+            ranked = sorted(groups.items(), key=lambda item: item[1]['commands'], reverse=True)[:top]
+            lines.extend([
+                "",
+                f"{title:<50} {'Cmds':<7} {'Total ms':<10} {'Avg ms':<8} Top commands",
+                "-" * 110,
+            ])
+            for name, group in ranked:
+                top_commands = sorted(group['by_command'].items(), key=lambda item: item[1], reverse=True)[:3]
+                lines.append(
+                    f"{name[:50]:<50} {group['commands']:<7} {group['duration_ms']:<10.0f} "
+                    f"{group['duration_ms'] / group['commands']:<8.1f} "
+                    + ", ".join(f"{command}x{count}" for command, count in top_commands)
+                )
+        return "\n".join(lines)
+
+    def finish_test(self) -> Dict:
+        """Close the current test and keep its totals for the session export"""
+        totals = self.get_test_totals()
+        totals['methods'] = {
+            name: {'commands': group['commands'], 'duration_ms': round(group['duration_ms'], 1)}
+            for name, group in self._aggregate('entry').items()
+        }
+        with self._lock:
+            self.test_totals.append(totals)
+        return totals
+
+    def export(self, directory: str = REPORTS_DIR):
+        """
+        Write this worker's per-test totals and append them to the run history.
+
+        Files:
+            command_profile_<worker>.json - totals of the current run
+            command_profile_history.jsonl - one line per test per run
+        """
+        with self._lock:
+            test_totals = list(self.test_totals)
+        if not test_totals:
+            return None
+
+        run_at = time.strftime('%Y-%m-%d %H:%M:%S')
+        os.makedirs(directory, exist_ok=True)
+
+        path = os.path.join(directory, f"command_profile_{self.worker}.json")
+        with open(path, 'w') as f:
+            json.dump({'run_at': run_at, 'worker': self.worker, 'tests': test_totals}, f, indent=2)
+
+        with open(os.path.join(directory, "command_profile_history.jsonl"), 'a') as f:
+            for totals in test_totals:
+                f.write(json.dumps({
+                    'run_at': run_at,
+                    'nodeid': totals['nodeid'],
+                    'commands': totals['commands'],
+                    'call_commands': totals['call_commands'],
+                    'duration_ms': totals['duration_ms'],
+                }) + "\n")
+        return path
+
+
+# Process-wide profiler (one per xdist worker)
+command_profiler = CommandProfiler()
@@ -0,0 +1,54 @@
+"""
+Currency - exact parsing of amounts as the UI displays them
+
+Pure functions with no browser dependency; BasePage.parse_decimal/parse_currency
+delegate here and tests/unit covers the accepted formats.
+"""
+import re
+from decimal import Decimal, InvalidOperation
+
+
+# One displayed amount: optional parentheses, a minus before or after the currency sign,
+# thousands separators and decimals, e.g. "$1,234.56", "-$5.00", "$-5.00", "($5.00)"
+AMOUNT_PATTERN = re.compile(r"\(?-?\$?-?[\d,]*\.?\d+\)?")
+
+
+def _first_amount(text: str):
+    """The first match carrying a currency sign, else the first number in the text"""
+    matches = [match.group() for match in AMOUNT_PATTERN.finditer(text or "")]
+    if not matches:
+        return None
+    return next((match for match in matches if '$' in match), matches[0])
+
+
+def parse_decimal(text: str) -> Decimal:
+    """
+    Parse the amount in a displayed text exactly.
+
+    Text around the amount is ignored ("$5.00 (2 items)" -> 5.00, "v1.2 $3.00" -> 3.00).
+    The sign comes from the amount itself: a minus on either side of the currency sign
+    or accounting parentheses ("Discount: -$5.00", "$-5.00", "($5.00)" -> -5.00).
+
+    Raises:
+        ValueError: Text does not contain an amount
+    """
+    amount = _first_amount(text)
+    if amount is None:
+        raise ValueError(f"No amount in text: '{text}'")
+
+    negative = '-' in amount or (amount.startswith('(') and amount.endswith(')'))
+    try:
+        value = Decimal(amount.strip('()').replace('$', '').replace('-', '').replace(',', ''))
+    except InvalidOperation:
+        raise ValueError(f"No amount in text: '{text}'")
+    return -value if negative else value
+
+
+def parse_currency(text: str) -> float:
+    """
+    Parse the amount in a displayed text as a float (see parse_decimal).
+
+    Raises:
+        ValueError: Text does not contain an amount
+    """
+    return float(parse_decimal(text))
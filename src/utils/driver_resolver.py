@@ -0,0 +1,107 @@
+"""
+Driver Resolver - resolves the chromedriver / msedgedriver binary once per run
+
+webdriver_manager's install() does a filesystem (and sometimes network) lookup on
+every call. The resolved path is memoised in-process and shared between xdist
+workers through a small JSON cache guarded by a lock file, so only the first
+worker of a run pays for the lookup. When a cached path exists on disk the
+resolver works fully offline.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from src.utils.performance_metrics import startup_metrics
+from src.utils.file_lock import FileLock
+
+
+CACHE_DIR = os.environ.get("DRIVER_CACHE_DIR", os.path.join(tempfile.gettempdir(), "internal_qr_drivers"))
+CACHE_FILE = os.path.join(CACHE_DIR, "driver_paths.json")
+LOCK_FILE = os.path.join(CACHE_DIR, "driver_paths.lock")
+
+# Cached paths older than this are refreshed when the network allows it
+CACHE_TTL_SECONDS = float(os.environ.get("DRIVER_CACHE_TTL_HOURS", "24")) * 3600
+
+DRIVER_MANAGERS = {
+    "chrome": ChromeDriverManager,
+    "edge": EdgeChromiumDriverManager,
+}
+
+_resolved = {}
+_resolved_lock = threading.Lock()
+
+
+def _read_cache():
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _write_cache(cache):
+    tmp_file = f"{CACHE_FILE}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_file, CACHE_FILE)
+
+
+def _resolve_shared(browser_type):
+    """Resolve through the on-disk cache. Returns (path, source)."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    with FileLock(LOCK_FILE):
+        cache = _read_cache()
+        entry = cache.get(browser_type)
+
+        cached_path = entry.get('path') if entry else None
+        cached_valid = bool(cached_path) and os.path.exists(cached_path)
+
+        if cached_valid and time.time() - entry.get('resolved_at', 0) < CACHE_TTL_SECONDS:
+            return cached_path, "disk cache"
+
+        try:
+            path = DRIVER_MANAGERS[browser_type]().install()
+        except Exception as e:
+            if cached_valid:
+                print(f"⚠️ Driver lookup failed ({e}) - using cached {browser_type} driver (offline)")
+                return cached_path, "disk cache (offline)"
+            raise
+
+        cache[browser_type] = {'path': path, 'resolved_at': time.time()}
+        _write_cache(cache)
+        return path, "webdriver_manager"
+
+
+def resolve_driver_path(browser_type):
+    """
+    Get the driver binary path for a browser, resolving it at most once per run.
+
+    Args:
+        browser_type: "chrome" or "edge"
+
+    Returns:
+        str: Absolute path to the driver executable
+    """
+    key = browser_type.lower()
+    if key not in DRIVER_MANAGERS:
+        raise ValueError(f"Unsupported browser type: {browser_type}")
+
+    with _resolved_lock:
+        if key in _resolved:
+            return _resolved[key]
+
+        start = time.time()
+        path, source = _resolve_shared(key)
+        duration = time.time() - start
+
+        startup_metrics.get_or_create("Driver Resolution").add_timing(
+            duration, {'browser': key, 'source': source, 'path': path}
+        )
+        print(f"✓ Resolved {key} driver from {source} in {duration * 1000:.0f}ms: {path}")
+
+        _resolved[key] = path
+        return path
@@ -0,0 +1,50 @@
+"""
+Element Cache - reusable WebElement handles that re-find themselves when stale
+
+Page objects keep one handle per locator they declare stable (BasePage.stable_locators)
+or look up with find_element(cached=True). A CachedElement is a real WebElement, so
+it can be clicked, read or passed to execute_script. When a command fails with
+StaleElementReferenceException the element is located again and the command
+retried once. Selenium 4 runs is_displayed() and get_attribute() as scripts on the
+driver rather than element commands, so those recover here too; scripts that take
+the element as an argument recover through BasePage.execute_script().
+"""
+from typing import Callable
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+from src.utils.command_profiler import command_profiler
+
+
+class CachedElement(WebElement):
+    """WebElement that transparently re-locates itself after going stale"""
+
+    def __init__(self, element: WebElement, refind: Callable[[], WebElement], locator=None):
+        super().__init__(element.parent, element.id)
+        self._refind = refind
+        self.locator = locator
+
+    def refresh(self):
+        """Point this handle at a freshly located element"""
+        command_profiler.count("element_cache.stale_refind")
+        self._id = self._refind().id
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, params)
+        except StaleElementReferenceException:
+            self.refresh()
+            return super()._execute(command, params)
+
+    def is_displayed(self) -> bool:
+        try:
+            return super().is_displayed()
+        except StaleElementReferenceException:
+            self.refresh()
+            return super().is_displayed()
+
+    def get_attribute(self, name):
+        try:
+            return super().get_attribute(name)
+        except StaleElementReferenceException:
+            self.refresh()
+            return super().get_attribute(name)
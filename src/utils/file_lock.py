@@ -0,0 +1,115 @@
+"""
+File Lock - cross-process lock shared by xdist workers
+
+Exclusive creation of a lock file works the same on every platform and needs no
+extra dependency. A lock left behind by a killed worker is broken once stale:
+its holder pid is no longer running, or (when the pid cannot be checked) the
+file is older than stale_after.
+"""
+import os
+import time
+
+
+def _pid_alive(pid):
+    """True/False when the pid can be checked, None when it cannot (Windows, unreadable pid)"""
+    if pid is None or os.name == "nt":
+        # os.kill(pid, 0) terminates the process on Windows
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return None
+    return True
+
+
+class FileLock:
+    """Cross-process lock based on exclusive creation of a lock file"""
+
+    def __init__(self, path, timeout=120, stale_after=60):
+        self.path = path
+        self.timeout = timeout
+        # Must stay below timeout, otherwise a waiter gives up before it may break the lock
+        self.stale_after = min(stale_after, timeout / 2)
+        self._fd = None
+
+    def __enter__(self):
+        start = time.time()
+        while True:
+            try:
+                self._fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, str(os.getpid()).encode())
+                return self
+            except FileExistsError:
+                self._break_if_stale()
+                if time.time() - start > self.timeout:
+                    raise TimeoutError(f"Could not acquire lock: {self.path}")
+                time.sleep(0.1)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            os.close(self._fd)
+        finally:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+        return False
+
+    def _read_holder(self):
+        """(pid, mtime) of the current lock file; pid is None while the holder has not written it yet"""
+        with open(self.path) as f:
+            content = f.read().strip()
+        mtime = os.path.getmtime(self.path)
+        return (int(content) if content.isdigit() else None), mtime
+
+    def _is_stale(self, pid, mtime):
+        alive = _pid_alive(pid)
+        if alive is not None:
+            return not alive
+        return time.time() - mtime > self.stale_after
+
+    def _break_if_stale(self):
+        """
+        A worker killed while holding the lock must not block the whole run.
+
+        Breaking is serialized by a second exclusive file, and the holder is read again
+        under it: two waiters that both saw the same dead holder cannot end up removing
+        the lock a third worker acquired in between.
+        """
+        try:
+            pid, mtime = self._read_holder()
+        except (OSError, ValueError):
+            return
+        if not self._is_stale(pid, mtime):
+            return
+
+        guard = f"{self.path}.break"
+        try:
+            guard_fd = os.open(guard, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            # A breaker killed mid-way would leave the guard behind; it only lives for a few ms
+            try:
+                if time.time() - os.path.getmtime(guard) > self.stale_after:
+                    os.remove(guard)
+            except OSError:
+                pass
+            return
+        except OSError:
+            return
+
+        try:
+            if self._read_holder() == (pid, mtime):
+                os.remove(self.path)
+                print(f"🔓 Removed stale lock {self.path} (holder pid: {pid})")
+        except (OSError, ValueError):
+            pass
+        finally:
+            os.close(guard_fd)
+            try:
+                os.remove(guard)
+            except OSError:
+                pass
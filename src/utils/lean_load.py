@@ -0,0 +1,228 @@
+"""
+Lean Load - eager page loads with images, fonts and analytics blocked
+
+Functional tests only need the app's own markup and API calls. In lean mode the
+browser is launched with pageLoadStrategy=eager, heavy resources are blocked
+through CDP Network.setBlockedURLs and a navigation is considered done as soon
+as the app renders its own markers. When baseline recording is enabled, full-load
+navigations are collected per worker and merged into a shared baseline at session
+end, so lean navigations can report the milliseconds and bytes they saved.
+"""
+import json
+import os
+import threading
+import time
+from selenium.webdriver.support.ui import WebDriverWait
+from src.utils.performance_metrics import startup_metrics
+from src.utils.file_lock import FileLock
+
+
+# URL patterns per resource group (Network.setBlockedURLs wildcard syntax)
+BLOCK_PATTERN_GROUPS = {
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"],
+    "analytics": [
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*clarity.ms*",
+        "*hotjar.com*",
+        "*segment.io*",
+        "*doubleclick.net*",
+    ],
+}
+
+# Comma separated group names, plus optional extra comma separated patterns
+DEFAULT_BLOCK_GROUPS = os.environ.get("LEAN_LOAD_BLOCK", "images,fonts,analytics")
+EXTRA_BLOCK_PATTERNS = os.environ.get("LEAN_LOAD_EXTRA_PATTERNS", "")
+
+# The welcome button or the menu list - whichever the table lands on
+APP_READY_SELECTOR = "#goto-main-page-button, .menu-list-row"
+
+BASELINE_FILE = os.path.join("reports", "navigation_baseline.json")
+
+
+def get_block_patterns(groups: str = DEFAULT_BLOCK_GROUPS, extra: str = EXTRA_BLOCK_PATTERNS) -> list:
+    """
+    Build the blocked URL list.
+
+    Args:
+        groups: Comma separated keys of BLOCK_PATTERN_GROUPS
+        extra: Comma separated additional URL patterns
+
+    Returns:
+        list: URL patterns for Network.setBlockedURLs
+    """
+    patterns = []
+    for group in filter(None, (name.strip() for name in groups.split(","))):
+        if group not in BLOCK_PATTERN_GROUPS:
+            raise ValueError(f"Unknown lean load group: {group}. Valid: {list(BLOCK_PATTERN_GROUPS)}")
+        patterns.extend(BLOCK_PATTERN_GROUPS[group])
+    patterns.extend(filter(None, (pattern.strip() for pattern in extra.split(","))))
+    return patterns
+
+
+def set_blocking(driver, patterns: list) -> bool:
+    """Apply (or with an empty list, lift) URL blocking on a Chromium session"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        return True
+    except Exception as e:
+        print(f"⚠️ Could not set blocked URLs: {str(e)}")
+        return False
+
+
+def wait_for_app_ready(driver, timeout: float = 30):
+    """Wait until the app has rendered the welcome button or the menu"""
+    WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+        lambda d: d.execute_script(f"return !!document.querySelector('{APP_READY_SELECTOR}');")
+    )
+
+
+def measure_transfer(driver) -> dict:
+    """
+    Bytes transferred by the current document and its resources.
+
+    Cross-origin resources without Timing-Allow-Origin report 0 bytes, so this
+    is a lower bound - the same one for full and lean loads.
+    """
+    try:
+        return driver.execute_script("""
+            const entries = performance.getEntriesByType('navigation')
+                .concat(performance.getEntriesByType('resource'));
+            let bytes = 0;
+            for (const entry of entries) { bytes += entry.transferSize || 0; }
+            return {bytes: bytes, requests: entries.length};
+        """)
+    except Exception:
+        return {'bytes': 0, 'requests': 0}
+
+
+class NavigationBaseline:
+    """
+    Running average of full-load navigations, shared between runs through a JSON file.
+
+    Samples are kept in memory and merged into the file once per worker by flush(),
+    under a file lock, so parallel workers never overwrite each other's samples and
+    a navigation never pays for file I/O.
+    """
+
+    def __init__(self, path: str = BASELINE_FILE, enabled: bool = False):
+        self.path = path
+        self.enabled = enabled
+        self._pending = []
+        self._reference = None
+        self._lock = threading.Lock()
+
+    def load(self) -> dict:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def reference(self) -> dict:
+        """The baseline as it was when this worker first needed it"""
+        with self._lock:
+            if self._reference is None:
+                self._reference = self.load()
+            return self._reference
+
+    def record(self, duration_ms: float, transfer_bytes: int):
+        """Keep one full-load navigation for the next flush()"""
+        with self._lock:
+            self._pending.append((duration_ms, transfer_bytes))
+
+    def flush(self) -> int:
+        """
+        Fold the recorded navigations into the baseline file.
+
+        Returns:
+            int: Number of samples written
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with FileLock(f"{self.path}.lock"):
+            baseline = self.load()
+            samples = baseline.get('samples', 0)
+            total = samples + len(pending)
+            baseline['avg_ms'] = (baseline.get('avg_ms', 0) * samples + sum(ms for ms, _ in pending)) / total
+            baseline['avg_bytes'] = (baseline.get('avg_bytes', 0) * samples + sum(b for _, b in pending)) / total
+            baseline['samples'] = total
+            baseline['updated'] = time.strftime('%Y-%m-%d %H:%M:%S')
+
+            tmp_file = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(baseline, f, indent=2)
+            os.replace(tmp_file, self.path)
+        return len(pending)
+
+
+navigation_baseline = NavigationBaseline()
+
+
+def report_navigation(driver, lean: bool, duration: float, table_num) -> dict:
+    """
+    Record a finished navigation and compare lean loads against the baseline.
+
+    Full loads only measure transferred bytes (one extra round trip) while
+    baseline recording is enabled.
+
+    Returns:
+        dict: Navigation report (duration, bytes, and savings for lean loads)
+    """
+    duration_ms = duration * 1000
+    measured = lean or navigation_baseline.enabled
+    transfer = measure_transfer(driver) if measured else {'bytes': None, 'requests': None}
+
+    report = {
+        'table': table_num,
+        'mode': 'lean' if lean else 'full',
+        'duration_ms': round(duration_ms, 0),
+        'bytes': transfer['bytes'],
+        'requests': transfer['requests'],
+    }
+    startup_metrics.get_or_create(f"Navigation ({report['mode']})").add_timing(duration, report.copy())
+
+    if not lean:
+        if navigation_baseline.enabled:
+            navigation_baseline.record(duration_ms, transfer['bytes'])
+            print(f"📄 Full load: {duration_ms:.0f}ms, {transfer['bytes'] / 1024:.0f}KB")
+        else:
+            print(f"📄 Full load: {duration_ms:.0f}ms")
+        return report
+
+    reference = navigation_baseline.reference()
+    if reference.get('samples'):
+        report['ms_saved'] = round(reference['avg_ms'] - duration_ms, 0)
+        report['bytes_saved'] = round(reference['avg_bytes'] - transfer['bytes'], 0)
+        report['baseline_samples'] = reference['samples']
+        print(
+            f"🪶 Lean load: {duration_ms:.0f}ms, {transfer['bytes'] / 1024:.0f}KB "
+            f"(saved {report['ms_saved']:.0f}ms, {report['bytes_saved'] / 1024:.0f}KB "
+            f"vs {reference['samples']} full loads)"
+        )
+    else:
+        print(f"🪶 Lean load: {duration_ms:.0f}ms, {transfer['bytes'] / 1024:.0f}KB (no full-load baseline yet)")
+    return report
+
+
+def format_report(report: dict) -> str:
+    """Text body for the per-navigation Allure attachment"""
+    lines = [
+        f"Mode: {report['mode']}",
+        f"Table: {report['table']}",
+        f"Load time: {report['duration_ms']:.0f}ms",
+        f"Transferred: {report['bytes'] / 1024:.1f}KB in {report['requests']} requests",
+    ]
+    if 'ms_saved' in report:
+        lines.append(f"Time saved: {report['ms_saved']:.0f}ms")
+        lines.append(f"Bytes saved: {report['bytes_saved'] / 1024:.1f}KB")
+        lines.append(f"Baseline: average of {report['baseline_samples']} full loads")
+    elif report['mode'] == 'lean':
+        lines.append("No full-load baseline yet - run once with --lean-load=off --lean-load-baseline=on to record it")
+    return "\n".join(lines)
@@ -0,0 +1,154 @@
+"""
+Menu Snapshot - the rendered menu read in one script and indexed in memory
+
+MenuPage.snapshot() runs SNAPSHOT_SCRIPT once and wraps the result in a
+MenuSnapshot: items by id (name, description, price, visibility, badge count,
+section and element handle), categories with their item ids in page order and
+the cart badge. Queries on the snapshot cost no WebDriver round trips.
+
+The script also installs a MutationObserver that bumps a version counter on
+every structural or text change of the page; a snapshot is stale once the
+page's version (or document, after a reload) differs from the one it was taken at.
+"""
+import random
+import re
+from typing import Callable, Dict, List, Optional
+
+
+# Structural and text changes only - class flips (active pill while scrolling) don't dirty the snapshot
+OBSERVER_JS = """
+    if (!window.__qrMenuObserver && document.body) {
+        window.__qrMenuToken = Math.random().toString(36).slice(2);
+        window.__qrMenuVersion = 0;
+        window.__qrMenuObserver = new MutationObserver(() => { window.__qrMenuVersion++; });
+        window.__qrMenuObserver.observe(document.body, {
+            childList: true, subtree: true, characterData: true, attributes: true, attributeFilter: ['hidden', 'style']
+        });
+    }
+"""
+
+VERSION_SCRIPT = "return {token: window.__qrMenuToken || null, version: window.__qrMenuVersion || 0};"
+
+SNAPSHOT_SCRIPT = OBSERVER_JS + """
+    const args = arguments[0];
+    const text = (node) => node ? (node.innerText || node.textContent || '').trim() : '';
+    const visible = (node) => {
+        if (!node) { return false; }
+        const rect = node.getBoundingClientRect(), style = getComputedStyle(node);
+        return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+    };
+
+    const categories = Array.from(document.querySelectorAll(args.pill)).map((pill) => ({
+        id: pill.id, name: text(pill.querySelector(args.pillLabel)), visible: visible(pill)
+    }));
+
+    const items = [];
+    let section = null;
+    for (const node of document.querySelectorAll(args.sectionTitle + ', ' + args.row)) {
+        if (node.matches(args.sectionTitle)) { section = text(node); continue; }
+        const badges = Array.from(document.querySelectorAll('#add-item-' + CSS.escape(node.id) + ' ' + args.itemBadge));
+        const badge = badges.find(visible);
+        items.push({
+            id: node.id,
+            name: text(node.querySelector(args.title)),
+            description: text(node.querySelector(args.description)),
+            rowText: text(node),
+            visible: visible(node),
+            section: section,
+            badge: badge ? (parseInt(text(badge), 10) || 0) : 0,
+            element: node
+        });
+    }
+
+    const cartBadge = document.querySelector(args.cartBadge);
+    return {
+        token: window.__qrMenuToken || null,
+        version: window.__qrMenuVersion || 0,
+        categories: categories,
+        items: items,
+        cartBadge: visible(cartBadge) ? (parseInt(text(cartBadge), 10) || 0) : 0
+    };
+"""
+
+_PRICE_PATTERN = re.compile(r"\$\s?(\d[\d,]*\.\d{2})")
+
+
+class MenuSnapshot:
+    """Indexed, read-only model of the rendered menu at one point in time"""
+
+    def __init__(self, data: Dict):
+        self.token = data['token']
+        self.version = data['version']
+        self.cart_badge = data['cartBadge']
+
+        self.items: Dict[str, Dict] = {}
+        for item in data['items']:
+            if not item['id']:
+                continue
+            price = _PRICE_PATTERN.search(item.pop('rowText') or '')
+            item['price'] = float(price.group(1).replace(',', '')) if price else None
+            self.items[item['id']] = item
+
+        self.categories: List[Dict] = []
+        for category in data['categories']:
+            if not category['id'] or not category['name']:
+                continue
+            category['items'] = [
+                item['id'] for item in self.items.values()
+                if (item['section'] or '').lower() == category['name'].lower()
+            ]
+            self.categories.append(category)
+        self._categories_by_name = {category['name'].lower(): category for category in self.categories}
+
+    def is_current(self, state: Dict) -> bool:
+        """state: result of VERSION_SCRIPT"""
+        return state['token'] == self.token and state['version'] == self.version
+
+    def item(self, item_id: str) -> Optional[Dict]:
+        return self.items.get(item_id)
+
+    def badge_count(self, item_id: str) -> int:
+        item = self.items.get(item_id)
+        return item['badge'] if item else 0
+
+    def category(self, name: str) -> Optional[Dict]:
+        return self._categories_by_name.get(name.lower())
+
+    def items_in(self, category_name: str) -> List[Dict]:
+        category = self.category(category_name)
+        return [self.items[item_id] for item_id in category['items']] if category else []
+
+    def find_items(self, visible_only: bool = True, categories=None, exclude_categories=(),
+                   predicate: Callable[[Dict], bool] = None) -> List[Dict]:
+        """
+        Items matching all filters, in page order.
+
+        Args:
+            visible_only: Skip items that are not rendered visibly
+            categories: Only items in these category names (None = any)
+            exclude_categories: Skip items in these category names
+            predicate: Extra filter on the item dict
+        """
+        wanted = {name.lower() for name in categories} if categories is not None else None
+        excluded = {name.lower() for name in exclude_categories}
+        matches = []
+        for item in self.items.values():
+            section = (item['section'] or '').lower()
+            if visible_only and not item['visible']:
+                continue
+            if wanted is not None and section not in wanted:
+                continue
+            if section in excluded:
+                continue
+            if predicate and not predicate(item):
+                continue
+            matches.append(item)
+        return matches
+
+    def random_items(self, count: int = 1, **filters) -> List[Dict]:
+        """Up to count distinct random items matching find_items(**filters)"""
+        matches = self.find_items(**filters)
+        return random.sample(matches, min(count, len(matches)))
+
+    def __len__(self):
+        return len(self.items)
@@ -0,0 +1,124 @@
+"""
+Modifier Planner - valid modifier selections computed from catalog data
+
+plan_modifiers() turns an item's catalog ModifierGroups into a selection that
+satisfies Required/MinQuantity/MaxQuantity, in Sequence order, together with
+its expected cost. APPLY_MODIFIERS_SCRIPT matches the whole plan to the item
+modal's buttons, then clicks it in one async script (or nothing, if any planned
+option is missing) and returns what the modal shows as selected afterwards, so
+the DOM is only read to confirm the final state.
+"""
+import random
+from typing import Dict, List
+
+
+def _available(modifiers: List[Dict]) -> List[Dict]:
+    return [
+        modifier for modifier in modifiers
+        if modifier.get('Active', True) and not modifier.get('IsOutOfStock', False) and modifier.get('Name')
+    ]
+
+
+def plan_modifiers(modifier_groups: List[Dict]) -> Dict:
+    """
+    Pick modifiers for every group of an item.
+
+    Required groups get at least max(MinQuantity, 1) picks; optional groups get one,
+    like the DOM-driven selection always did. Picks never exceed MaxQuantity (0 = no limit)
+    or the number of available modifiers.
+
+    Args:
+        modifier_groups: Catalog ModifierGroups of the item
+
+    Returns:
+        dict: {'groups': [{'id', 'name', 'required', 'modifiers': [{'name', 'price'}]}],
+               'expected_cost': float, 'unsatisfiable': [group names]}
+    """
+    plan = {'groups': [], 'expected_cost': 0.0, 'unsatisfiable': []}
+    for group in sorted(modifier_groups, key=lambda group: group.get('Sequence', 0)):
+        required = group.get('Required', False)
+        min_quantity = group.get('MinQuantity', 0) or 0
+        max_quantity = group.get('MaxQuantity', 0) or 0
+        available = _available(group.get('Modifiers', []))
+
+        wanted = max(min_quantity, 1)
+        if max_quantity:
+            wanted = min(wanted, max_quantity)
+        if len(available) < wanted:
+            if required or min_quantity:
+                plan['unsatisfiable'].append(group.get('Name') or str(group.get('Id')))
+            wanted = len(available)
+        if not wanted:
+            continue
+
+        picks = [
+            {'name': modifier['Name'].strip(), 'price': float(modifier.get('Price') or 0)}
+            for modifier in random.sample(available, wanted)
+        ]
+        plan['groups'].append({
+            'id': group.get('Id'),
+            'name': (group.get('Name') or '').strip(),
+            'required': required,
+            'modifiers': picks,
+        })
+        plan['expected_cost'] += sum(pick['price'] for pick in picks)
+
+    plan['expected_cost'] = round(plan['expected_cost'], 2)
+    return plan
+
+
+# Groups are matched by title, falling back to position; a frame is yielded between
+# clicks so React commits each selection before the next one in the same group
+APPLY_MODIFIERS_SCRIPT = """
+const groups = arguments[0], selectors = arguments[1], done = arguments[arguments.length - 1];
+const text = (node) => node ? (node.innerText || node.textContent || '').trim() : '';
+const norm = (value) => value.replace(/\\s+/g, ' ').trim().toLowerCase();
+const nextFrame = () => new Promise((resolve) => requestAnimationFrame(() => setTimeout(resolve, 0)));
+
+const readSections = (modal) => {
+    const sections = [];
+    for (const node of modal.querySelectorAll(selectors.header + ', ' + selectors.option)) {
+        if (node.matches(selectors.header)) { sections.push({title: text(node), options: []}); }
+        else if (sections.length) { sections[sections.length - 1].options.push(node); }
+    }
+    return sections;
+};
+const label = (option) => text(option.querySelector(selectors.label)) || text(option);
+
+(async () => {
+    const modal = document.querySelector(selectors.modal);
+    if (!modal) { return done({modal: false, missing: [], selected: []}); }
+
+    // Match every planned option to its button before clicking anything: a plan that
+    // doesn't fit the modal leaves it untouched for the DOM-driven fallback
+    const missing = [], targets = [], sections = readSections(modal);
+    groups.forEach((group, index) => {
+        const section = sections.find((section) => norm(section.title) === norm(group.name))
+            || (group.name && sections.find((section) => norm(section.title).includes(norm(group.name))))
+            || (sections.length === groups.length ? sections[index] : null);
+        if (!section) { missing.push({group: group.name, modifier: null}); return; }
+        for (const modifier of group.modifiers) {
+            const option = section.options.find((node) => norm(label(node)) === norm(modifier.name))
+                || section.options.find((node) => norm(label(node)).startsWith(norm(modifier.name)));
+            if (option) { targets.push(option); } else { missing.push({group: group.name, modifier: modifier.name}); }
+        }
+    });
+    if (missing.length) { return done({modal: true, missing: missing, selected: []}); }
+
+    for (const option of targets) {
+        if (option.getAttribute('aria-pressed') !== 'true') { option.click(); }
+        await nextFrame();
+    }
+
+    await nextFrame();
+    const selected = [];
+    for (const section of readSections(document.querySelector(selectors.modal) || modal)) {
+        for (const option of section.options) {
+            if (option.getAttribute('aria-pressed') === 'true') {
+                selected.push({section: section.title, name: label(option), priceText: text(option.querySelector(selectors.price))});
+            }
+        }
+    }
+    done({modal: true, missing: missing, selected: selected});
+})();
+"""
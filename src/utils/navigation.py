@@ -1,9 +1,11 @@
 import pytest
 import requests
 import json
+import time
 from selenium.webdriver.support.ui import WebDriverWait
 from src.pages.base_page import BasePage
 from src.data.table_config import get_table_url, DEFAULT_TABLE_NUMBER
+from src.utils import lean_load
 
 URL = "https://nextgen-frontend-dev-b0chfba5a6hyb3ga.eastus-01.azurewebsites.net/38A31859-CA10-452C-BF40-ED361D7F6749"
 prop = 33
@@ -48,7 +50,7 @@ class Navigation:
             return False
 
     @staticmethod
-    def navigate(driver, session_id, table_num=None):
+    def navigate(driver, session_id, table_num=None, lean=False):
         """
         Navigate to the table QR page.
 
@@ -56,6 +58,11 @@ class Navigation:
             driver: Selenium WebDriver instance
             session_id: API session ID
             table_num: Table number (1-10). If None, uses default table 10.
+            lean: Block images/fonts/analytics and return once the app markers render
+                  (see src/utils/lean_load.py)
+
+        Returns:
+            dict: Navigation report with load time and bytes transferred
         """
         # Use default table if not specified
         if table_num is None:
@@ -70,11 +77,23 @@ class Navigation:
 
         base = BasePage(driver)
         try:
+            if lean:
+                lean_load.set_blocking(driver, lean_load.get_block_patterns())
+
             print(f"Navigating to table {table_num}: {checkout_url}")
+            start = time.time()
             driver.get(checkout_url)
-            WebDriverWait(driver, 1).until(
-                lambda d: d.execute_script('return document.readyState') == 'complete'
-            )
+            if lean:
+                lean_load.wait_for_app_ready(driver)
+            else:
+                # An eager session returns from get() before the load event
+                eager = driver.capabilities.get('pageLoadStrategy') == 'eager'
+                WebDriverWait(driver, 30 if eager else 1).until(
+                    lambda d: d.execute_script('return document.readyState') == 'complete'
+                )
+            duration = time.time() - start
         except Exception as e:
             print(f"Failed to load checkout page for table {table_num}: {str(e)}")
-            pytest.skip(f"Failed to load checkout page for table {table_num}")
\ No newline at end of file
+            pytest.skip(f"Failed to load checkout page for table {table_num}")
+
+        return lean_load.report_navigation(driver, lean, duration, table_num)
@@ -0,0 +1,148 @@
+"""
+Network Probe - in-page fetch/XHR instrumentation for network-idle waits
+
+The probe wraps window.fetch and XMLHttpRequest and keeps a count of in-flight
+requests in window.__qrNet, so a wait can run inside the browser through
+execute_async_script instead of polling spinners over WebDriver.
+"""
+import threading
+
+
+# Installs window.__qrNet once per document
+PROBE_SCRIPT = """
+(function () {
+    if (window.__qrNet) { return; }
+    const net = window.__qrNet = {inflight: 0, lastChange: performance.now(), seq: 0, pending: {}, done: []};
+
+    function begin(method, url) {
+        const id = ++net.seq;
+        net.pending[id] = {method: String(method || 'GET').toUpperCase(), url: String(url), start: performance.now()};
+        net.inflight++;
+        net.lastChange = performance.now();
+        return id;
+    }
+    function end(id, status) {
+        const call = net.pending[id];
+        if (!call) { return; }
+        delete net.pending[id];
+        call.end = performance.now();
+        call.duration = call.end - call.start;
+        call.status = status;
+        net.done.push(call);
+        if (net.done.length > 200) { net.done.shift(); }
+        net.inflight = Math.max(0, net.inflight - 1);
+        net.lastChange = performance.now();
+    }
+
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function (input, init) {
+            const method = (init && init.method) || (input && input.method) || 'GET';
+            const id = begin(method, (input && input.url) || input);
+            return originalFetch.apply(this, arguments).then(
+                (response) => { end(id, response.status); return response; },
+                (error) => { end(id, 0); throw error; }
+            );
+        };
+    }
+
+    const open = XMLHttpRequest.prototype.open;
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__qrCall = [method, url];
+        return open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        const call = this.__qrCall || ['GET', ''];
+        const id = begin(call[0], call[1]);
+        this.addEventListener('loadend', () => end(id, this.status));
+        return send.apply(this, arguments);
+    };
+})();
+"""
+
+# Resolves when nothing has been in flight for idleMs, or at timeoutMs
+NETWORK_IDLE_SCRIPT = PROBE_SCRIPT + """
+const idleMs = arguments[0], timeoutMs = arguments[1], goneLocator = arguments[2];
+const done = arguments[arguments.length - 1];
+const net = window.__qrNet;
+// Optional early exit: the element the caller is really waiting on has no visible match any more
+const isGone = () => {
+    if (!goneLocator) { return false; }
+    let nodes = [];
+    if (goneLocator[0] === 'xpath') {
+        const snapshot = document.evaluate(goneLocator[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+    } else {
+        nodes = Array.from(document.querySelectorAll(goneLocator[1]));
+    }
+    return !nodes.some((node) => {
+        const rect = node.getBoundingClientRect(), style = getComputedStyle(node);
+        return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+    });
+};
+const start = performance.now();
+const describe = (call) => ({
+    method: call.method,
+    url: call.url,
+    status: call.status === undefined ? null : call.status,
+    duration: call.duration === undefined ? performance.now() - call.start : call.duration,
+    finished_at: call.end === undefined ? null : call.end - start
+});
+const pendingAtStart = Object.values(net.pending).map(describe);
+
+function finish(idle, gone) {
+    done({
+        idle: idle,
+        gone: !!gone,
+        waited: performance.now() - start,
+        pending_at_start: pendingAtStart,
+        finished: net.done.filter((call) => call.end >= start).map(describe),
+        still_pending: Object.values(net.pending).map(describe)
+    });
+}
+(function check() {
+    const now = performance.now();
+    if (net.inflight === 0 && now - net.lastChange >= idleMs) { return finish(true, isGone()); }
+    if (isGone()) { return finish(false, true); }
+    if (now - start >= timeoutMs) { return finish(false, false); }
+    setTimeout(check, 20);
+})();
+"""
+
+_probed_sessions = set()
+_probed_lock = threading.Lock()
+
+
+def install_network_probe(driver):
+    """
+    Register the probe for every new document of this session.
+
+    Pages that were already loaded get it from NETWORK_IDLE_SCRIPT itself, so
+    only requests started before the first wait are missed there.
+    """
+    with _probed_lock:
+        if driver.session_id in _probed_sessions:
+            return
+        _probed_sessions.add(driver.session_id)
+
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": PROBE_SCRIPT})
+    except Exception:
+        pass  # not a Chromium session - the idle script injects on demand
+
+
+def blocking_call(result: dict):
+    """The request that finished last during the wait - the one the page was waiting on"""
+    finished = [call for call in result.get('finished', []) if call.get('finished_at') is not None]
+    if result.get('still_pending'):
+        return max(result['still_pending'], key=lambda call: call['duration'])
+    if finished:
+        return max(finished, key=lambda call: call['finished_at'])
+    return None
+
+
+def format_call(call: dict) -> str:
+    url = call['url'].split('?')[0]
+    path = '/' + url.split('/', 3)[3] if url.count('/') >= 3 else url
+    return f"{call['method']} {path} ({call['duration']:.0f}ms, status {call['status']})"
@@ -2,9 +2,19 @@
 Simple Network Tracker - FIXED for actual endpoints
 """
 import json
+import threading
 import time
+from collections import OrderedDict, deque
 from typing import List, Dict, Any
 import allure
+import trio
+
+
+# Endpoints whose timings are collected
+TRACKED_ENDPOINTS = ('/getcheck', '/addtoopencheck', '/pay')
+
+# "log" parses the performance log at teardown, "stream" listens to CDP events live
+NETWORK_CAPTURE_MODES = ("log", "stream")
 
 
 class NetworkTracker:
@@ -58,9 +68,7 @@ class NetworkTracker:
                     http_method = request_data.get('method', '')
 
                     # ✅ FIXED: Match actual endpoints
-                    if '/getcheck' in url or \
-                       '/addtoopencheck' in url or \
-                       '/pay' in url:
+                    if self._is_tracked(url):
 
                         post_data = request_data.get('postData', '')
 
@@ -101,49 +109,60 @@ class NetworkTracker:
                             'timestamp': time.strftime('%H:%M:%S')
                         }
 
-                        url = request_info['url']
-                        post_data = request_info.get('post_data', '')
-
-                        # ✅ Categorize by actual endpoints
-                        if '/getcheck' in url:
-                            # Check if TableNumber or TransactionGuid in POST body
-                            if post_data:
-                                try:
-                                    body = json.loads(post_data)
-                                    if 'TableNumber' in body:
-                                        self.get_by_table.append(call_data)
-                                        print(f"  📊 Captured GET by Table: {duration_ms:.0f}ms")
-                                    elif 'TransactionGuid' in body:
-                                        self.get_by_guid.append(call_data)
-                                        print(f"  🚀 Captured GET by GUID: {duration_ms:.0f}ms")
-                                    else:
-                                        # Default to GUID if can't determine
-                                        self.get_by_guid.append(call_data)
-                                        print(f"  🚀 Captured GET (assumed GUID): {duration_ms:.0f}ms")
-                                except json.JSONDecodeError:
-                                    # Can't parse, check string content
-                                    if 'TableNumber' in post_data:
-                                        self.get_by_table.append(call_data)
-                                        print(f"  📊 Captured GET by Table: {duration_ms:.0f}ms")
-                                    else:
-                                        self.get_by_guid.append(call_data)
-                                        print(f"  🚀 Captured GET by GUID: {duration_ms:.0f}ms")
-                            else:
-                                # No post data visible, assume GUID (faster calls)
-                                self.get_by_guid.append(call_data)
-                                print(f"  🚀 Captured GET (no body, assumed GUID): {duration_ms:.0f}ms")
-
-                        elif '/addtoopencheck' in url:
-                            self.add_calls.append(call_data)
-                            print(f"  ➕ Captured ADD: {duration_ms:.0f}ms")
-
-                        elif '/pay' in url:
-                            self.close_calls.append(call_data)
-                            print(f"  🔒 Captured CLOSE: {duration_ms:.0f}ms")
+                        self._record_call(request_info['url'], request_info.get('post_data', ''), call_data)
 
             except (json.JSONDecodeError, KeyError) as e:
                 continue
 
+        self._print_capture_summary()
+
+    @staticmethod
+    def _is_tracked(url: str) -> bool:
+        """Only the check endpoints are tracked"""
+        return any(endpoint in url for endpoint in TRACKED_ENDPOINTS)
+
+    def _record_call(self, url: str, post_data: str, call_data: Dict[str, Any]):
+        """Put a finished call into its bucket"""
+        duration_ms = call_data['duration_ms']
+
+        # ✅ Categorize by actual endpoints
+        if '/getcheck' in url:
+            # Check if TableNumber or TransactionGuid in POST body
+            if post_data:
+                try:
+                    body = json.loads(post_data)
+                    if 'TableNumber' in body:
+                        self.get_by_table.append(call_data)
+                        print(f"  📊 Captured GET by Table: {duration_ms:.0f}ms")
+                    elif 'TransactionGuid' in body:
+                        self.get_by_guid.append(call_data)
+                        print(f"  🚀 Captured GET by GUID: {duration_ms:.0f}ms")
+                    else:
+                        # Default to GUID if can't determine
+                        self.get_by_guid.append(call_data)
+                        print(f"  🚀 Captured GET (assumed GUID): {duration_ms:.0f}ms")
+                except json.JSONDecodeError:
+                    # Can't parse, check string content
+                    if 'TableNumber' in post_data:
+                        self.get_by_table.append(call_data)
+                        print(f"  📊 Captured GET by Table: {duration_ms:.0f}ms")
+                    else:
+                        self.get_by_guid.append(call_data)
+                        print(f"  🚀 Captured GET by GUID: {duration_ms:.0f}ms")
+            else:
+                # No post data visible, assume GUID (faster calls)
+                self.get_by_guid.append(call_data)
+                print(f"  🚀 Captured GET (no body, assumed GUID): {duration_ms:.0f}ms")
+
+        elif '/addtoopencheck' in url:
+            self.add_calls.append(call_data)
+            print(f"  ➕ Captured ADD: {duration_ms:.0f}ms")
+
+        elif '/pay' in url:
+            self.close_calls.append(call_data)
+            print(f"  🔒 Captured CLOSE: {duration_ms:.0f}ms")
+
+    def _print_capture_summary(self):
         print(f"\n📊 CAPTURE SUMMARY:")
         print(f"  GET by Table: {len(self.get_by_table)}")
         print(f"  GET by GUID: {len(self.get_by_guid)}")
@@ -247,4 +266,169 @@ class NetworkTracker:
         self.get_by_table.clear()
         self.get_by_guid.clear()
         self.add_calls.clear()
-        self.close_calls.clear()
\ No newline at end of file
+        self.close_calls.clear()
+
+
+class StreamingNetworkTracker(NetworkTracker):
+    """
+    API performance tracker fed live from CDP Network events.
+
+    Subscribes only to requestWillBeSent / responseReceived / loadingFinished
+    through Selenium's bidi_connection(), so the performance log does not have
+    to be enabled. Calls are put into the buckets as soon as they finish and the
+    events of tracked calls are kept in a bounded ring buffer.
+
+    Usage:
+        tracker = StreamingNetworkTracker(driver).start()
+        ...
+        tracker.capture()   # stops the stream
+    """
+
+    def __init__(self, driver, buffer_size: int = 500):
+        super().__init__(driver)
+        self.buffer_size = buffer_size
+        self.events = deque(maxlen=buffer_size)     # recent events of tracked calls
+        self.dropped = 0                            # requests evicted before they finished
+        self.error = None
+
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, timeout: float = 10):
+        """Open the CDP connection and wait until the Network events are subscribed"""
+        self._thread = threading.Thread(target=self._run, name="network-stream", daemon=True)
+        self._thread.start()
+
+        if not self._ready.wait(timeout):
+            print(f"⚠️  Network stream did not subscribe within {timeout}s")
+        elif self.error:
+            print(f"⚠️  Network stream unavailable: {self.error}")
+        return self
+
+    def stop(self, timeout: float = 5):
+        """Stop listening; events already queued are still processed"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            trio.run(self._listen)
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            self._ready.set()
+
+    async def _listen(self):
+        async with self.driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            network = devtools.network
+            await session.execute(network.enable())
+
+            events = session.listen(
+                network.RequestWillBeSent,
+                network.ResponseReceived,
+                network.LoadingFinished,
+                buffer_size=self.buffer_size
+            )
+
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(self._consume, events, network)
+                self._ready.set()
+
+                while not self._stop.is_set():
+                    await trio.sleep(0.05)
+                # Let events already in the channel reach the buckets
+                await trio.sleep(0.2)
+                nursery.cancel_scope.cancel()
+
+    async def _consume(self, events, network):
+        async for event in events:
+            if isinstance(event, network.RequestWillBeSent):
+                self._on_request(event)
+            elif isinstance(event, network.ResponseReceived):
+                self._on_response(event)
+            elif isinstance(event, network.LoadingFinished):
+                self._on_finished(event)
+
+    def _on_request(self, event):
+        url = event.request.url
+        if not self._is_tracked(url):
+            return
+
+        print(f"  ✅ MATCHED: {event.request.method} {url}")
+        with self._lock:
+            self._pending[event.request_id] = {
+                'url': url,
+                'method': event.request.method,
+                'post_data': getattr(event.request, 'post_data', None) or '',
+                'start_time': float(event.timestamp)
+            }
+            if len(self._pending) > self.buffer_size:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+            self.events.append(('requestWillBeSent', str(event.request_id), url))
+
+    def _on_response(self, event):
+        with self._lock:
+            request_info = self._pending.get(event.request_id)
+            if request_info is None:
+                return
+            request_info['status'] = event.response.status
+            request_info['end_time'] = float(event.timestamp)
+            self.events.append(('responseReceived', str(event.request_id), request_info['url']))
+
+    def _on_finished(self, event):
+        with self._lock:
+            request_info = self._pending.pop(event.request_id, None)
+            if request_info is None:
+                return
+            self.events.append(('loadingFinished', str(event.request_id), request_info['url']))
+
+            end_time = request_info.get('end_time', float(event.timestamp))
+            duration_ms = (end_time - request_info['start_time']) * 1000
+
+            call_data = {
+                'duration_ms': round(duration_ms, 0),
+                'status': request_info.get('status', 'Unknown'),
+                'timestamp': time.strftime('%H:%M:%S')
+            }
+            self._record_call(request_info['url'], request_info['post_data'], call_data)
+
+    def capture(self):
+        """Stop streaming - the buckets were filled while the test ran"""
+        self.stop()
+
+        if self.error:
+            print(f"⚠️  Network stream failed: {self.error}")
+        print(f"\n🔍 DEBUG: Streamed {len(self.events)} tracked events "
+              f"(ring buffer {self.buffer_size}, {self.dropped} unfinished dropped)")
+        self._print_capture_summary()
+
+    def clear(self):
+        """Clear all captured data"""
+        super().clear()
+        with self._lock:
+            self._pending.clear()
+            self.events.clear()
+
+
+def create_network_tracker(driver, mode: str = "log") -> NetworkTracker:
+    """
+    Create a tracker for one driver.
+
+    Args:
+        driver: WebDriver instance
+        mode: "log" (parse the performance log at capture) or "stream" (live CDP events)
+
+    Returns:
+        NetworkTracker: Streaming trackers are already listening
+    """
+    if mode == "stream":
+        return StreamingNetworkTracker(driver).start()
+    if mode == "log":
+        return NetworkTracker(driver)
+    raise ValueError(f"Unsupported network capture mode: {mode}. Valid: {list(NETWORK_CAPTURE_MODES)}")
@@ -226,4 +226,9 @@ class PerformanceCollector:
         with open(filepath, 'w') as f:
             json.dump(data, f, indent=2)
 
-        self.logger.info(f"Exported metrics to {filepath}")
\ No newline at end of file
+        self.logger.info(f"Exported metrics to {filepath}")
+
+
+# Process-wide collector for browser startup costs (launch time, driver resolution, ...).
+# Every xdist worker is a separate process, so this is effectively per worker.
+startup_metrics = PerformanceCollector()
@@ -0,0 +1,240 @@
+"""
+Polling Engine - shared backoff polling for page-object waits
+
+One schedule for every wait: a fast phase that polls at a short interval while
+most conditions are met, then exponential backoff with jitter. Conditions can be
+polled from Python or inside the browser through execute_async_script (one
+round trip per chunk instead of one per poll). Every wait records how long it
+actually took per call site, so timeouts can be tuned from real p99 data.
+"""
+import json
+import math
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Iterator
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+from src.utils.performance_metrics import PerformanceCollector
+
+
+class PollSchedule:
+    """Fast phase, then exponential backoff with jitter"""
+
+    def __init__(self, initial: float = 0.05, fast_phase: float = 0.5, factor: float = 1.6,
+                 max_interval: float = 1.0, jitter: float = 0.2):
+        """
+        Args:
+            initial: Interval in seconds during the fast phase
+            fast_phase: Seconds polled at the initial interval before backing off
+            factor: Growth of the interval per poll after the fast phase
+            max_interval: Upper bound for the interval
+            jitter: +/- fraction applied to each backoff interval
+        """
+        self.initial = initial
+        self.fast_phase = fast_phase
+        self.factor = factor
+        self.max_interval = max_interval
+        self.jitter = jitter
+
+    def capped(self, max_interval: float) -> "PollSchedule":
+        """Copy with a different upper bound (keeps callers' poll_frequency meaningful)"""
+        return PollSchedule(min(self.initial, max_interval), self.fast_phase, self.factor, max_interval, self.jitter)
+
+    def intervals(self) -> Iterator[float]:
+        start = time.time()
+        interval = self.initial
+        while True:
+            if time.time() - start < self.fast_phase:
+                yield self.initial
+                continue
+            interval = min(self.max_interval, interval * self.factor)
+            yield interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def to_dict(self) -> dict:
+        return {
+            'initialMs': self.initial * 1000,
+            'fastPhaseMs': self.fast_phase * 1000,
+            'factor': self.factor,
+            'maxIntervalMs': self.max_interval * 1000,
+            'jitter': self.jitter,
+        }
+
+
+DEFAULT_SCHEDULE = PollSchedule()
+
+# Per call site wait durations - process-wide, so per xdist worker
+wait_stats = PerformanceCollector()
+_stats_lock = threading.Lock()
+
+
+def record_wait(site: str, duration: float, timeout: float, satisfied: bool, polls: int):
+    with _stats_lock:
+        wait_stats.get_or_create(site).add_timing(duration, {
+            'timeout': timeout,
+            'satisfied': satisfied,
+            'polls': polls,
+        })
+
+
+def poll(condition: Callable[[], Any], timeout: float, site: str,
+         schedule: PollSchedule = DEFAULT_SCHEDULE, swallow_exceptions: bool = True):
+    """
+    Call condition() until it returns a truthy value or timeout expires.
+
+    Args:
+        condition: Callable returning a truthy value once the wait is over
+        timeout: Maximum seconds to wait
+        site: Call site name for the wait statistics
+        schedule: Poll intervals
+        swallow_exceptions: Treat exceptions from condition as "not yet"
+
+    Returns:
+        The truthy value, or None on timeout
+    """
+    start = time.time()
+    polls = 0
+    for interval in schedule.intervals():
+        polls += 1
+        try:
+            value = condition()
+        except Exception:
+            if not swallow_exceptions:
+                record_wait(site, time.time() - start, timeout, False, polls)
+                raise
+            value = None
+
+        elapsed = time.time() - start
+        if value:
+            record_wait(site, elapsed, timeout, True, polls)
+            return value
+        if elapsed >= timeout:
+            record_wait(site, elapsed, timeout, False, polls)
+            return None
+        time.sleep(min(interval, timeout - elapsed))
+
+
+# The condition body is inlined (not eval'd in the page) so strict CSP can't block it
+BROWSER_POLL_TEMPLATE = """
+const args = arguments[0], schedule = arguments[1], timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const condition = function (args) { %s };
+const start = performance.now();
+let interval = schedule.initialMs, polls = 0;
+(function check() {
+    polls++;
+    let value = null;
+    try { value = condition(args); } catch (e) { value = null; }
+    const elapsed = performance.now() - start;
+    if (value || elapsed >= timeoutMs) { return done({value: value || null, polls: polls, elapsed: elapsed}); }
+    if (elapsed >= schedule.fastPhaseMs) {
+        interval = Math.min(schedule.maxIntervalMs, interval * schedule.factor);
+    }
+    const jittered = interval * (1 + (Math.random() * 2 - 1) * schedule.jitter);
+    setTimeout(check, Math.min(jittered, timeoutMs - elapsed));
+})();
+"""
+
+
+def poll_in_browser(driver, condition_body: str, args: Any, timeout: float, site: str,
+                    schedule: PollSchedule = DEFAULT_SCHEDULE):
+    """
+    Evaluate a JavaScript condition inside the browser until it returns a truthy value.
+
+    A driver error during a chunk (document unloading, script timeout while the page
+    reloads) counts as a failed poll and the wait goes on until the deadline; only a
+    lost session ends it early.
+
+    Args:
+        driver: WebDriver instance
+        condition_body: Body of function(args) returning a truthy value when done
+        args: JSON-serialisable (or WebElement) argument passed to the condition
+        timeout: Maximum seconds to wait
+        site: Call site name for the wait statistics
+        schedule: Poll intervals
+
+    Returns:
+        The truthy value, or None on timeout
+    """
+    script = BROWSER_POLL_TEMPLATE % condition_body
+    start = time.time()
+    polls = 0
+    value = None
+    deadline = start + timeout
+    while True:
+        # Keep each async script well below the driver's script timeout
+        chunk = max(0.05, min(deadline - time.time(), 20))
+        try:
+            result = driver.execute_async_script(script, args, schedule.to_dict(), int(chunk * 1000))
+            polls += result['polls']
+            value = result['value']
+        except InvalidSessionIdException:
+            record_wait(site, time.time() - start, timeout, False, polls)
+            raise
+        except WebDriverException:
+            # Document navigating or reloading mid-chunk - treat like a failed poll, as poll() does
+            polls += 1
+            time.sleep(min(schedule.initial, max(0.0, deadline - time.time())))
+        if value or time.time() >= deadline:
+            break
+
+    record_wait(site, time.time() - start, timeout, bool(value), polls)
+    return value
+
+
+def format_wait_report() -> str:
+    """Per call site wait durations with a timeout suggestion from the observed p99"""
+    with _stats_lock:
+        metrics = dict(wait_stats.metrics)
+    if not metrics:
+        return ""
+
+    lines = [
+        "=" * 120,
+        f"{'Call site':<50} {'Waits':<7} {'Timeouts':<9} {'p50':<8} {'p95':<8} {'p99':<8} "
+        f"{'Max':<8} {'Timeout':<9} {'Suggested':<9}",
+        "=" * 120,
+    ]
+    for site, site_metrics in sorted(metrics.items()):
+        stats = site_metrics.get_statistics()
+        configured = max(request['timeout'] for request in site_metrics.requests)
+        timeouts = sum(1 for request in site_metrics.requests if not request['satisfied'])
+        lines.append(
+            f"{site[:50]:<50} {stats['count']:<7} {timeouts:<9} "
+            f"{stats['p50']:<8.2f} {stats['p95']:<8.2f} {stats['p99']:<8.2f} {stats['max']:<8.2f} "
+            f"{configured:<9g} {suggest_timeout(site_metrics):<9g}"
+        )
+    lines.append("=" * 120)
+    lines.append("Seconds. Suggested = 1.5 x p99 of satisfied waits, rounded up; timeouts keep the configured value.")
+    return "\n".join(lines)
+
+
+def suggest_timeout(site_metrics) -> float:
+    satisfied = sorted(request['duration'] for request in site_metrics.requests if request['satisfied'])
+    configured = max(request['timeout'] for request in site_metrics.requests)
+    if not satisfied or len(satisfied) < len(site_metrics.requests):
+        return configured
+    return min(configured, max(1, math.ceil(site_metrics._percentile(satisfied, 0.99) * 1.5)))
+
+
+def export_wait_stats(directory: str = "reports"):
+    """Write per call site wait statistics for this worker"""
+    with _stats_lock:
+        metrics = dict(wait_stats.metrics)
+    if not metrics:
+        return None
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"wait_stats_{worker}.json")
+    with open(path, 'w') as f:
+        json.dump({
+            site: {
+                'statistics': site_metrics.get_statistics(),
+                'configured_timeout': max(request['timeout'] for request in site_metrics.requests),
+                'timeouts': sum(1 for request in site_metrics.requests if not request['satisfied']),
+                'suggested_timeout': suggest_timeout(site_metrics),
+            }
+            for site, site_metrics in metrics.items()
+        }, f, indent=2)
+    return path
@@ -0,0 +1,244 @@
+"""
+Screenshot Service - policy-driven, deduplicated screenshots with a per-test byte budget
+
+BasePage.attach_screenshot() grabs the PNG on the test thread; encoding and hashing
+always run on the service's executor. Under the always and every-n policies the test
+thread waits for the encoded frame and attaches it right away, inside the Allure step
+that took it; near-identical consecutive frames (dHash) and frames over the optional
+per-test byte budget are skipped. Under on-failure the frames are encoded while the
+test goes on and attached in capture order at teardown - only if setup or the test
+body failed.
+
+Policies:
+    always      - every attach_screenshot() call is captured
+    on-failure  - frames are buffered and attached only when the test failed
+    every-n     - only every Nth attach_screenshot() call is captured
+
+Format and scale default to the captured PNG at full size; JPEG/WebP and a
+smaller scale are opt-in.
+"""
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import allure
+
+try:
+    from PIL import Image
+except ImportError:  # pillow missing - frames are attached as captured PNGs
+    Image = None
+
+
+SCREENSHOT_POLICIES = ("always", "on-failure", "every-n")
+SCREENSHOT_FORMATS = ("png", "jpeg", "webp")
+
+
+class ScreenshotService:
+    """Per-worker screenshot pipeline; one buffer per test"""
+
+    def __init__(self):
+        self.policy = os.environ.get("SCREENSHOT_POLICY", "always")
+        self.every_n = int(os.environ.get("SCREENSHOT_EVERY_N", "5"))
+        self.image_format = os.environ.get("SCREENSHOT_FORMAT", "png")
+        self.scale = float(os.environ.get("SCREENSHOT_SCALE", "1.0"))
+        self.quality = int(os.environ.get("SCREENSHOT_QUALITY", "70"))
+        # 0 = no limit
+        self.budget_bytes = int(float(os.environ.get("SCREENSHOT_BUDGET_KB", "0")) * 1024)
+        self.dedupe_distance = int(os.environ.get("SCREENSHOT_DEDUPE_DISTANCE", "2"))
+
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
+        self._lock = threading.Lock()
+        self._frames: List[Dict] = []
+        self._requests = 0
+        self._stats = self._new_stats()
+        self._previous_hash = None
+
+    def configure(self, policy=None, every_n=None, image_format=None, scale=None, budget_kb=None):
+        if policy is not None:
+            if policy not in SCREENSHOT_POLICIES:
+                raise ValueError(f"Unknown screenshot policy: {policy}. Valid: {list(SCREENSHOT_POLICIES)}")
+            self.policy = policy
+        if image_format is not None:
+            if image_format not in SCREENSHOT_FORMATS:
+                raise ValueError(f"Unknown screenshot format: {image_format}. Valid: {list(SCREENSHOT_FORMATS)}")
+            self.image_format = image_format
+        if every_n is not None:
+            self.every_n = max(1, every_n)
+        if scale is not None:
+            self.scale = scale
+        if budget_kb is not None:
+            self.budget_bytes = int(budget_kb * 1024)
+
+    @staticmethod
+    def _new_stats() -> Dict:
+        return {
+            'requested': 0,
+            'captured': 0,
+            'attached': 0,
+            'duplicates': 0,
+            'over_budget': 0,
+            'encode_errors': 0,
+            'raw_bytes': 0,
+            'attached_bytes': 0,
+            'dropped': [],
+        }
+
+    def start_test(self):
+        with self._lock:
+            self._frames = []
+            self._requests = 0
+            self._stats = self._new_stats()
+            self._previous_hash = None
+
+    def should_capture(self) -> bool:
+        """Called for every attach_screenshot(); False means skip the driver round trip"""
+        with self._lock:
+            self._requests += 1
+            if self.policy == "every-n":
+                return (self._requests - 1) % self.every_n == 0
+            return True
+
+    def submit(self, png: bytes, name: str, priority: bool = False):
+        """
+        Encode a captured PNG on the executor, then attach it now (always / every-n,
+        inside the current Allure step) or keep it until the outcome is known (on-failure).
+        Call from the test thread - Allure's step context is thread-local.
+        """
+        with self._lock:
+            index = self._stats['captured']
+            self._stats['captured'] += 1
+            self._stats['raw_bytes'] += len(png)
+            frame = {'index': index, 'name': name, 'priority': priority,
+                     'future': self._executor.submit(self._encode, png)}
+            if self.policy == "on-failure":
+                self._frames.append(frame)
+                return
+
+        self._attach_when_encoded(frame)
+
+    def _attach_when_encoded(self, frame: Dict):
+        """Wait for a frame's encoding and attach it (test thread)"""
+        try:
+            result = frame['future'].result(timeout=30)
+        except Exception:
+            with self._lock:
+                self._stats['encode_errors'] += 1
+            return
+        self._attach(frame, result)
+
+    def _encode(self, png: bytes) -> Dict:
+        if Image is None:
+            return {'body': png, 'mime': 'image/png', 'extension': 'png', 'hash': None}
+
+        image = Image.open(io.BytesIO(png))
+        frame_hash = self._dhash(image)
+
+        if self.image_format == "png" and self.scale >= 1:
+            return {'body': png, 'mime': 'image/png', 'extension': 'png', 'hash': frame_hash}
+
+        if self.scale < 1:
+            size = (max(1, int(image.width * self.scale)), max(1, int(image.height * self.scale)))
+            image = image.resize(size, Image.LANCZOS)
+
+        output = io.BytesIO()
+        if self.image_format == "jpeg":
+            image.convert("RGB").save(output, format="JPEG", quality=self.quality, optimize=True)
+            return {'body': output.getvalue(), 'mime': 'image/jpeg', 'extension': 'jpg', 'hash': frame_hash}
+        if self.image_format == "webp":
+            image.save(output, format="WEBP", quality=self.quality)
+            return {'body': output.getvalue(), 'mime': 'image/webp', 'extension': 'webp', 'hash': frame_hash}
+        image.save(output, format="PNG", optimize=True)
+        return {'body': output.getvalue(), 'mime': 'image/png', 'extension': 'png', 'hash': frame_hash}
+
+    @staticmethod
+    def _dhash(image, size: int = 8) -> int:
+        """Difference hash: 64 bits of left/right brightness gradients"""
+        pixels = list(image.convert("L").resize((size + 1, size), Image.LANCZOS).getdata())
+        bits = 0
+        for row in range(size):
+            for col in range(size):
+                left = pixels[row * (size + 1) + col]
+                right = pixels[row * (size + 1) + col + 1]
+                bits = (bits << 1) | (left > right)
+        return bits
+
+    def _attach(self, frame: Dict, result: Dict):
+        """Attach one encoded frame unless it repeats the previous one or exceeds the budget"""
+        size = len(result['body'])
+        with self._lock:
+            stats = self._stats
+            # The failure screenshot is always attached
+            if not frame['priority']:
+                if self._is_duplicate(self._previous_hash, result['hash']):
+                    stats['duplicates'] += 1
+                    return
+                if self.budget_bytes and stats['attached_bytes'] + size > self.budget_bytes:
+                    stats['over_budget'] += 1
+                    stats['dropped'].append(frame['name'])
+                    return
+            self._previous_hash = result['hash']
+            stats['attached'] += 1
+            stats['attached_bytes'] += size
+
+        allure.attach(
+            result['body'],
+            name=f"{frame['index'] + 1:02d} · {frame['name']}",
+            attachment_type=result['mime'],
+            extension=result['extension']
+        )
+
+    def flush(self, failed: bool) -> Optional[Dict]:
+        """
+        Finish the test: attach buffered on-failure frames if it failed (call from the test thread).
+
+        Args:
+            failed: Whether setup or the test body failed - decides the on-failure policy
+
+        Returns:
+            dict: Counts and byte totals, or None when nothing was captured
+        """
+        with self._lock:
+            frames = list(self._frames)
+            self._frames = []
+            stats = self._stats
+            stats['requested'] = self._requests
+            self._requests = 0
+
+        if not stats['captured'] and not stats['requested']:
+            return None
+
+        if frames and not failed:
+            for frame in frames:
+                frame['future'].cancel()
+        elif frames:
+            for frame in frames:
+                self._attach_when_encoded(frame)
+
+        with self._lock:
+            dropped = list(stats['dropped'])
+        if dropped:
+            allure.attach(
+                "Screenshots over the per-test budget:\n" + "\n".join(dropped),
+                name="📸 Screenshots Dropped",
+                attachment_type=allure.attachment_type.TEXT
+            )
+        return stats
+
+    def _is_duplicate(self, previous_hash, frame_hash) -> bool:
+        if previous_hash is None or frame_hash is None:
+            return False
+        return bin(previous_hash ^ frame_hash).count("1") <= self.dedupe_distance
+
+    @staticmethod
+    def format_stats(stats: Dict) -> str:
+        return (
+            f"Requested: {stats['requested']}, captured: {stats['captured']}, attached: {stats['attached']}\n"
+            f"Duplicates skipped: {stats['duplicates']}, over budget: {stats['over_budget']}, "
+            f"encode errors: {stats['encode_errors']}\n"
+            f"Bytes: {stats['raw_bytes'] / 1024:.0f}KB captured -> {stats['attached_bytes'] / 1024:.0f}KB attached"
+        )
+
+
+# Process-wide service (one per xdist worker)
+screenshot_service = ScreenshotService()
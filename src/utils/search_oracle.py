@@ -0,0 +1,107 @@
+"""
+Search Oracle - expected menu search results computed from the catalog
+
+A trigram index over catalog item names and descriptions (3-character slice ->
+item ids). expected(keyword) intersects the postings of the keyword's trigrams,
+then applies the same case-insensitive substring rule the search tests check
+against the UI; keywords shorter than a trigram are matched against every item.
+No browser round trips; built once per catalog.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+
+NGRAM = 3
+
+
+def _normalise(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class SearchOracle:
+    """Trigram index over the searchable text of menu items"""
+
+    def __init__(self, items: Iterable[Dict]):
+        """
+        Args:
+            items: Catalog items (ID, Name, Description)
+        """
+        self.texts: Dict[str, str] = {}
+        self.names: Dict[str, str] = {}
+        self.index: Dict[str, Set[str]] = defaultdict(set)
+
+        for item in items:
+            item_id = str(item.get('ID', ''))
+            if not item_id or not item.get('Name'):
+                continue
+            text = _normalise(f"{item.get('Name', '')} {item.get('Description') or ''}")
+            self.texts[item_id] = text
+            self.names[item_id] = item['Name'].strip()
+            for ngram in _ngrams(text):
+                self.index[ngram].add(item_id)
+
+    @classmethod
+    def from_catalog(cls, menu_data: Optional[Dict]) -> Optional["SearchOracle"]:
+        """Index the active items of a get_full_menu() response; None without catalog"""
+        if not menu_data:
+            return None
+        return cls(item for item in menu_data.get('Items', []) if item.get('Active', False))
+
+    def expected(self, keyword: str, within: Optional[Set[str]] = None) -> Set[str]:
+        """
+        Item ids whose name + description contain keyword.
+
+        Args:
+            keyword: Search text as typed
+            within: Restrict to these ids (e.g. items rendered on the page)
+        """
+        needle = _normalise(keyword)
+        if len(needle) < NGRAM:
+            candidates = set(self.texts)
+        else:
+            # Every trigram of a substring occurs in the text; the smallest postings go first
+            postings = sorted((self.index.get(ngram, set()) for ngram in _ngrams(needle)), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+
+        if within is not None:
+            candidates &= within
+        return {item_id for item_id in candidates if needle in self.texts[item_id]}
+
+    def compare(self, keyword: str, actual_ids: Iterable[str], within: Optional[Set[str]] = None) -> Dict:
+        """
+        Expected vs displayed results for keyword.
+
+        Returns:
+            dict: expected/actual counts and the names missing from or unexpected in the UI
+        """
+        expected = self.expected(keyword, within)
+        actual = {str(item_id) for item_id in actual_ids}
+        return {
+            'keyword': keyword,
+            'expected': len(expected),
+            'actual': len(actual),
+            'missing': sorted(self.names.get(item_id, item_id) for item_id in expected - actual),
+            'unexpected': sorted(self.names.get(item_id, item_id) for item_id in actual - expected),
+        }
+
+    @staticmethod
+    def format_comparisons(comparisons: List[Dict]) -> str:
+        lines = [f"{'Keyword':<20} {'Expected':<10} {'Shown':<8} Result", "-" * 70]
+        for comparison in comparisons:
+            ok = not comparison['missing'] and not comparison['unexpected']
+            lines.append(
+                f"{comparison['keyword'][:20]:<20} {comparison['expected']:<10} {comparison['actual']:<8} "
+                f"{'✅ exact' if ok else '❌ mismatch'}"
+            )
+            for name in comparison['missing']:
+                lines.append(f"    missing:    {name}")
+            for name in comparison['unexpected']:
+                lines.append(f"    unexpected: {name}")
+        return "\n".join(lines)
+
+    def __len__(self):
+        return len(self.texts)
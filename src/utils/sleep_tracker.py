@@ -0,0 +1,68 @@
+"""
+Sleep Tracker - accounts for fixed sleeps replaced by event-driven waits
+
+Every BasePage.wait_for_dom_stable() call that replaced a time.sleep() reports
+the sleep it replaced and how long it actually waited. The autouse fixture in
+conftest.py resets the tracker per test and attaches the per-site totals.
+"""
+import threading
+from typing import Dict
+
+
+class SleepTracker:
+    """Per-test totals of removed sleep time, grouped by call site"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sites: Dict[str, Dict] = {}
+
+    def reset(self):
+        with self._lock:
+            self.sites = {}
+
+    def record(self, site: str, replaced: float, waited: float):
+        """
+        Args:
+            site: Page method that waited, e.g. "CheckoutPage.get_total"
+            replaced: Seconds the old fixed sleep took
+            waited: Seconds the event-driven wait actually took
+        """
+        with self._lock:
+            entry = self.sites.setdefault(site, {'calls': 0, 'replaced': 0.0, 'waited': 0.0})
+            entry['calls'] += 1
+            entry['replaced'] += replaced
+            entry['waited'] += waited
+
+    def total_saved(self) -> float:
+        with self._lock:
+            return sum(entry['replaced'] - entry['waited'] for entry in self.sites.values())
+
+    def get_report(self) -> str:
+        """Per-site table of sleep time removed, empty when nothing was recorded"""
+        with self._lock:
+            sites = dict(self.sites)
+        if not sites:
+            return ""
+
+        lines = [
+            f"{'Call site':<45} {'Calls':<7} {'Slept':<10} {'Waited':<10} {'Saved':<10}",
+            "-" * 82,
+        ]
+        totals = {'calls': 0, 'replaced': 0.0, 'waited': 0.0}
+        for site, entry in sorted(sites.items(), key=lambda item: item[1]['waited'] - item[1]['replaced']):
+            lines.append(
+                f"{site:<45} {entry['calls']:<7} {entry['replaced']:<10.2f} "
+                f"{entry['waited']:<10.2f} {entry['replaced'] - entry['waited']:<10.2f}"
+            )
+            for key in totals:
+                totals[key] += entry[key]
+        lines.append("-" * 82)
+        lines.append(
+            f"{'TOTAL':<45} {totals['calls']:<7} {totals['replaced']:<10.2f} "
+            f"{totals['waited']:<10.2f} {totals['replaced'] - totals['waited']:<10.2f}"
+        )
+        return "\n".join(lines)
+
+
+# Process-wide tracker (one per xdist worker)
+sleep_tracker = SleepTracker()
@@ -0,0 +1,104 @@
+"""
+Teardown Pipeline - runs slow, driver-independent cleanup in the background
+
+Browser quit, profile deletion and close_table() don't need the test thread, so
+they are submitted here and the next test on the worker can start right away.
+Every job is tagged with the nodeid of the test that scheduled it so failures
+can be reported against that test, and with an optional key (e.g. "table:54")
+so the next setup of the same resource can wait for its cleanup to finish.
+"""
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List
+
+
+class TeardownPipeline:
+    """Background executor for test cleanup jobs"""
+
+    def __init__(self, max_workers: int = 4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="teardown")
+        self._lock = threading.Lock()
+        self._jobs: List[Dict] = []
+        self._failures: List[Dict] = []
+        self.worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+    def submit(self, nodeid: str, name: str, func: Callable, *args, key: str = None):
+        """
+        Schedule a cleanup job.
+
+        Args:
+            nodeid: Test that owns the job (failures are reported against it)
+            name: Human readable job name for logs and reports
+            func: Callable to run; raising marks the job as failed
+            key: Optional resource key other fixtures can wait on
+        """
+        future = self._executor.submit(self._run, nodeid, name, func, *args)
+        with self._lock:
+            self._jobs = [job for job in self._jobs if not job['future'].done()]
+            self._jobs.append({'nodeid': nodeid, 'name': name, 'key': key, 'future': future})
+        return future
+
+    def _run(self, nodeid, name, func, *args):
+        start = time.time()
+        try:
+            func(*args)
+            print(f"✓ [teardown] {name} finished in {time.time() - start:.1f}s ({nodeid})")
+        except Exception as e:
+            print(f"✗ [teardown] {name} failed for {nodeid}: {str(e)}")
+            with self._lock:
+                self._failures.append({
+                    'nodeid': nodeid,
+                    'job': name,
+                    'error': str(e),
+                    'traceback': traceback.format_exc()
+                })
+
+    def wait_for(self, key: str, timeout: float = 120):
+        """Block until all jobs scheduled for a resource key have finished"""
+        with self._lock:
+            futures = [job['future'] for job in self._jobs if job['key'] == key]
+        if futures:
+            start = time.time()
+            wait(futures, timeout=timeout)
+            print(f"Waited {time.time() - start:.1f}s for pending cleanup of {key}")
+
+    def pop_failures(self, nodeid: str) -> List[Dict]:
+        """Take the failures already known for a test so they are reported once"""
+        with self._lock:
+            mine = [f for f in self._failures if f['nodeid'] == nodeid]
+            self._failures = [f for f in self._failures if f['nodeid'] != nodeid]
+        return mine
+
+    def pop_failures_except(self, nodeid: str) -> List[Dict]:
+        """Take the failures of every other test (jobs that finished after their test was reported)"""
+        with self._lock:
+            others = [f for f in self._failures if f['nodeid'] != nodeid]
+            self._failures = [f for f in self._failures if f['nodeid'] == nodeid]
+        return others
+
+    def shutdown(self, timeout: float = 300) -> List[Dict]:
+        """
+        Wait for all outstanding jobs and stop the executor.
+
+        Returns:
+            list: Failures that were not yet reported against their test
+        """
+        with self._lock:
+            futures = [job['future'] for job in self._jobs]
+        wait(futures, timeout=timeout)
+        self._executor.shutdown(wait=False)
+
+        with self._lock:
+            failures = list(self._failures)
+            self._failures.clear()
+        return failures
+
+    @staticmethod
+    def format_failures(failures: List[Dict]) -> str:
+        lines = []
+        for failure in failures:
+            lines.append(f"{failure['nodeid']}: {failure['job']} failed - {failure['error']}")
+        return "\n".join(lines)
@@ -2,6 +2,7 @@ import pytest
 import pytest_check as check
 import allure
 from src.pages.store.menu_page import MenuPage
+from src.utils.search_oracle import SearchOracle
 from src.data.endpoints.close_table import close_table
 from datetime import datetime
 
@@ -85,6 +86,19 @@ def test_search_functionality(browser_factory, endpoint_setup, table):
                 attachment_type=allure.attachment_type.TEXT
             )
 
+            # Catalog comparison is advisory: the UI may search fields the oracle doesn't model,
+            # so differences are attached for review instead of failing the test
+            mismatches = [
+                comparison for comparison in menu_page.search_checks.values()
+                if comparison['missing'] or comparison['unexpected']
+            ]
+            if mismatches:
+                allure.attach(
+                    SearchOracle.format_comparisons(mismatches),
+                    name="⚠️ Search Results Differ From Catalog",
+                    attachment_type=allure.attachment_type.TEXT
+                )
+
         # ========================================
         # PART 2: Random Item Exact Name Search Test
         # ========================================
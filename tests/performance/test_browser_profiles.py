@@ -0,0 +1,102 @@
+"""
+Browser Profile Benchmark - compare launch cost and menu render time per execution profile
+"""
+import os
+import shutil
+import time
+import pytest
+import allure
+from src.pages.store.menu_page import MenuPage
+from src.locators.store_locators import MenuPageLocators
+from src.utils.browser_launcher import launch_browser, BROWSER_PROFILES
+from src.utils.navigation import Navigation
+from src.utils.performance_metrics import PerformanceTimer
+from tests.performance.conftest import PERFORMANCE_TABLE
+
+
+ITERATIONS_PER_PROFILE = 3
+
+
+@pytest.mark.performance
+@pytest.mark.browser_profile_benchmark
+@allure.feature("Performance Testing")
+@allure.story("Browser Execution Profiles")
+class TestBrowserProfiles:
+    """Launch, first menu render and wall time for headed / headless-new / minimal"""
+
+    @allure.title("Browser Profile Benchmark - Launch, First Render, Wall Time")
+    def test_browser_profile_benchmark(self, endpoint_setup, performance_collector, performance_reporter):
+        results = {}
+
+        for profile in BROWSER_PROFILES:
+            launch_metrics = performance_collector.get_or_create(f"{profile}: launch")
+            render_metrics = performance_collector.get_or_create(f"{profile}: first menu render")
+            wall_metrics = performance_collector.get_or_create(f"{profile}: wall time")
+            valid_runs = 0
+
+            with allure.step(f"Profile '{profile}' - {ITERATIONS_PER_PROFILE} runs"):
+                for iteration in range(ITERATIONS_PER_PROFILE):
+                    metadata = {'profile': profile, 'iteration': iteration + 1}
+                    wall_start = time.time()
+                    driver = None
+                    temp_dir = None
+
+                    try:
+                        with PerformanceTimer(launch_metrics, metadata):
+                            driver, temp_dir = launch_browser("chrome", profile=profile)
+
+                        with PerformanceTimer(render_metrics, metadata):
+                            Navigation.navigate(driver, endpoint_setup.session_id, PERFORMANCE_TABLE)
+                            menu_page = MenuPage(driver)
+                            menu_page.navigate_to_main_menu()
+                            rendered = len(driver.find_elements(*MenuPageLocators.MENU_ITEMS))
+
+                        if rendered > 0:
+                            valid_runs += 1
+                        else:
+                            menu_page.attach_screenshot(f"{profile}: menu did not render")
+
+                    finally:
+                        if driver:
+                            driver.quit()
+                        if temp_dir and os.path.exists(temp_dir):
+                            shutil.rmtree(temp_dir, ignore_errors=True)
+                        wall_metrics.add_timing(time.time() - wall_start, metadata)
+
+            results[profile] = {
+                'valid': valid_runs == ITERATIONS_PER_PROFILE,
+                'valid_runs': valid_runs,
+                'launch': launch_metrics.get_statistics().get('mean', 0),
+                'render': render_metrics.get_statistics().get('mean', 0),
+                'wall': wall_metrics.get_statistics().get('mean', 0),
+            }
+
+        with allure.step("Profile Comparison"):
+            lines = [
+                "=" * 80,
+                f"{'Profile':<16} {'Valid':<8} {'Launch':<12} {'First render':<14} {'Wall time':<12}",
+                "=" * 80,
+            ]
+            for profile, result in results.items():
+                lines.append(
+                    f"{profile:<16} "
+                    f"{result['valid_runs']}/{ITERATIONS_PER_PROFILE:<6} "
+                    f"{result['launch'] * 1000:<12.0f} "
+                    f"{result['render'] * 1000:<14.0f} "
+                    f"{result['wall'] * 1000:<12.0f}"
+                )
+            lines.append("=" * 80)
+
+            valid_profiles = [profile for profile, result in results.items() if result['valid']]
+            if valid_profiles:
+                cheapest = min(valid_profiles, key=lambda name: results[name]['wall'])
+                lines.append(f"Cheapest valid profile: {cheapest} (use --browser-profile={cheapest})")
+            else:
+                lines.append("No profile rendered the menu on every run")
+
+            comparison = "\n".join(lines)
+            print(f"\n{comparison}")
+            performance_reporter.attach_summary_table(comparison, "Browser Profile Comparison (ms)")
+            performance_reporter.attach_statistics(results, "Browser Profile Results")
+
+        assert valid_profiles, "Menu did not render under any browser profile"
@@ -0,0 +1,146 @@
+"""
+Extract Benchmark - WebDriver round trips of per-element reads vs BasePage.extract()
+"""
+import time
+import pytest
+import allure
+from src.pages.store.menu_page import MenuPage
+from src.locators.store_locators import MenuPageLocators
+
+
+ITERATIONS = 5
+
+
+class CommandCounter:
+    """Counts WebDriver commands sent while the context is active"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.commands = 0
+        self._original = None
+
+    def __enter__(self):
+        self._original = self.driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.commands += 1
+            return self._original(driver_command, params)
+
+        self.driver.execute = counting_execute
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.driver.execute = self._original
+        return False
+
+
+def legacy_category_buttons(driver):
+    categories = []
+    for button in driver.find_elements(*MenuPageLocators.CATEGORY_PILLS):
+        category_id = button.get_attribute('id')
+        category_name = button.find_element(*MenuPageLocators.CATEGORY_LABEL).text.strip()
+        if category_id and category_name:
+            categories.append({'id': category_id, 'name': category_name})
+    return categories
+
+
+def legacy_item_info(driver):
+    items = []
+    for item in driver.find_elements(*MenuPageLocators.MENU_ITEMS):
+        item_id = item.get_attribute("id")
+        item_name = item.find_element(*MenuPageLocators.MENU_ITEM_TITLE).text.strip()
+        items.append({'id': item_id, 'name': item_name})
+    return items
+
+
+def legacy_active_ids(driver):
+    return [
+        cat.get_attribute('id')
+        for cat in driver.find_elements(*MenuPageLocators.ACTIVE_CATEGORY_SLIDER)
+        if cat.get_attribute('id')
+    ]
+
+
+@pytest.mark.performance
+@allure.feature("Performance Testing")
+@allure.story("Batched Element Extraction")
+class TestExtractBenchmark:
+    """Per-element get_attribute/find_element/.text loops against one extract() call"""
+
+    @allure.title("Extract Benchmark - Round Trips and Time per Read")
+    def test_extract_round_trips(self, browser_factory, performance_collector, performance_reporter):
+        [chrome] = browser_factory("chrome")
+        menu_page = MenuPage(chrome)
+        menu_page.navigate_to_main_menu()
+
+        scenarios = {
+            'category buttons': (
+                legacy_category_buttons,
+                lambda: menu_page.extract(MenuPageLocators.CATEGORY_PILLS, {
+                    'id': '@id', 'name': (MenuPageLocators.CATEGORY_LABEL, 'text')
+                })
+            ),
+            'menu item info': (
+                legacy_item_info,
+                lambda: menu_page.extract(MenuPageLocators.MENU_ITEMS, {
+                    'id': '@id', 'name': (MenuPageLocators.MENU_ITEM_TITLE, 'text')
+                })
+            ),
+            'active category ids': (
+                legacy_active_ids,
+                lambda: menu_page.extract(MenuPageLocators.ACTIVE_CATEGORY_SLIDER, {'id': '@id'})
+            ),
+        }
+
+        results = {}
+        for scenario, (legacy, batched) in scenarios.items():
+            legacy_metrics = performance_collector.get_or_create(f"{scenario}: per-element")
+            batched_metrics = performance_collector.get_or_create(f"{scenario}: extract()")
+
+            with allure.step(f"{scenario} - {ITERATIONS} runs each"):
+                for iteration in range(ITERATIONS):
+                    with CommandCounter(chrome) as legacy_counter:
+                        start = time.time()
+                        legacy_rows = legacy(chrome)
+                        legacy_metrics.add_timing(time.time() - start, {'commands': legacy_counter.commands})
+
+                    with CommandCounter(chrome) as batched_counter:
+                        start = time.time()
+                        batched_rows = batched()
+                        batched_metrics.add_timing(time.time() - start, {'commands': batched_counter.commands})
+
+                assert len(batched_rows) == len(legacy_rows), \
+                    f"{scenario}: extract() returned {len(batched_rows)} rows, per-element loop {len(legacy_rows)}"
+
+            results[scenario] = {
+                'rows': len(legacy_rows),
+                'legacy_commands': legacy_counter.commands,
+                'batched_commands': batched_counter.commands,
+                'legacy_ms': legacy_metrics.get_statistics().get('mean', 0) * 1000,
+                'batched_ms': batched_metrics.get_statistics().get('mean', 0) * 1000,
+            }
+
+        with allure.step("Round Trip Comparison"):
+            lines = [
+                "=" * 90,
+                f"{'Scenario':<22} {'Rows':<6} {'Cmds before':<13} {'Cmds after':<12} "
+                f"{'ms before':<11} {'ms after':<10} {'Speedup':<8}",
+                "=" * 90,
+            ]
+            for scenario, result in results.items():
+                speedup = result['legacy_ms'] / result['batched_ms'] if result['batched_ms'] else 0
+                lines.append(
+                    f"{scenario:<22} {result['rows']:<6} {result['legacy_commands']:<13} "
+                    f"{result['batched_commands']:<12} {result['legacy_ms']:<11.0f} "
+                    f"{result['batched_ms']:<10.0f} {speedup:<8.1f}x"
+                )
+            lines.append("=" * 90)
+
+            comparison = "\n".join(lines)
+            print(f"\n{comparison}")
+            performance_reporter.attach_summary_table(comparison, "Extract Round Trips")
+            performance_reporter.attach_statistics(results, "Extract Benchmark Results")
+
+        for scenario, result in results.items():
+            assert result['batched_commands'] <= result['legacy_commands'], \
+                f"{scenario}: extract() used more WebDriver commands than the per-element loop"
@@ -0,0 +1,35 @@
+import pytest
+from decimal import Decimal
+from src.utils.currency import parse_decimal, parse_currency
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text, expected", [
+    ("$5.00", Decimal("5.00")),
+    ("$1,234.56", Decimal("1234.56")),
+    ("12.5", Decimal("12.5")),
+    ("$7", Decimal("7")),
+    ("$5.00 (2 items)", Decimal("5.00")),
+    ("v1.2 $3.00", Decimal("3.00")),
+    ("Total: $10.99", Decimal("10.99")),
+    ("-$5.00", Decimal("-5.00")),
+    ("Discount: -$5.00", Decimal("-5.00")),
+    ("$-5.00", Decimal("-5.00")),
+    ("($5.00)", Decimal("-5.00")),
+    ("(2 items)", Decimal("2")),
+])
+def test_parse_decimal(text, expected):
+    assert parse_decimal(text) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text", ["", "Free", "$", "-"])
+def test_parse_decimal_without_amount(text):
+    with pytest.raises(ValueError):
+        parse_decimal(text)
+
+
+@pytest.mark.unit
+def test_parse_currency_returns_float():
+    assert parse_currency("Discount: -$5.25") == -5.25
+    assert isinstance(parse_currency("$1.00"), float)
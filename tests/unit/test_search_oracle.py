@@ -0,0 +1,37 @@
+import pytest
+from src.utils.search_oracle import SearchOracle
+
+
+ITEMS = [
+    {'ID': 1, 'Name': 'Chicken Burger', 'Description': 'Grilled chicken,  lettuce'},
+    {'ID': 2, 'Name': 'Veggie Burger', 'Description': None},
+    {'ID': 3, 'Name': 'Caesar Salad', 'Description': 'Romaine, grilled CHICKEN'},
+    {'ID': 4, 'Name': '', 'Description': 'No name - not searchable'},
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("keyword, expected", [
+    ("burger", {'1', '2'}),
+    ("CHICKEN", {'1', '3'}),
+    ("grilled chicken", {'1', '3'}),
+    ("chicken burger", {'1'}),
+    ("urge", {'1', '2'}),
+    ("ch", {'1', '3'}),
+    ("pizza", set()),
+    ("", {'1', '2', '3'}),
+])
+def test_expected_matches_substring_rule(keyword, expected):
+    assert SearchOracle(ITEMS).expected(keyword) == expected
+
+
+@pytest.mark.unit
+def test_expected_within_restricts_candidates():
+    assert SearchOracle(ITEMS).expected("burger", within={'2', '3'}) == {'2'}
+
+
+@pytest.mark.unit
+def test_compare_reports_missing_and_unexpected_names():
+    comparison = SearchOracle(ITEMS).compare("burger", ['1', '3'])
+    assert comparison['missing'] == ['Veggie Burger']
+    assert comparison['unexpected'] == ['Caesar Salad']